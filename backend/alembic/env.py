@@ -4,7 +4,7 @@ import sys
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
-from sqlalchemy import pool
+from sqlalchemy import inspect, pool, text
 
 from alembic import context
 
@@ -29,6 +29,50 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Migrations 001-017 were squashed into a single baseline revision.
+# Databases that ran the full historical chain are re-stamped to the
+# baseline; anything older must finish the old chain first.
+BASELINE_REVISION = "baseline_2026"
+LEGACY_HEAD_REVISION = "017_add_import_history_checksum"
+LEGACY_REVISIONS = {
+    "001_initial_schema",
+    "002_phase2_downloads",
+    "003_phase3_updates",
+    "004_phase5",
+    "005",
+    "006_remove_admin_user",
+    "007_download_columns",
+    "008_pending_review",
+    "009_pending_review_source_url",
+    "010_add_is_admin_user",
+    "011_user_artists",
+    "012_album_unique_constraint",
+    "013_track_unique_constraint",
+    "014_add_track_metadata",
+    "015_add_artist_metadata",
+    "016_add_album_metadata",
+}
+
+
+def stamp_legacy_baseline(connection) -> None:
+    """Point a database migrated by the pre-squash chain at the baseline."""
+    with connection.begin():
+        if not inspect(connection).has_table("alembic_version"):
+            return
+
+        current = connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+        if current == LEGACY_HEAD_REVISION:
+            connection.execute(
+                text("UPDATE alembic_version SET version_num = :rev"),
+                {"rev": BASELINE_REVISION},
+            )
+        elif current in LEGACY_REVISIONS:
+            raise RuntimeError(
+                f"Database is at legacy revision {current}. Upgrade to "
+                f"{LEGACY_HEAD_REVISION} with a release that still ships the "
+                f"historical migrations before running the squashed baseline."
+            )
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
@@ -53,9 +97,15 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        stamp_legacy_baseline(connection)
+
+        # One transaction for the whole upgrade run (Postgres has
+        # transactional DDL): a fresh bootstrap commits once instead of
+        # once per revision.
         context.configure(
             connection=connection,
-            target_metadata=target_metadata
+            target_metadata=target_metadata,
+            transaction_per_migration=False,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,95 @@
+"""Store BLAKE3 checksums as raw 32-byte digests
+
+Revision ID: 018_binary_checksums
+Revises: baseline_2026
+Create Date: 2026-10-17
+
+tracks.checksum and import_history.checksum held 64-character hex strings.
+Raw bytes halve the column and its index. Databases created by the
+baseline already have binary columns and are left untouched.
+
+Indexes on checksum are dropped before the rewrite and built once
+afterwards, rather than maintained for every converted row.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils import reflection
+
+revision: str = '018_binary_checksums'
+down_revision: Union[str, None] = 'baseline_2026'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('tracks', 'import_history')
+_CHECKSUM_INDEXES = {'import_history': 'ix_import_history_checksum'}
+
+
+def _is_text_column(table: str) -> bool:
+    if op.get_context().as_sql:
+        return True
+    return isinstance(reflection.column_type(op.get_bind(), table, 'checksum'), sa.String)
+
+
+def _has_index(table: str, name: str) -> bool:
+    if op.get_context().as_sql:
+        return True
+    return name in reflection.index_names(op.get_bind(), table)
+
+
+def _convert(table: str, convert_column) -> None:
+    """Run ``convert_column`` with the table's checksum index out of the way."""
+    index = _CHECKSUM_INDEXES.get(table)
+    rebuild = index is not None and _has_index(table, index)
+    if rebuild:
+        op.drop_index(index, table_name=table)
+    convert_column()
+    if rebuild:
+        op.create_index(index, table, ['checksum'])
+    reflection.invalidate(op.get_bind())
+
+
+def _convert_rows(table: str, convert) -> None:
+    """Rewrite checksum values row by row (dialects without ALTER ... USING)."""
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(f"SELECT id, checksum FROM {table} WHERE checksum IS NOT NULL")
+    ).fetchall()
+    for row_id, checksum in rows:
+        bind.execute(
+            sa.text(f"UPDATE {table} SET checksum = :checksum WHERE id = :id"),
+            {"checksum": convert(checksum), "id": row_id},
+        )
+
+
+def upgrade() -> None:
+    postgres = op.get_context().dialect.name == 'postgresql'
+    for table in _TABLES:
+        if not _is_text_column(table):
+            continue
+        if postgres:
+            _convert(table, lambda: op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN checksum TYPE BYTEA "
+                f"USING decode(checksum, 'hex')"
+            ))
+        else:
+            # SQLite stores the bytes as a BLOB regardless of declared type
+            _convert(table, lambda: _convert_rows(
+                table, lambda value: bytes.fromhex(value) if isinstance(value, str) else value
+            ))
+
+
+def downgrade() -> None:
+    postgres = op.get_context().dialect.name == 'postgresql'
+    for table in _TABLES:
+        if postgres:
+            _convert(table, lambda: op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN checksum TYPE VARCHAR(64) "
+                f"USING encode(checksum, 'hex')"
+            ))
+        else:
+            _convert(table, lambda: _convert_rows(
+                table, lambda value: value.hex() if isinstance(value, bytes) else value
+            ))
@@ -0,0 +1,111 @@
+"""Native ENUM status columns and CHAR(2) artist country
+
+Revision ID: 019_enum_status_columns
+Revises: 018_binary_checksums
+Create Date: 2026-10-17
+
+downloads.status and exports.status have closed value sets (DownloadStatus,
+ExportStatus) and become Postgres ENUMs; artists.country becomes CHAR(2).
+Only VARCHAR columns are converted, so databases created by the baseline
+(or by db/init, which already uses ENUMs) are left untouched. Other
+dialects have no native ENUM and are skipped.
+
+Indexes on status are dropped before the type change and rebuilt after it.
+That replaces the per-index rebuild ALTER TYPE would do, and it re-plans
+ix_downloads_active's predicate against the enum type. Without it the
+predicate keeps its old text casts and queries no longer match it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils import reflection
+
+revision: str = '019_enum_status_columns'
+down_revision: Union[str, None] = '018_binary_checksums'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_DOWNLOAD_STATUS = sa.Enum(
+    'pending', 'downloading', 'importing', 'complete', 'duplicate',
+    'failed', 'cancelled', 'pending_review',
+    name='download_status',
+)
+_EXPORT_STATUS = sa.Enum(
+    'pending', 'running', 'complete', 'failed', 'cancelled',
+    name='export_status',
+)
+_ENUM_COLUMNS = (
+    ('downloads', _DOWNLOAD_STATUS),
+    ('exports', _EXPORT_STATUS),
+)
+_QUEUE_PREDICATE = "status IN ('pending', 'downloading', 'importing', 'pending_review', 'failed')"
+# (name, columns, extra kwargs) of every index that reads the status column
+_STATUS_INDEXES = {
+    'downloads': (
+        ('ix_downloads_user_status', ['user_id', 'status'], {}),
+        ('ix_downloads_active', ['user_id', 'created_at'],
+         {'postgresql_where': sa.text(_QUEUE_PREDICATE)}),
+    ),
+    'exports': (
+        ('ix_exports_status', ['status'], {}),
+    ),
+}
+
+
+def _is_varchar(table: str, column: str) -> bool:
+    if op.get_context().as_sql:
+        return True
+    return type(reflection.column_type(op.get_bind(), table, column)) is sa.VARCHAR
+
+
+def _existing_indexes(table: str) -> set:
+    if op.get_context().as_sql:
+        return {name for name, _, _ in _STATUS_INDEXES[table]}
+    return reflection.index_names(op.get_bind(), table)
+
+
+def _alter_status(table: str, statement: str) -> None:
+    """Change the status column type with its indexes dropped, then rebuild them."""
+    existing = _existing_indexes(table)
+    indexes = [index for index in _STATUS_INDEXES[table] if index[0] in existing]
+    for name, _, _ in indexes:
+        op.drop_index(name, table_name=table)
+    op.execute(statement)
+    for name, columns, kwargs in indexes:
+        op.create_index(name, table, columns, **kwargs)
+    reflection.invalidate(op.get_bind())
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for table, enum in _ENUM_COLUMNS:
+        if not _is_varchar(table, 'status'):
+            continue
+        enum.create(op.get_bind(), checkfirst=True)
+        _alter_status(
+            table,
+            f"ALTER TABLE {table} ALTER COLUMN status TYPE {enum.name} "
+            f"USING status::{enum.name}",
+        )
+
+    if _is_varchar('artists', 'country'):
+        op.alter_column('artists', 'country', type_=sa.CHAR(2), existing_type=sa.String(2))
+        reflection.invalidate(op.get_bind())
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.alter_column('artists', 'country', type_=sa.String(2), existing_type=sa.CHAR(2))
+    for table, enum in _ENUM_COLUMNS:
+        _alter_status(
+            table,
+            f"ALTER TABLE {table} ALTER COLUMN status TYPE VARCHAR(20) "
+            f"USING status::text",
+        )
+        enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,67 @@
+"""BIGINT ids for high-churn tables
+
+Revision ID: 020_bigint_ids
+Revises: 019_enum_status_columns
+Create Date: 2026-10-17
+
+tracks, downloads, import_history and activity_log ids (and the columns
+that reference them) move from INT4 to INT8 while the tables are still
+small, so they never hit the 2^31 ceiling. Only INTEGER columns are
+converted; databases created by the baseline already use BIGINT. SQLite
+has a single integer type and is skipped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils import reflection
+
+revision: str = '020_bigint_ids'
+down_revision: Union[str, None] = '019_enum_status_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose serial id (and its sequence) becomes BIGINT
+_ID_TABLES = ('tracks', 'downloads', 'import_history', 'activity_log')
+# Columns holding one of those ids
+_REFERENCING_COLUMNS = (
+    ('user_tracks', 'track_id'),
+    ('import_history', 'track_id'),
+    ('activity_log', 'entity_id'),
+)
+
+
+def _is_integer(table: str, column: str) -> bool:
+    if op.get_context().as_sql:
+        return True
+    return type(reflection.column_type(op.get_bind(), table, column)) is sa.INTEGER
+
+
+def _columns():
+    for table in _ID_TABLES:
+        yield table, 'id'
+    yield from _REFERENCING_COLUMNS
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    # Check every column before altering any; cached reflection goes stale
+    pending = [(table, column) for table, column in _columns() if _is_integer(table, column)]
+    for table, column in pending:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BIGINT")
+    reflection.invalidate(op.get_bind())
+    for table in _ID_TABLES:
+        op.execute(f"ALTER SEQUENCE IF EXISTS {table}_id_seq AS BIGINT")
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for table in _ID_TABLES:
+        op.execute(f"ALTER SEQUENCE IF EXISTS {table}_id_seq AS INTEGER")
+    for table, column in _columns():
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE INTEGER")
@@ -0,0 +1,48 @@
+"""Trigram indexes for library substring search
+
+Revision ID: 021_trigram_search_indexes
+Revises: 020_bigint_ids
+Create Date: 2026-10-17
+
+LibraryService.search filters artists.name, albums.title and tracks.title
+with ILIKE '%term%', which a b-tree cannot serve. pg_trgm GIN indexes let
+Postgres answer those without a sequential scan. Databases bootstrapped
+from db/init already carry equivalent idx_*_trgm indexes and are skipped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils import reflection
+
+revision: str = '021_trigram_search_indexes'
+down_revision: Union[str, None] = '020_bigint_ids'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, column, db/init equivalent)
+_INDEXES = (
+    ('ix_artists_name_trgm', 'artists', 'name', 'idx_artists_name_trgm'),
+    ('ix_albums_title_trgm', 'albums', 'title', 'idx_albums_title_trgm'),
+    ('ix_tracks_title_trgm', 'tracks', 'title', 'idx_tracks_title_trgm'),
+)
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column, legacy_name in _INDEXES:
+        reflection.create_index_once(
+            name, table, [column], legacy=legacy_name,
+            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for name, table, _, _ in _INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
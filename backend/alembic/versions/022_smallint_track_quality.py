@@ -0,0 +1,47 @@
+"""SMALLINT for tracks.bit_depth and tracks.channels
+
+Revision ID: 022_smallint_track_quality
+Revises: 021_trigram_search_indexes
+Create Date: 2026-10-17
+
+Both columns hold single- or double-digit values; INT2 halves them on
+every track row. Only INTEGER columns are converted, so databases created
+by the baseline are left untouched. SQLite is skipped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils import reflection
+
+revision: str = '022_smallint_track_quality'
+down_revision: Union[str, None] = '021_trigram_search_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ('bit_depth', 'channels')
+
+
+def _is_integer(column: str) -> bool:
+    if op.get_context().as_sql:
+        return True
+    return type(reflection.column_type(op.get_bind(), 'tracks', column)) is sa.INTEGER
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for column in _COLUMNS:
+        if _is_integer(column):
+            op.alter_column('tracks', column, type_=sa.SmallInteger(), existing_type=sa.Integer())
+    reflection.invalidate(op.get_bind())
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for column in _COLUMNS:
+        op.alter_column('tracks', column, type_=sa.Integer(), existing_type=sa.SmallInteger())
@@ -0,0 +1,44 @@
+"""fillfactor 70 for update-heavy tables
+
+Revision ID: 023_update_heavy_fillfactor
+Revises: 022_smallint_track_quality
+Create Date: 2026-10-17
+
+downloads, exports, pending_review and backup_history rows are rewritten
+repeatedly after insert (progress, status, timestamps). Leaving 30% of each
+page free lets those updates stay HOT. The setting is catalog-only and
+applies to pages written from now on; existing pages pick it up as they are
+rewritten by VACUUM FULL / pg_repack. ix_downloads_user_status gets the
+same headroom for status transitions. Postgres only.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '023_update_heavy_fillfactor'
+down_revision: Union[str, None] = '022_smallint_track_quality'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('downloads', 'exports', 'pending_review', 'backup_history')
+_INDEXES = ('ix_downloads_user_status',)
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = 70)")
+    for index in _INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {index} SET (fillfactor = 70)")
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for index in _INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {index} RESET (fillfactor)")
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,50 @@
+"""Deferrable FKs for downloads.result_album_id / result_review_id
+
+Revision ID: 024_deferrable_download_result_fks
+Revises: 023_update_heavy_fillfactor
+Create Date: 2026-10-17
+
+Both links are checked at COMMIT instead of per statement, so a download
+and the album or review it produced can be written in either order within
+one transaction. Existing constraints are altered in place (no revalidation
+scan) whatever name they were created under. Postgres only: SQLite cannot
+alter constraints, and new SQLite tables get them from the baseline.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils import reflection
+
+revision: str = '024_deferrable_download_result_fks'
+down_revision: Union[str, None] = '023_update_heavy_fillfactor'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ('result_album_id', 'result_review_id')
+
+
+def _constraint_names() -> list:
+    """Names of the FKs on the result columns (default names when offline)."""
+    if op.get_context().as_sql:
+        return [f"downloads_{column}_fkey" for column in _COLUMNS]
+    inspector = reflection.inspector(op.get_bind())
+    return [
+        fk['name'] for fk in inspector.get_foreign_keys('downloads')
+        if len(fk['constrained_columns']) == 1 and fk['constrained_columns'][0] in _COLUMNS
+    ]
+
+
+def _alter(clause: str) -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    for name in _constraint_names():
+        op.execute(f"ALTER TABLE downloads ALTER CONSTRAINT {name} {clause}")
+
+
+def upgrade() -> None:
+    _alter("DEFERRABLE INITIALLY DEFERRED")
+
+
+def downgrade() -> None:
+    _alter("NOT DEFERRABLE")
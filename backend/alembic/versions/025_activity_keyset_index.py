@@ -0,0 +1,33 @@
+"""Composite (created_at, id) index for activity keyset pagination
+
+Revision ID: 025_activity_keyset_index
+Revises: 024_deferrable_download_result_fks
+Create Date: 2026-10-17
+
+/admin/activity pages by (created_at DESC, id DESC) after a cursor row.
+A b-tree on both columns, scanned backwards, serves each page as an index
+range instead of a sort over the whole log.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils import reflection
+from app.utils.partitions import is_partitioned
+
+revision: str = '025_activity_keyset_index'
+down_revision: Union[str, None] = '024_deferrable_download_result_fks'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEX = 'ix_activity_log_created_id'
+
+
+def upgrade() -> None:
+    # Partitioned parents cannot build CONCURRENTLY; each partition is small
+    partitioned = not op.get_context().as_sql and is_partitioned(op.get_bind(), 'activity_log')
+    reflection.create_index_once(_INDEX, 'activity_log', ['created_at', 'id'], concurrently=not partitioned)
+
+
+def downgrade() -> None:
+    op.drop_index(_INDEX, table_name='activity_log', if_exists=True)
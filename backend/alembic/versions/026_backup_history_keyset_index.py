@@ -0,0 +1,31 @@
+"""Composite (created_at, id) index for backup history listing
+
+Revision ID: 026_backup_history_keyset_index
+Revises: 025_activity_keyset_index
+Create Date: 2026-10-17
+
+/admin/backup/history reads the newest rows, ordered (created_at DESC,
+id DESC), optionally after a cursor row. The BRIN index on created_at
+cannot return rows in order, so every page sorted the whole table; a
+b-tree on both columns, scanned backwards, stops after LIMIT rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils import reflection
+
+revision: str = '026_backup_history_keyset_index'
+down_revision: Union[str, None] = '025_activity_keyset_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEX = 'ix_backup_history_created_id'
+
+
+def upgrade() -> None:
+    reflection.create_index_once(_INDEX, 'backup_history', ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index(_INDEX, table_name='backup_history', if_exists=True)
@@ -0,0 +1,49 @@
+"""Covering indexes for the admin library health aggregates
+
+Revision ID: 027_health_covering_indexes
+Revises: 026_backup_history_keyset_index
+Create Date: 2026-10-17
+
+/admin/health reads every track once for lossless/lossy counts and total
+size, and every album once grouped by source with an incomplete count.
+Each is a single aggregate pass, so per-filter partial indexes would not be
+used; instead these narrow covering indexes carry exactly the columns the
+two queries touch and let Postgres answer them with index-only scans
+instead of reading the wide track and album rows. Databases bootstrapped
+from db/init already carry equivalent idx_* indexes and are skipped.
+Postgres only (INCLUDE).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils import reflection
+
+revision: str = '027_health_covering_indexes'
+down_revision: Union[str, None] = '026_backup_history_keyset_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, key column, included column, db/init equivalent)
+_INDEXES = (
+    ('ix_tracks_health', 'tracks', 'is_lossy', 'file_size', 'idx_tracks_health'),
+    ('ix_albums_health', 'albums', 'source', 'status', 'idx_albums_health'),
+)
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for name, table, column, included, legacy_name in _INDEXES:
+        reflection.create_index_once(
+            name, table, [column], legacy=legacy_name, postgresql_include=[included],
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for name, table, _, _, _ in _INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,53 @@
+"""Deferred constraint trigger keeping at least one admin
+
+Revision ID: 028_last_admin_trigger
+Revises: 027_health_covering_indexes
+Create Date: 2026-10-17
+
+DELETE /admin/users already refuses to remove the last admin in its own
+WHERE clause, but under READ COMMITTED two admins deleting (or demoting)
+each other concurrently can both pass that check. trg_last_admin re-checks
+at COMMIT, after every row change in the transaction, and raises
+check_violation (23514) if an admin was removed and none is left. Postgres
+only; db/init carries the same trigger.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '028_last_admin_trigger'
+down_revision: Union[str, None] = '027_health_covering_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION enforce_last_admin()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF OLD.is_admin AND NOT EXISTS (SELECT 1 FROM users WHERE is_admin) THEN
+                RAISE EXCEPTION 'Cannot remove the last admin' USING ERRCODE = '23514';
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("DROP TRIGGER IF EXISTS trg_last_admin ON users")
+    op.execute("""
+        CREATE CONSTRAINT TRIGGER trg_last_admin
+            AFTER DELETE OR UPDATE OF is_admin ON users
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION enforce_last_admin()
+    """)
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS trg_last_admin ON users")
+    op.execute("DROP FUNCTION IF EXISTS enforce_last_admin()")
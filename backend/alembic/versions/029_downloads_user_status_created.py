@@ -0,0 +1,47 @@
+"""(user_id, status, created_at DESC) index for filtered download history
+
+Revision ID: 029_downloads_user_status_created
+Revises: 028_last_admin_trigger
+Create Date: 2026-10-17
+
+GET /downloads?status=... filters on (user_id, status) and returns the
+newest rows first. With created_at as the trailing key the page is an index
+range read in order instead of a sort over every matching row. The index
+replaces ix_downloads_user_status, which is now its prefix, and keeps its
+fillfactor headroom for status transitions. Databases bootstrapped from
+db/init already carry idx_downloads_user_status_created and only lose the
+old index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+from app.utils import reflection
+
+revision: str = '029_downloads_user_status_created'
+down_revision: Union[str, None] = '028_last_admin_trigger'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEX = 'ix_downloads_user_status_created'
+_REPLACED = 'ix_downloads_user_status'
+_LEGACY = 'idx_downloads_user_status_created'
+
+
+def upgrade() -> None:
+    reflection.create_index_once(
+        _INDEX, 'downloads', ['user_id', 'status', text('created_at DESC')],
+        legacy=_LEGACY, postgresql_with={'fillfactor': 70},
+    )
+    op.drop_index(_REPLACED, table_name='downloads', if_exists=True)
+    if not op.get_context().as_sql:
+        reflection.invalidate(op.get_bind())
+
+
+def downgrade() -> None:
+    op.create_index(
+        _REPLACED, 'downloads', ['user_id', 'status'],
+        postgresql_with={'fillfactor': 70}, if_not_exists=True,
+    )
+    op.drop_index(_INDEX, table_name='downloads', if_exists=True)
@@ -0,0 +1,39 @@
+"""Composite indexes for keyset pagination of library lists
+
+Revision ID: 030_library_keyset_indexes
+Revises: 029_downloads_user_status_created
+Create Date: 2026-10-17
+
+/artists, /albums and /me/library page by a cursor after the last row of
+the previous page. Each list is ordered by its sort column plus a unique
+tiebreaker, and these indexes carry exactly that key, so every page is an
+index range read however deep it is. Databases bootstrapped from db/init
+already carry equivalent idx_* indexes and are skipped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils import reflection
+
+revision: str = '030_library_keyset_indexes'
+down_revision: Union[str, None] = '029_downloads_user_status_created'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns, db/init equivalent)
+_INDEXES = (
+    ('ix_artists_sort_name_id', 'artists', ['sort_name', 'id'], 'idx_artists_sort_id'),
+    ('ix_albums_title_id', 'albums', ['title', 'id'], 'idx_albums_title_id'),
+    ('ix_user_albums_user_added', 'user_albums', ['user_id', 'added_at', 'album_id'], 'idx_user_albums_user_added'),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns, legacy_name in _INDEXES:
+        reflection.create_index_once(name, table, columns, legacy=legacy_name)
+
+
+def downgrade() -> None:
+    for name, table, _, _ in _INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
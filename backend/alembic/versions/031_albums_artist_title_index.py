@@ -0,0 +1,38 @@
+"""(artist_id, title, id) index for one artist's album list
+
+Revision ID: 031_albums_artist_title_index
+Revises: 030_library_keyset_indexes
+Create Date: 2026-10-17
+
+/albums?artist_id=... filters on the artist and pages by (title, id). With
+the artist as the leading key every page, offset or cursor, is an ordered
+index range read; uq_album_artist_title leads with artist_id too but is
+keyed on normalized_title, so the page still had to be sorted. The other
+filter/order pairs of the list endpoints are already served:
+ix_albums_title_id and ix_artists_sort_name_id for the browse lists, and
+uq_track_album_position for an album's tracks in (disc, track) order.
+Databases bootstrapped from db/init already carry
+idx_albums_artist_title_id and are skipped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils import reflection
+
+revision: str = '031_albums_artist_title_index'
+down_revision: Union[str, None] = '030_library_keyset_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEX = 'ix_albums_artist_title_id'
+_LEGACY = 'idx_albums_artist_title_id'
+_COLUMNS = ['artist_id', 'title', 'id']
+
+
+def upgrade() -> None:
+    reflection.create_index_once(_INDEX, 'albums', _COLUMNS, legacy=_LEGACY)
+
+
+def downgrade() -> None:
+    op.drop_index(_INDEX, table_name='albums', if_exists=True)
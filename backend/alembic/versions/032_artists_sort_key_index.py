@@ -0,0 +1,43 @@
+"""(coalesce(sort_name, name), id) index for the artist browse list
+
+Revision ID: 032_artists_sort_key_index
+Revises: 031_albums_artist_title_index
+Create Date: 2026-10-17
+
+/artists pages by a keyset on its sort key, and sort_name is nullable: an
+artist without one compared as unknown against the cursor and dropped out
+of every page, and a cursor anchored on it returned an empty page. The
+list now sorts by coalesce(sort_name, name), which is never NULL, and this
+expression index replaces ix_artists_sort_name_id (and its db/init twin
+idx_artists_sort_id) for it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+from app.utils import reflection
+
+revision: str = '032_artists_sort_key_index'
+down_revision: Union[str, None] = '031_albums_artist_title_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEX = 'ix_artists_sort_key_id'
+_LEGACY = 'idx_artists_sort_key_id'
+_REPLACED = ('ix_artists_sort_name_id', 'idx_artists_sort_id')
+
+
+def upgrade() -> None:
+    reflection.create_index_once(
+        _INDEX, 'artists', [text('coalesce(sort_name, name)'), 'id'], legacy=_LEGACY,
+    )
+    for name in _REPLACED:
+        op.drop_index(name, table_name='artists', if_exists=True)
+    if not op.get_context().as_sql:
+        reflection.invalidate(op.get_bind())
+
+
+def downgrade() -> None:
+    op.create_index(_REPLACED[0], 'artists', ['sort_name', 'id'], if_not_exists=True)
+    op.drop_index(_INDEX, table_name='artists', if_exists=True)
@@ -0,0 +1,49 @@
+"""Dedup index layout for databases re-stamped from the legacy chain
+
+Revision ID: 033_legacy_dedup_indexes
+Revises: 032_artists_sort_key_index
+Create Date: 2026-10-17
+
+Databases at 017_add_import_history_checksum are re-stamped to the
+baseline by alembic/env.py without running it, so they kept the legacy
+single-column indexes. import_history is always probed by
+(artist_normalized, album_normalized): the composite replaces the two
+single-column indexes, and albums.normalized_title is already covered by
+uq_album_artist_title. Databases bootstrapped from db/init carry
+idx_import_lookup, which leads with the same two columns.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils import reflection
+
+revision: str = '033_legacy_dedup_indexes'
+down_revision: Union[str, None] = '032_artists_sort_key_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEX = 'ix_import_history_artist_album'
+_LEGACY = 'idx_import_lookup'
+# (index, table) superseded by the composite or by uq_album_artist_title
+_REPLACED = (
+    ('ix_import_history_artist_normalized', 'import_history'),
+    ('ix_import_history_album_normalized', 'import_history'),
+    ('ix_albums_normalized_title', 'albums'),
+)
+
+
+def upgrade() -> None:
+    reflection.create_index_once(
+        _INDEX, 'import_history', ['artist_normalized', 'album_normalized'], legacy=_LEGACY,
+    )
+    for name, table in _REPLACED:
+        op.drop_index(name, table_name=table, if_exists=True)
+    if not op.get_context().as_sql:
+        reflection.invalidate(op.get_bind())
+
+
+def downgrade() -> None:
+    # The result is the baseline layout, which the previous revision
+    # already declares; a legacy layout is not restored
+    pass
@@ -0,0 +1,65 @@
+"""BRIN created_at indexes for databases re-stamped from the legacy chain
+
+Revision ID: 034_legacy_brin_time_indexes
+Revises: 033_legacy_dedup_indexes
+Create Date: 2026-10-17
+
+The baseline indexes the append-only created_at columns of activity_log,
+downloads and backup_history with BRIN, but databases re-stamped from
+017_add_import_history_checksum never ran it: they kept b-trees under the
+same names on activity_log and backup_history, and downloads had none. On
+Postgres a b-tree found under one of these names is dropped and rebuilt as
+BRIN; other dialects only get the missing index, as a b-tree.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils import reflection
+from app.utils.partitions import is_partitioned
+
+revision: str = '034_legacy_brin_time_indexes'
+down_revision: Union[str, None] = '033_legacy_dedup_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table), as declared by the baseline
+_INDEXES = (
+    ('ix_activity_log_created_at', 'activity_log'),
+    ('ix_downloads_created_at', 'downloads'),
+    ('ix_backup_history_created_at', 'backup_history'),
+)
+_BRIN_TIME_INDEX = {
+    'postgresql_using': 'brin',
+    'postgresql_with': {'pages_per_range': 32},
+}
+
+
+def _is_btree(name: str, table: str) -> bool:
+    """Whether ``name`` is still the legacy b-tree (assumed for offline SQL)."""
+    if op.get_context().as_sql:
+        return True
+    for index in reflection.inspector(op.get_bind()).get_indexes(table):
+        if index['name'] == name:
+            return index.get('dialect_options', {}).get('postgresql_using') != 'brin'
+    return False
+
+
+def upgrade() -> None:
+    context = op.get_context()
+    for name, table in _INDEXES:
+        if context.dialect.name == 'postgresql' and _is_btree(name, table):
+            op.drop_index(name, table_name=table, if_exists=True)
+            if not context.as_sql:
+                reflection.invalidate(op.get_bind())
+        # Partitioned parents cannot build CONCURRENTLY; each partition is small
+        partitioned = not context.as_sql and is_partitioned(op.get_bind(), table)
+        reflection.create_index_once(
+            name, table, ['created_at'], concurrently=not partitioned, **_BRIN_TIME_INDEX,
+        )
+
+
+def downgrade() -> None:
+    # The result is the baseline layout, which the previous revision
+    # already declares; the legacy b-trees are not restored
+    pass
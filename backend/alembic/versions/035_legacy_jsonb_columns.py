@@ -0,0 +1,65 @@
+"""JSONB columns and details GIN index for legacy-stamped databases
+
+Revision ID: 035_legacy_jsonb_columns
+Revises: 034_legacy_brin_time_indexes
+Create Date: 2026-10-17
+
+The baseline stores activity_log.details and pending_review.quality_info
+as JSONB and indexes details with jsonb_path_ops GIN, but databases
+re-stamped from 017_add_import_history_checksum never ran it and kept
+json columns without the index. Each json column is converted in place
+(a table rewrite), then the index is built. Postgres only.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from app.utils import reflection
+from app.utils.partitions import is_partitioned
+
+revision: str = '035_legacy_jsonb_columns'
+down_revision: Union[str, None] = '034_legacy_brin_time_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_JSONB_COLUMNS = (
+    ('activity_log', 'details'),
+    ('pending_review', 'quality_info'),
+)
+_INDEX = 'ix_activity_log_details_gin'
+
+
+def _is_json(table: str, column: str) -> bool:
+    if op.get_context().as_sql:
+        return True
+    return type(reflection.column_type(op.get_bind(), table, column)) is postgresql.JSON
+
+
+def upgrade() -> None:
+    context = op.get_context()
+    if context.dialect.name != 'postgresql':
+        return
+
+    for table, column in _JSONB_COLUMNS:
+        if _is_json(table, column):
+            op.alter_column(
+                table, column,
+                type_=postgresql.JSONB(), existing_type=postgresql.JSON(),
+                postgresql_using=f'{column}::jsonb',
+            )
+    if not context.as_sql:
+        reflection.invalidate(op.get_bind())
+
+    # Partitioned parents cannot build CONCURRENTLY; each partition is small
+    partitioned = not context.as_sql and is_partitioned(op.get_bind(), 'activity_log')
+    reflection.create_index_once(
+        _INDEX, 'activity_log', ['details'], concurrently=not partitioned,
+        postgresql_using='gin', postgresql_ops={'details': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    # The result is the baseline layout, which the previous revision
+    # already declares; the json columns are not restored
+    pass
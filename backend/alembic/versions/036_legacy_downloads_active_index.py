@@ -0,0 +1,44 @@
+"""Partial active-queue index for legacy-stamped databases
+
+Revision ID: 036_legacy_downloads_active_index
+Revises: 035_legacy_jsonb_columns
+Create Date: 2026-10-17
+
+The baseline adds ix_downloads_active, a (user_id, created_at) index over
+only the statuses the download queue lists, and replaces the status-only
+ix_downloads_status. Databases re-stamped from
+017_add_import_history_checksum never ran it: 019 only rebuilds the
+partial index where it exists and 029 adds ix_downloads_user_status_created
+alone, so they still poll the queue without it and carry the old index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+from app.utils import reflection
+
+revision: str = '036_legacy_downloads_active_index'
+down_revision: Union[str, None] = '035_legacy_jsonb_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEX = 'ix_downloads_active'
+_QUEUE_PREDICATE = "status IN ('pending', 'downloading', 'importing', 'pending_review', 'failed')"
+_REPLACED = 'ix_downloads_status'
+
+
+def upgrade() -> None:
+    reflection.create_index_once(
+        _INDEX, 'downloads', ['user_id', 'created_at'],
+        postgresql_where=text(_QUEUE_PREDICATE),
+    )
+    op.drop_index(_REPLACED, table_name='downloads', if_exists=True)
+    if not op.get_context().as_sql:
+        reflection.invalidate(op.get_bind())
+
+
+def downgrade() -> None:
+    # The result is the baseline layout, which the previous revision
+    # already declares; ix_downloads_status is not restored
+    pass
@@ -0,0 +1,539 @@
+"""Squashed baseline schema (replaces migrations 001-017)
+
+Revision ID: baseline_2026
+Revises:
+Create Date: 2026-10-17
+
+Issues the final DDL for every table in one pass. Columns added by the
+historical chain (005 album status, 007/008 download links, 010 is_admin,
+014-016 extended metadata, 017 import checksum) are inlined, and unique
+constraints and indexes are built as part of table creation instead of
+ALTER TABLE statements against populated tables.
+
+Databases already at 017_add_import_history_checksum are re-stamped to
+this revision by alembic/env.py.
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.utils import reflection
+from app.utils.partitions import (
+    add_months,
+    default_partition_ddl,
+    month_partition_ddl,
+    month_start,
+)
+
+revision: str = 'baseline_2026'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Append-only timestamp columns are physically correlated with insert order,
+# so a BRIN index (one entry per block range) serves range scans at a tiny
+# fraction of a b-tree's size. Other dialects ignore these and build b-trees.
+# Pre-parsed binary JSON on Postgres (GIN-indexable); plain JSON elsewhere.
+_JSON = sa.JSON().with_variant(JSONB(), 'postgresql')
+# BIGINT ids for high-churn tables; SQLite only autoincrements INTEGER PKs
+_BIGINT_ID = sa.BigInteger().with_variant(sa.Integer(), 'sqlite')
+
+# Closed status sets get native ENUM types on Postgres (VARCHAR elsewhere).
+# New values are added with ALTER TYPE ... ADD VALUE.
+_DOWNLOAD_STATUS = sa.Enum(
+    'pending', 'downloading', 'importing', 'complete', 'duplicate',
+    'failed', 'cancelled', 'pending_review',
+    name='download_status',
+)
+_EXPORT_STATUS = sa.Enum(
+    'pending', 'running', 'complete', 'failed', 'cancelled',
+    name='export_status',
+)
+
+# Rows rewritten repeatedly after insert (status, progress). Spare page room
+# keeps those updates HOT: the new row version stays on the same page and
+# unchanged indexes are not touched.
+_UPDATE_HEAVY_TABLES = ('downloads', 'exports', 'pending_review', 'backup_history')
+_UPDATE_HEAVY_FILLFACTOR = 70
+
+_BRIN_TIME_INDEX = {
+    'postgresql_using': 'brin',
+    'postgresql_with': {'pages_per_range': 32},
+}
+
+
+def _is_postgres() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _trigram_index(name: str, column: str) -> list:
+    """GIN trigram index serving ILIKE '%term%' search (Postgres only)."""
+    if not _is_postgres():
+        return []
+    return [sa.Index(name, column, postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'})]
+
+
+def _covering_index(name: str, column: str, included: str) -> list:
+    """B-tree on ``column`` carrying ``included`` for index-only scans (Postgres only)."""
+    if not _is_postgres():
+        return []
+    return [sa.Index(name, column, postgresql_include=[included])]
+
+
+def _inspector():
+    """Reflect the live schema; offline (--sql) runs emit fresh-install DDL."""
+    if op.get_context().as_sql:
+        return None
+    return reflection.inspector(op.get_bind())
+
+
+def _create_index(index: sa.Index, table: str) -> None:
+    """Add an index to a table that may already hold rows.
+
+    On Postgres the index is built CONCURRENTLY (SHARE UPDATE EXCLUSIVE
+    instead of blocking writes), which has to run outside a transaction.
+    """
+    columns = [str(expr) for expr in index.expressions]
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            op.create_index(
+                index.name, table, columns,
+                unique=index.unique, postgresql_concurrently=True,
+                **index.kwargs,
+            )
+    else:
+        op.create_index(index.name, table, columns, unique=index.unique, **index.kwargs)
+
+
+def _create_foreign_key(fk: sa.ForeignKeyConstraint, table: str) -> None:
+    """Attach an FK to columns just added to an existing table.
+
+    Every FK is otherwise declared inline in create_table. The new columns
+    hold only NULLs, so on Postgres the constraint is added NOT VALID to skip
+    the validation scan of the whole table. SQLite cannot add constraints to
+    an existing table and keeps the bare column.
+    """
+    if not _is_postgres():
+        return
+    targets = [element.target_fullname.split('.') for element in fk.elements]
+    op.create_foreign_key(
+        None, table, targets[0][0],
+        list(fk.column_keys), [column for _, column in targets],
+        ondelete=fk.ondelete, deferrable=fk.deferrable, initially=fk.initially,
+        postgresql_not_valid=True,
+    )
+
+
+def _create_table(inspector, name: str, *elements, **kw) -> bool:
+    """Create a table, or add only its missing columns (and their FKs) if it already exists.
+
+    entrypoint.sh bootstraps the schema with Base.metadata.create_all, so the
+    baseline can meet tables that predate it. Checking the inspector avoids
+    both the failed CREATE and a batch_alter_table rewrite of the table.
+    Returns True when the table was created.
+    """
+    if inspector is None or not inspector.has_table(name):
+        op.create_table(name, *elements, **kw)
+        return True
+
+    columns = {c["name"] for c in inspector.get_columns(name)}
+    indexes = {i["name"] for i in inspector.get_indexes(name)}
+    added = set()
+    for element in elements:
+        if isinstance(element, sa.Column) and element.name not in columns:
+            op.add_column(name, element)
+            added.add(element.name)
+    for element in elements:
+        if isinstance(element, sa.ForeignKeyConstraint) and added.issuperset(element.column_keys):
+            _create_foreign_key(element, name)
+        elif isinstance(element, sa.Index) and element.name not in indexes:
+            _create_index(element, name)
+    return False
+
+
+def upgrade() -> None:
+    inspector = _inspector()
+
+    if _is_postgres():
+        # On a fresh database the whole upgrade is one transaction, so the
+        # DDL batch only needs its single commit to be durable; skip the
+        # fsync wait for it. Where tables already exist, each index
+        # _create_index adds commits that transaction early, and the rest
+        # of the upgrade runs with the default setting.
+        op.execute("SET LOCAL synchronous_commit = off")
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Users table
+    _create_table(
+        inspector,
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(50), nullable=False),
+        sa.Column('password_hash', sa.String(255), nullable=False),
+        sa.Column('is_admin', sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('updated_at', sa.DateTime(timezone=True)),
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_users_id', 'id'),
+        sa.Index('ix_users_username', 'username', unique=True),
+    )
+
+    # Artists table
+    _create_table(
+        inspector,
+        'artists',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('normalized_name', sa.String(255), nullable=False),
+        sa.Column('sort_name', sa.String(255)),
+        sa.Column('path', sa.String(1000)),
+        sa.Column('artwork_path', sa.String(1000)),
+        sa.Column('musicbrainz_id', sa.String(36)),
+        sa.Column('biography', sa.Text()),
+        sa.Column('country', sa.CHAR(2)),  # ISO 3166-1 alpha-2
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('updated_at', sa.DateTime(timezone=True)),
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_artists_id', 'id'),
+        sa.Index('ix_artists_name', 'name'),
+        sa.Index('ix_artists_normalized_name', 'normalized_name'),
+        sa.Index('ix_artists_sort_name', 'sort_name'),
+        *_trigram_index('ix_artists_name_trgm', 'name'),
+    )
+
+    # Albums table
+    _create_table(
+        inspector,
+        'albums',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('artist_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(255), nullable=False),
+        sa.Column('normalized_title', sa.String(255), nullable=False),
+        sa.Column('year', sa.Integer()),
+        sa.Column('path', sa.String(1000)),
+        sa.Column('artwork_path', sa.String(1000)),
+        sa.Column('total_tracks', sa.Integer()),
+        sa.Column('available_tracks', sa.Integer()),
+        sa.Column('disc_count', sa.Integer()),
+        sa.Column('genre', sa.String(100)),
+        sa.Column('label', sa.String(255)),
+        sa.Column('catalog_number', sa.String(100)),
+        sa.Column('musicbrainz_id', sa.String(36)),
+        sa.Column('upc', sa.String(13)),
+        sa.Column('release_type', sa.String(20)),  # album, single, ep, compilation, ...
+        sa.Column('source', sa.String(50)),
+        sa.Column('source_url', sa.String(1000)),
+        sa.Column('is_compilation', sa.Boolean()),
+        sa.Column('status', sa.String(20)),  # complete, incomplete, pending
+        sa.Column('missing_tracks', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('updated_at', sa.DateTime(timezone=True)),
+        sa.ForeignKeyConstraint(['artist_id'], ['artists.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        # (artist_id, normalized_title) serves dedup lookups and, via the
+        # leading column, artist -> albums; no separate per-column indexes
+        sa.UniqueConstraint('artist_id', 'normalized_title', name='uq_album_artist_title'),
+        sa.Index('ix_albums_id', 'id'),
+        sa.Index('ix_albums_title', 'title'),
+        *_trigram_index('ix_albums_title_trgm', 'title'),
+        sa.Index('ix_albums_year', 'year'),
+        sa.Index('ix_albums_upc', 'upc'),
+        sa.Index('ix_albums_source', 'source'),
+        # Health report: albums grouped by source with incomplete counts
+        *_covering_index('ix_albums_health', 'source', 'status'),
+    )
+
+    # Tracks table
+    _create_table(
+        inspector,
+        'tracks',
+        sa.Column('id', _BIGINT_ID, nullable=False),
+        sa.Column('album_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(255), nullable=False),
+        sa.Column('normalized_title', sa.String(255), nullable=False),
+        sa.Column('track_number', sa.Integer(), nullable=False),
+        sa.Column('disc_number', sa.Integer()),
+        sa.Column('duration', sa.Integer()),
+        sa.Column('path', sa.String(1000), nullable=False),
+        sa.Column('sample_rate', sa.Integer()),
+        sa.Column('bit_depth', sa.SmallInteger()),
+        sa.Column('bitrate', sa.Integer()),
+        sa.Column('channels', sa.SmallInteger()),
+        sa.Column('file_size', sa.BigInteger()),
+        sa.Column('format', sa.String(10)),
+        sa.Column('is_lossy', sa.Boolean()),
+        sa.Column('source', sa.String(50)),
+        sa.Column('source_url', sa.String(1000)),
+        sa.Column('source_quality', sa.String(100)),
+        sa.Column('checksum', sa.LargeBinary(32)),  # BLAKE3 digest
+        sa.Column('lyrics', sa.Text()),
+        sa.Column('musicbrainz_id', sa.String(36)),
+        sa.Column('isrc', sa.String(12)),
+        sa.Column('composer', sa.String(255)),
+        sa.Column('explicit', sa.Boolean(), server_default=sa.false()),
+        sa.Column('imported_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('imported_by', sa.Integer()),
+        sa.Column('updated_at', sa.DateTime(timezone=True)),
+        sa.ForeignKeyConstraint(['album_id'], ['albums.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['imported_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        # Leading album_id column also serves album -> tracks lookups
+        sa.UniqueConstraint('album_id', 'disc_number', 'track_number', name='uq_track_album_position'),
+        sa.Index('ix_tracks_id', 'id'),
+        sa.Index('ix_tracks_title', 'title'),
+        *_trigram_index('ix_tracks_title_trgm', 'title'),
+        sa.Index('ix_tracks_normalized_title', 'normalized_title'),
+        sa.Index('ix_tracks_source', 'source'),
+        sa.Index('ix_tracks_isrc', 'isrc'),
+        # Health report: lossless/lossy counts and total size
+        *_covering_index('ix_tracks_health', 'is_lossy', 'file_size'),
+    )
+
+    # User albums (many-to-many)
+    _create_table(
+        inspector,
+        'user_albums',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('album_id', sa.Integer(), nullable=False),
+        sa.Column('added_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['album_id'], ['albums.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'album_id'),
+    )
+
+    # User tracks (many-to-many)
+    _create_table(
+        inspector,
+        'user_tracks',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('track_id', _BIGINT_ID, nullable=False),
+        sa.Column('added_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['track_id'], ['tracks.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'track_id'),
+    )
+
+    # User artists (persistent artist hearts)
+    _create_table(
+        inspector,
+        'user_artists',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('artist_id', sa.Integer(), nullable=False),
+        sa.Column('auto_add_new', sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column('added_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['artist_id'], ['artists.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'artist_id'),
+        sa.Index('ix_user_artists_artist_id', 'artist_id'),
+    )
+
+    # Activity log. On Postgres it is range-partitioned by month so retention
+    # is a DROP TABLE per partition (app.tasks.maintenance.rotate_activity_partitions);
+    # the partition key has to be part of the primary key.
+    partitioned = _is_postgres()
+    created = _create_table(
+        inspector,
+        'activity_log',
+        sa.Column('id', _BIGINT_ID, nullable=False, autoincrement=True),
+        sa.Column('user_id', sa.Integer()),
+        sa.Column('action', sa.String(50), nullable=False),
+        sa.Column('entity_type', sa.String(50)),
+        sa.Column('entity_id', _BIGINT_ID),
+        sa.Column('details', _JSON),
+        sa.Column('ip_address', sa.String(45)),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id', 'created_at') if partitioned else sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_activity_log_id', 'id'),
+        sa.Index('ix_activity_log_action', 'action'),
+        sa.Index('ix_activity_log_created_at', 'created_at', **_BRIN_TIME_INDEX),
+        # Keyset pagination order (created_at DESC, id DESC), scanned backwards
+        sa.Index('ix_activity_log_created_id', 'created_at', 'id'),
+        # jsonb_path_ops GIN serves @> containment filters on details (Postgres only)
+        *([sa.Index(
+            'ix_activity_log_details_gin', 'details',
+            postgresql_using='gin', postgresql_ops={'details': 'jsonb_path_ops'},
+        )] if _is_postgres() else []),
+        **({'postgresql_partition_by': 'RANGE (created_at)'} if partitioned else {}),
+    )
+    if partitioned and created:
+        op.execute(default_partition_ddl('activity_log'))
+        this_month = month_start(date.today())
+        for offset in range(3):
+            op.execute(month_partition_ddl('activity_log', add_months(this_month, offset)))
+
+    # Pending review (unidentified imports)
+    _create_table(
+        inspector,
+        'pending_review',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('path', sa.String(1000), nullable=False),
+        sa.Column('suggested_artist', sa.String(255)),
+        sa.Column('suggested_album', sa.String(255)),
+        sa.Column('suggested_year', sa.Integer()),
+        sa.Column('beets_confidence', sa.Float()),
+        sa.Column('track_count', sa.Integer()),
+        sa.Column('quality_info', _JSON),
+        sa.Column('source', sa.String(50)),
+        sa.Column('source_url', sa.String(1000)),
+        sa.Column('status', sa.String(20)),
+        sa.Column('reviewed_by', sa.Integer()),
+        sa.Column('reviewed_at', sa.DateTime(timezone=True)),
+        sa.Column('error_message', sa.String(1000)),
+        sa.Column('notes', sa.String(1000)),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['reviewed_by'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_pending_review_id', 'id'),
+        sa.Index('ix_pending_review_status', 'status'),
+    )
+
+    # Downloads queue
+    _create_table(
+        inspector,
+        'downloads',
+        sa.Column('id', _BIGINT_ID, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('source', sa.String(50), nullable=False),
+        sa.Column('source_url', sa.String(1000)),
+        sa.Column('search_query', sa.String(500)),
+        sa.Column('search_type', sa.String(20)),
+        sa.Column('status', _DOWNLOAD_STATUS),
+        sa.Column('progress', sa.Integer()),
+        sa.Column('speed', sa.String(50)),
+        sa.Column('eta', sa.String(50)),
+        sa.Column('error_message', sa.Text()),
+        sa.Column('celery_task_id', sa.String(255)),
+        sa.Column('result_album_id', sa.Integer()),
+        sa.Column('result_review_id', sa.Integer()),
+        sa.Column('started_at', sa.DateTime(timezone=True)),
+        sa.Column('completed_at', sa.DateTime(timezone=True)),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        # Deferred so a download and its album/review can be written in either order
+        sa.ForeignKeyConstraint(
+            ['result_album_id'], ['albums.id'], ondelete='SET NULL', deferrable=True, initially='DEFERRED',
+        ),
+        sa.ForeignKeyConstraint(
+            ['result_review_id'], ['pending_review.id'], ondelete='SET NULL', deferrable=True, initially='DEFERRED',
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_downloads_id', 'id'),
+        sa.Index('ix_downloads_user_status', 'user_id', 'status', postgresql_with={'fillfactor': 70}),
+        # Queue poll only touches non-terminal rows; the partial index stays
+        # small however long the download history grows
+        sa.Index(
+            'ix_downloads_active', 'user_id', 'created_at',
+            postgresql_where=sa.text(
+                "status IN ('pending', 'downloading', 'importing', 'pending_review', 'failed')"
+            ),
+        ),
+        sa.Index('ix_downloads_created_at', 'created_at', **_BRIN_TIME_INDEX),
+    )
+
+    # Import history (duplicate detection)
+    _create_table(
+        inspector,
+        'import_history',
+        sa.Column('id', _BIGINT_ID, nullable=False),
+        sa.Column('artist_normalized', sa.String(255), nullable=False),
+        sa.Column('album_normalized', sa.String(255), nullable=False),
+        sa.Column('track_normalized', sa.String(255)),
+        sa.Column('source', sa.String(50), nullable=False),
+        sa.Column('quality_score', sa.Integer()),
+        sa.Column('checksum', sa.LargeBinary(32)),  # BLAKE3 digest
+        sa.Column('track_id', _BIGINT_ID),
+        sa.Column('album_id', sa.Integer()),
+        sa.Column('import_date', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['track_id'], ['tracks.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['album_id'], ['albums.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_import_history_id', 'id'),
+        # Leading artist_normalized column still serves artist-only lookups
+        sa.Index('ix_import_history_artist_album', 'artist_normalized', 'album_normalized'),
+        sa.Index('ix_import_history_track_normalized', 'track_normalized'),
+        sa.Index('ix_import_history_checksum', 'checksum'),
+    )
+
+    # Exports
+    _create_table(
+        inspector,
+        'exports',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('destination', sa.String(1000), nullable=False),
+        sa.Column('format', sa.String(10)),
+        sa.Column('include_artwork', sa.Boolean()),
+        sa.Column('include_playlist', sa.Boolean()),
+        sa.Column('status', _EXPORT_STATUS),
+        sa.Column('progress', sa.Integer()),
+        sa.Column('total_albums', sa.Integer()),
+        sa.Column('exported_albums', sa.Integer()),
+        sa.Column('total_size', sa.BigInteger()),
+        sa.Column('celery_task_id', sa.String(100)),
+        sa.Column('error_message', sa.String(1000)),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('started_at', sa.DateTime(timezone=True)),
+        sa.Column('completed_at', sa.DateTime(timezone=True)),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_exports_id', 'id'),
+        sa.Index('ix_exports_status', 'status'),
+    )
+
+    # Backup history
+    _create_table(
+        inspector,
+        'backup_history',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('destination', sa.String(500), nullable=False),
+        sa.Column('destination_type', sa.String(50)),  # local, nas, s3, b2
+        sa.Column('status', sa.String(20), nullable=False),  # running, complete, failed
+        sa.Column('files_backed_up', sa.Integer()),
+        sa.Column('total_size', sa.BigInteger()),
+        sa.Column('error_message', sa.Text()),
+        sa.Column('started_at', sa.DateTime(timezone=True)),
+        sa.Column('completed_at', sa.DateTime(timezone=True)),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_backup_history_id', 'id'),
+        sa.Index('ix_backup_history_status', 'status'),
+        sa.Index('ix_backup_history_created_at', 'created_at', **_BRIN_TIME_INDEX),
+        # Newest-first listing (created_at DESC, id DESC), scanned backwards
+        sa.Index('ix_backup_history_created_id', 'created_at', 'id'),
+    )
+
+    if _is_postgres():
+        for name in _UPDATE_HEAVY_TABLES:
+            op.execute(f"ALTER TABLE {name} SET (fillfactor = {_UPDATE_HEAVY_FILLFACTOR})")
+
+    if inspector is not None:
+        reflection.invalidate(op.get_bind())
+
+
+def downgrade() -> None:
+    inspector = _inspector()
+    for name in (
+        'backup_history',
+        'exports',
+        'import_history',
+        'downloads',
+        'pending_review',
+        'activity_log',
+        'user_artists',
+        'user_tracks',
+        'user_albums',
+        'tracks',
+        'albums',
+        'artists',
+        'users',
+    ):
+        if inspector is None or inspector.has_table(name):
+            op.drop_table(name)
+    bind = op.get_bind()
+    _EXPORT_STATUS.drop(bind, checkfirst=True)
+    _DOWNLOAD_STATUS.drop(bind, checkfirst=True)
@@ -1,116 +1,170 @@
-"""Admin API endpoints for user management, health, and backups."""
+"""Admin API endpoints for user management, health, and backups.
+
+Handlers are plain ``def``: they only do blocking work (sync SQLAlchemy
+session, password hashing), so FastAPI runs them in its threadpool
+instead of on the event loop.
+"""
 from typing import Optional, List
 from datetime import datetime
 from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from passlib.context import CryptContext
-
-from app.database import get_db
-from app.dependencies import get_current_admin_user
+from sqlalchemy.orm import Session, aliased, raiseload
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import QueuePool
+
+from app import cache
+from app.database import conflict_insert, engine, get_db
+from app.dependencies import get_current_admin_user, get_cursor_row_id
 from app.models.user import User
 from app.models.artist import Artist
 from app.models.album import Album
 from app.models.track import Track
 from app.models.activity import ActivityLog
 from app.models.backup_history import BackupHistory
-from app.schemas.user import UserCreate, UserResponse
+from app.schemas.user import UserCreate, UserResponse, UserUpdate
 from app.services.activity import ActivityService
+from app.services.auth import hash_password
+from app.utils.pagination import after_row, next_cursor
 from app.config import settings
 
 
 router = APIRouter(prefix="/admin", tags=["admin"])
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# SQLSTATE raised by the trg_last_admin constraint trigger (check_violation)
+LAST_ADMIN_SQLSTATE = "23514"
+
+
+def _commit_unless_last_admin(db: Session, detail: str) -> None:
+    """Commit, turning a last-admin trigger violation into a 400.
+
+    The trigger is deferred, so it fires here rather than at the DELETE or
+    UPDATE; it only exists on Postgres.
+    """
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if getattr(e.orig, "pgcode", None) == LAST_ADMIN_SQLSTATE:
+            raise HTTPException(status_code=400, detail=detail)
+        raise
 
 
 @router.get("/users", response_model=list[UserResponse])
-async def list_users(
+def list_users(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """List all users."""
-    return db.query(User).order_by(User.username).all()
+    return db.query(User).options(raiseload("*")).order_by(User.username).all()
 
 
 @router.post("/users", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def create_user(
+def create_user(
     data: UserCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """Create new user."""
-    existing = db.query(User).filter(User.username == data.username).first()
-    if existing:
+    # One round-trip: the unique index on username decides, so concurrent
+    # creates of the same name cannot both succeed
+    stmt = (
+        conflict_insert(db, User)
+        .values(
+            username=data.username,
+            password_hash=hash_password(data.password),
+            is_admin=bool(data.is_admin),
+        )
+        .on_conflict_do_nothing(index_elements=[User.username])
+        .returning(User)
+    )
+    user = db.scalars(stmt).first()
+    if user is None:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Username already exists")
 
-    user = User(
-        username=data.username,
-        password_hash=pwd_context.hash(data.password),
-        is_admin=bool(data.is_admin),
-    )
-    db.add(user)
+    response = UserResponse.model_validate(user)
     db.commit()
-    db.refresh(user)
-
-    return user
+    return response
 
 
 @router.get("/users/{user_id}", response_model=UserResponse)
-async def get_user(
+def get_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """Get user by ID."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
 
 @router.put("/users/{user_id}", response_model=UserResponse)
-async def update_user(
+def update_user(
     user_id: int,
-    password: Optional[str] = None,
+    data: UserUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """Update user."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if password:
-        user.password_hash = pwd_context.hash(password)
+    if data.password:
+        user.password_hash = hash_password(data.password)
 
-    db.commit()
+    if data.is_admin is not None:
+        if user.id == current_user.id and not data.is_admin:
+            raise HTTPException(status_code=400, detail="Cannot remove your own admin access")
+        user.is_admin = data.is_admin
+
+    _commit_unless_last_admin(db, "Cannot remove the last admin")
     db.refresh(user)
     return user
 
 
 @router.delete("/users/{user_id}")
-async def delete_user(
+def delete_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
-    """Delete user."""
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    if user.id == current_user.id:
+    """Delete user.
+
+    One DELETE statement that also refuses to remove the last admin; the
+    lookup only runs to pick the error when nothing was deleted. On Postgres
+    the trg_last_admin trigger re-checks at commit, which covers two admins
+    deleting each other concurrently.
+    """
+    if user_id == current_user.id:
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
 
-    db.delete(user)
-    db.commit()
-
+    other_admin = aliased(User)
+    other_admin_exists = (
+        select(other_admin.id)
+        .where(other_admin.is_admin == True, other_admin.id != user_id)
+        .exists()
+    )
+    deleted = db.execute(
+        delete(User)
+        .where(User.id == user_id, or_(User.is_admin == False, other_admin_exists))
+        .returning(User.id)
+    ).first()
+    if deleted is None:
+        db.rollback()
+        if db.get(User, user_id) is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        raise HTTPException(status_code=400, detail="Cannot delete the last admin")
+
+    _commit_unless_last_admin(db, "Cannot delete the last admin")
     return {"status": "deleted"}
 
 
 @router.post("/rescan")
-async def rescan_library(
+def rescan_library(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
@@ -125,34 +179,46 @@ async def rescan_library(
 # ============================================================================
 
 @router.get("/health")
-async def library_health(
+def library_health(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
-    """Get library health report."""
-    # Count totals
-    artist_count = db.query(func.count(Artist.id)).scalar()
-    album_count = db.query(func.count(Album.id)).scalar()
-    track_count = db.query(func.count(Track.id)).scalar()
-    user_count = db.query(func.count(User.id)).scalar()
-
-    # Quality breakdown
-    lossless_count = db.query(func.count(Track.id)).filter(Track.is_lossy == False).scalar()
-    lossy_count = db.query(func.count(Track.id)).filter(Track.is_lossy == True).scalar()
-
-    # Storage
-    total_size = db.query(func.sum(Track.file_size)).scalar() or 0
-
-    # Incomplete albums
-    incomplete_count = db.query(func.count(Album.id)).filter(Album.status == 'incomplete').scalar()
-
-    # Albums by source
-    source_counts = db.query(
+    """Get library health report.
+
+    Cached in Redis for ``health_cache_ttl`` seconds; imports, scans and
+    deletions drop the cached copy.
+    """
+    if settings.health_cache_ttl:
+        cached = cache.get_json(cache.HEALTH_CACHE_KEY)
+        if cached is not None:
+            return cached
+
+    # Two round-trips, one scan per table. Quality breakdown and storage come
+    # from filtered aggregates over tracks; artist/user counts ride along as
+    # scalar subqueries. Only columns in ix_tracks_health / ix_albums_health
+    # are read (count(*), not count(id)), so Postgres can answer both from
+    # the indexes alone.
+    artist_count, user_count, track_count, lossless_count, lossy_count, total_size = db.query(
+        select(func.count(Artist.id)).scalar_subquery(),
+        select(func.count(User.id)).scalar_subquery(),
+        func.count(),
+        func.count().filter(Track.is_lossy == False),
+        func.count().filter(Track.is_lossy == True),
+        func.sum(Track.file_size),
+    ).select_from(Track).one()
+    total_size = total_size or 0
+
+    # Albums by source; album totals are summed from the groups
+    source_rows = db.query(
         Album.source,
-        func.count(Album.id)
+        func.count(),
+        func.count().filter(Album.status == 'incomplete'),
     ).group_by(Album.source).all()
+    source_counts = [(source, count) for source, count, _ in source_rows]
+    album_count = sum(count for _, count, _ in source_rows)
+    incomplete_count = sum(incomplete for _, _, incomplete in source_rows)
 
-    return {
+    report = {
         "summary": {
             "artists": artist_count,
             "albums": album_count,
@@ -170,6 +236,26 @@ async def library_health(
         "incomplete_albums": incomplete_count,
         "status": "healthy"
     }
+    if settings.health_cache_ttl:
+        cache.set_json(cache.HEALTH_CACHE_KEY, report, settings.health_cache_ttl)
+    return report
+
+
+@router.get("/health/pool")
+def connection_pool_status(
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Get database connection pool usage for this API process."""
+    pool = engine.pool
+    report = {"pool": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        report.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    return report
 
 
 # ============================================================================
@@ -177,16 +263,23 @@ async def library_health(
 # ============================================================================
 
 @router.get("/activity")
-async def list_activity(
+def list_activity(
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
     action: Optional[str] = None,
+    after_id: Optional[int] = Depends(get_cursor_row_id),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
-    """Get all activity logs (admin only)."""
+    """Get all activity logs (admin only).
+
+    Page with ``cursor`` (returned as ``next_cursor``) rather than ``offset``:
+    cursor pages cost the same however deep they are.
+    """
     service = ActivityService(db)
-    activities = service.get_all_activity(limit=limit, offset=offset, action=action)
+    activities = service.get_all_activity(
+        limit=limit, offset=offset, action=action, after_id=after_id,
+    )
 
     return {
         "items": [
@@ -198,12 +291,13 @@ async def list_activity(
                 "entity_id": a.entity_id,
                 "details": a.details,
                 "ip_address": a.ip_address,
-                "created_at": a.created_at.isoformat() if a.created_at else None
+                "created_at": a.created_at
             }
             for a in activities
         ],
         "limit": limit,
-        "offset": offset
+        "offset": offset,
+        "next_cursor": next_cursor(activities, limit),
     }
 
 
@@ -212,7 +306,7 @@ async def list_activity(
 # ============================================================================
 
 @router.post("/integrity/verify")
-async def verify_integrity(
+def verify_integrity(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
@@ -227,15 +321,20 @@ async def verify_integrity(
 # ============================================================================
 
 @router.get("/backup/history")
-async def backup_history(
+def backup_history(
     limit: int = Query(20, ge=1, le=100),
+    after_id: Optional[int] = Depends(get_cursor_row_id),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
-    """Get backup history."""
+    """Get backup history, newest first."""
+    # Rows are serialized column by column; any relationship access would be N+1
+    query = db.query(BackupHistory).options(raiseload("*"))
+    if after_id is not None:
+        query = query.filter(after_row(BackupHistory, after_id))
+
     backups = (
-        db.query(BackupHistory)
-        .order_by(BackupHistory.created_at.desc())
+        query.order_by(BackupHistory.created_at.desc(), BackupHistory.id.desc())
         .limit(limit)
         .all()
     )
@@ -250,17 +349,18 @@ async def backup_history(
                 "files_backed_up": b.files_backed_up,
                 "total_size": b.total_size,
                 "error_message": b.error_message,
-                "started_at": b.started_at.isoformat() if b.started_at else None,
-                "completed_at": b.completed_at.isoformat() if b.completed_at else None,
-                "created_at": b.created_at.isoformat() if b.created_at else None
+                "started_at": b.started_at,
+                "completed_at": b.completed_at,
+                "created_at": b.created_at
             }
             for b in backups
-        ]
+        ],
+        "next_cursor": next_cursor(backups, limit),
     }
 
 
 @router.post("/backup/trigger")
-async def trigger_backup(
+def trigger_backup(
     destination: str = Query(..., description="Backup destination path"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
@@ -1,8 +1,13 @@
 """Artwork upload and management."""
+import asyncio
+import os
 import shutil
+import tempfile
 from pathlib import Path
-from io import BytesIO
+from typing import BinaryIO, Optional, Tuple
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -17,6 +22,112 @@ router = APIRouter(tags=["artwork"])
 
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png"}
 MAX_SIZE = 10 * 1024 * 1024  # 10MB
+CHUNK_SIZE = 64 * 1024
+MAX_IMAGE_PIXELS = 25_000_000  # Decoded PNGs above this are refused (~100MB RGBA)
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+JPEG_MAGIC = b"\xff\xd8\xff"
+FETCH_ALL_CONCURRENCY = 10  # Parallel Qobuz lookups in fetch-all
+
+
+def _sniff_image(header: bytes) -> Optional[str]:
+    """Extension matching the image's magic bytes, or None if unsupported."""
+    if header.startswith(PNG_MAGIC):
+        return ".png"
+    if header.startswith(JPEG_MAGIC):
+        return ".jpg"
+    return None
+
+
+def _stage_upload(src: BinaryIO, directory: Path) -> Tuple[Path, str]:
+    """Copy an upload into a temp file in ``directory``, enforcing MAX_SIZE.
+
+    The upload is streamed in chunks, so it is never held in memory whole
+    and oversized files are rejected as soon as they cross the limit. The
+    image type is taken from the first chunk's magic bytes, not the client
+    filename; returns the staged path and that type's extension.
+    """
+    fd, name = tempfile.mkstemp(dir=directory, suffix=".part")
+    staged = Path(name)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            chunk = src.read(CHUNK_SIZE)
+            kind = _sniff_image(chunk)
+            if kind is None:
+                raise HTTPException(status_code=400, detail="File is not a JPEG or PNG image")
+            total = 0
+            while chunk:
+                total += len(chunk)
+                if total > MAX_SIZE:
+                    raise HTTPException(status_code=413, detail="File too large (max 10MB)")
+                out.write(chunk)
+                chunk = src.read(CHUNK_SIZE)
+        # mkstemp creates 0600; covers must stay readable by media servers
+        os.chmod(staged, 0o644)
+    except BaseException:
+        staged.unlink(missing_ok=True)
+        raise
+    return staged, kind
+
+
+def _backup_artwork(artwork_path: Path, backup_path: Path) -> None:
+    """Keep the first cover seen as ``backup_path``.
+
+    Hard-linked rather than copied: no data is read or written, and the
+    backup keeps the old contents because covers are only ever swapped in
+    with os.replace. Falls back to a copy where links are unsupported
+    (e.g. some SMB mounts).
+    """
+    if not artwork_path.exists() or backup_path.exists():
+        return
+    try:
+        os.link(artwork_path, backup_path)
+    except OSError:
+        shutil.copy2(artwork_path, backup_path)
+
+
+def _write_artwork(staged: Path, kind: str, artwork_path: Path, backup_path: Path) -> None:
+    """Move a staged upload into place, re-encoding PNG as JPEG.
+
+    The existing cover is backed up first, then the new file is swapped in
+    with os.replace, so readers never see a partial cover. CPU-bound for
+    PNGs (decode + JPEG encode), so callers run it in the threadpool rather
+    than on the event loop.
+    """
+    converted = staged.with_suffix(".jpg.part")
+    try:
+        source = staged
+        if kind == ".png":
+            try:
+                from PIL import Image
+            except ImportError:
+                # If PIL not available, just save as-is
+                Image = None
+            if Image is not None:
+                with Image.open(staged) as img:
+                    # Header-only so far; refuse pixel bombs before decoding
+                    if img.width * img.height > MAX_IMAGE_PIXELS:
+                        raise HTTPException(status_code=400, detail="Image dimensions too large")
+                    img.convert("RGB").save(converted, "JPEG", quality=95)
+                source = converted
+        _backup_artwork(artwork_path, backup_path)
+        os.replace(source, artwork_path)
+    finally:
+        staged.unlink(missing_ok=True)
+        converted.unlink(missing_ok=True)
+
+
+def _restore_artwork(backup_path: Path, artwork_path: Path) -> None:
+    """Put the backed-up cover back, leaving the backup in place.
+
+    Copied (kernel-side via shutil.copy2) to a temp file and swapped in, so
+    the backup stays independent of the live cover.
+    """
+    restoring = artwork_path.with_suffix(".restore.part")
+    try:
+        shutil.copy2(backup_path, restoring)
+        os.replace(restoring, artwork_path)
+    finally:
+        restoring.unlink(missing_ok=True)
 
 
 @router.put("/albums/{album_id}/artwork")
@@ -46,12 +157,9 @@ async def upload_album_artwork(
             detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
         )
 
-    # Read content
-    content = await artwork.read()
-
-    # Validate file size
-    if len(content) > MAX_SIZE:
-        raise HTTPException(status_code=400, detail="File too large (max 10MB)")
+    # Starlette has the size once the body is parsed; refuse before copying
+    if artwork.size is not None and artwork.size > MAX_SIZE:
+        raise HTTPException(status_code=413, detail="File too large (max 10MB)")
 
     # Save artwork
     album_path = Path(album.path)
@@ -60,26 +168,13 @@ async def upload_album_artwork(
 
     artwork_path = album_path / "cover.jpg"
 
-    # Backup existing if present
-    if artwork_path.exists():
-        backup_path = album_path / "cover.original.jpg"
-        if not backup_path.exists():
-            shutil.copy2(artwork_path, backup_path)
-
-    # Write new artwork (convert to jpg if needed)
-    if ext == ".png":
-        try:
-            from PIL import Image
-            img = Image.open(BytesIO(content))
-            img = img.convert("RGB")
-            img.save(artwork_path, "JPEG", quality=95)
-        except ImportError:
-            # If PIL not available, just save as-is
-            with open(artwork_path, "wb") as f:
-                f.write(content)
-    else:
-        with open(artwork_path, "wb") as f:
-            f.write(content)
+    # Stream upload to disk (validates file size and image type)
+    staged, kind = await run_in_threadpool(_stage_upload, artwork.file, album_path)
+
+    # Back up the existing cover, then swap in the new one (convert to jpg
+    # if needed) off the event loop
+    backup_path = album_path / "cover.original.jpg"
+    await run_in_threadpool(_write_artwork, staged, kind, artwork_path, backup_path)
 
     # Update database
     album.artwork_path = str(artwork_path)
@@ -89,7 +184,7 @@ async def upload_album_artwork(
 
 
 @router.delete("/albums/{album_id}/artwork")
-async def restore_original_artwork(
+def restore_original_artwork(
     album_id: int,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
@@ -109,7 +204,7 @@ async def restore_original_artwork(
     if not backup_path.exists():
         raise HTTPException(status_code=404, detail="No original artwork backup found")
 
-    shutil.copy2(backup_path, artwork_path)
+    _restore_artwork(backup_path, artwork_path)
     return {"status": "restored"}
 
 
@@ -137,12 +232,9 @@ async def upload_artist_artwork(
             detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
         )
 
-    # Read content
-    content = await artwork.read()
-
-    # Validate file size
-    if len(content) > MAX_SIZE:
-        raise HTTPException(status_code=400, detail="File too large (max 10MB)")
+    # Starlette has the size once the body is parsed; refuse before copying
+    if artwork.size is not None and artwork.size > MAX_SIZE:
+        raise HTTPException(status_code=413, detail="File too large (max 10MB)")
 
     # Determine artist folder - use existing path or create from library root
     if artist.path and Path(artist.path).exists():
@@ -155,26 +247,13 @@ async def upload_artist_artwork(
 
     artwork_path = artist_path / "artist.jpg"
 
-    # Backup existing if present
-    if artwork_path.exists():
-        backup_path = artist_path / "artist.original.jpg"
-        if not backup_path.exists():
-            shutil.copy2(artwork_path, backup_path)
-
-    # Write new artwork (convert to jpg if needed)
-    if ext == ".png":
-        try:
-            from PIL import Image
-            img = Image.open(BytesIO(content))
-            img = img.convert("RGB")
-            img.save(artwork_path, "JPEG", quality=95)
-        except ImportError:
-            # If PIL not available, just save as-is
-            with open(artwork_path, "wb") as f:
-                f.write(content)
-    else:
-        with open(artwork_path, "wb") as f:
-            f.write(content)
+    # Stream upload to disk (validates file size and image type)
+    staged, kind = await run_in_threadpool(_stage_upload, artwork.file, artist_path)
+
+    # Back up the existing cover, then swap in the new one (convert to jpg
+    # if needed) off the event loop
+    backup_path = artist_path / "artist.original.jpg"
+    await run_in_threadpool(_write_artwork, staged, kind, artwork_path, backup_path)
 
     # Update database
     artist.artwork_path = str(artwork_path)
@@ -184,7 +263,7 @@ async def upload_artist_artwork(
 
 
 @router.delete("/artists/{artist_id}/artwork")
-async def restore_artist_original_artwork(
+def restore_artist_original_artwork(
     artist_id: int,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
@@ -204,7 +283,7 @@ async def restore_artist_original_artwork(
     if not backup_path.exists():
         raise HTTPException(status_code=404, detail="No original artwork backup found")
 
-    shutil.copy2(backup_path, artwork_path)
+    _restore_artwork(backup_path, artwork_path)
     return {"status": "restored"}
 
 
@@ -250,23 +329,36 @@ async def fetch_all_missing_artist_artwork(
         (Artist.artwork_path == None) | (Artist.artwork_path == "")
     ).all()
 
-    results = []
-    for artist in artists:
-        try:
-            artwork_path = await import_service.fetch_artist_image_from_qobuz(artist, artist.name)
-            results.append({
-                "artist_id": artist.id,
-                "name": artist.name,
-                "status": "fetched" if artwork_path else "not_found",
-                "path": artwork_path
-            })
-        except Exception as e:
-            results.append({
-                "artist_id": artist.id,
-                "name": artist.name,
-                "status": "error",
-                "error": str(e)
-            })
+    # Fetch concurrently; the semaphore bounds in-flight Qobuz requests and
+    # the shared client reuses connections for the image downloads
+    semaphore = asyncio.Semaphore(FETCH_ALL_CONCURRENCY)
+    limits = httpx.Limits(
+        max_connections=FETCH_ALL_CONCURRENCY,
+        max_keepalive_connections=FETCH_ALL_CONCURRENCY,
+    )
+
+    async def fetch_one(artist: Artist, client: httpx.AsyncClient) -> dict:
+        async with semaphore:
+            try:
+                artwork_path = await import_service.fetch_artist_image_from_qobuz(
+                    artist, artist.name, http_client=client
+                )
+                return {
+                    "artist_id": artist.id,
+                    "name": artist.name,
+                    "status": "fetched" if artwork_path else "not_found",
+                    "path": artwork_path
+                }
+            except Exception as e:
+                return {
+                    "artist_id": artist.id,
+                    "name": artist.name,
+                    "status": "error",
+                    "error": str(e)
+                }
+
+    async with httpx.AsyncClient(timeout=30.0, limits=limits) as client:
+        results = await asyncio.gather(*(fetch_one(artist, client) for artist in artists))
 
     fetched = sum(1 for r in results if r["status"] == "fetched")
     return {
@@ -1,13 +1,15 @@
 """Download API endpoints."""
+import uuid
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
+from urllib.parse import urlsplit
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket
 from sqlalchemy.orm import Session
 from datetime import datetime
 
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.models.user import User
-from app.models.download import Download, DownloadStatus, DownloadSource
+from app.models.download import Download, DownloadStatus, DownloadSource, SearchType, QUEUE_STATUSES
 from app.models.pending_review import PendingReview, PendingReviewStatus
 from app.schemas.download import (
     DownloadCreate,
@@ -19,15 +21,59 @@ from app.schemas.download import (
 from app.services.download import DownloadService
 from app.tasks.downloads import download_qobuz_task, download_url_task
 from app.websocket import manager, broadcast_download_queued
+from app.worker import revoke_task
 
 
 router = APIRouter(prefix="/downloads", tags=["downloads"])
 
+# Registrable host -> source for URL downloads; subdomains (www., m.,
+# music., artist.bandcamp.com) resolve through their last two labels
+URL_SOURCE_HOSTS = {
+    "youtube.com": DownloadSource.YOUTUBE,
+    "youtu.be": DownloadSource.YOUTUBE,
+    "bandcamp.com": DownloadSource.BANDCAMP,
+    "soundcloud.com": DownloadSource.SOUNDCLOUD,
+}
+
+
+def detect_url_source(url: str) -> DownloadSource:
+    """Download source for a media URL, from its host alone."""
+    # Bare "youtube.com/watch?v=..." has no netloc unless marked as one
+    host = urlsplit(url if "//" in url else f"//{url}").hostname or ""
+    source = URL_SOURCE_HOSTS.get(host)
+    if source is None:
+        source = URL_SOURCE_HOSTS.get(".".join(host.rsplit(".", 2)[-2:]), DownloadSource.URL)
+    return source
+
+
+def _commit_and_enqueue(db: Session, download: Download, task, *args) -> None:
+    """Commit ``download`` with a pre-assigned task id, then queue ``task``.
+
+    One commit per request: the Celery id is generated here rather than read
+    back from ``delay()``. The row is committed before the task is queued so
+    the worker always finds it; if the broker rejects the task the download
+    is marked failed instead of sitting in pending.
+    """
+    db.flush()
+    download_id = download.id
+    task_id = str(uuid.uuid4())
+    download.celery_task_id = task_id
+    download.started_at = datetime.utcnow()
+    db.commit()
+
+    try:
+        task.apply_async(args=(download_id, *args), task_id=task_id)
+    except Exception as e:
+        download.status = DownloadStatus.FAILED.value
+        download.error_message = f"Could not queue download: {e}"
+        db.commit()
+        raise HTTPException(status_code=503, detail="Download queue unavailable")
+
 
 @router.get("/search/qobuz", response_model=list[SearchResult])
 async def search_qobuz(
     q: str = Query(..., min_length=1, description="Search query"),
-    type: str = Query("album", pattern="^(artist|album|track|playlist)$"),
+    type: SearchType = Query(SearchType.ALBUM),
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
@@ -38,7 +84,7 @@ async def search_qobuz(
     User must select type: artist, album, track, or playlist.
     """
     service = DownloadService(db)
-    return await service.search_qobuz(q, type, limit)
+    return await service.search_qobuz(q, type.value, limit)
 
 
 @router.get("/url/info", response_model=UrlInfo)
@@ -76,15 +122,9 @@ async def download_from_qobuz(
         progress=0
     )
     db.add(download)
-    db.commit()
-    db.refresh(download)
 
     # Start background task
-    task = download_qobuz_task.delay(download.id, data.url, data.quality or 4)
-
-    download.celery_task_id = task.id
-    download.started_at = datetime.utcnow()
-    db.commit()
+    _commit_and_enqueue(db, download, download_qobuz_task, data.url, data.quality or 4)
 
     # Notify frontend in real time
     await broadcast_download_queued(
@@ -108,16 +148,7 @@ async def download_from_url(
 
     Requires confirm_lossy=true for lossy sources.
     """
-    # Detect source
-    url = data.url.lower()
-    if "youtube" in url or "youtu.be" in url:
-        source = DownloadSource.YOUTUBE
-    elif "bandcamp" in url:
-        source = DownloadSource.BANDCAMP
-    elif "soundcloud" in url:
-        source = DownloadSource.SOUNDCLOUD
-    else:
-        source = DownloadSource.URL
+    source = detect_url_source(data.url)
 
     # Require confirmation for lossy sources
     lossy_sources = [DownloadSource.YOUTUBE, DownloadSource.SOUNDCLOUD]
@@ -136,15 +167,9 @@ async def download_from_url(
         progress=0
     )
     db.add(download)
-    db.commit()
-    db.refresh(download)
 
     # Start background task
-    task = download_url_task.delay(download.id, data.url)
-
-    download.celery_task_id = task.id
-    download.started_at = datetime.utcnow()
-    db.commit()
+    _commit_and_enqueue(db, download, download_url_task, data.url)
 
     # Notify frontend in real time
     await broadcast_download_queued(
@@ -159,23 +184,26 @@ async def download_from_url(
 
 
 @router.get("", response_model=list[DownloadResponse])
-async def list_downloads(
-    status: Optional[str] = Query(None, description="Filter by status"),
+def list_downloads(
+    status: Optional[DownloadStatus] = Query(None, description="Filter by status"),
     limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
-    """List download history for current user."""
+    """List download history for current user.
+
+    An unknown status is rejected with 422 before any query runs.
+    """
     query = db.query(Download).filter(Download.user_id == user.id)
 
     if status:
-        query = query.filter(Download.status == status)
+        query = query.filter(Download.status == status.value)
 
     return query.order_by(Download.created_at.desc()).limit(limit).all()
 
 
 @router.get("/queue", response_model=list[DownloadResponse])
-async def get_download_queue(
+def get_download_queue(
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
@@ -184,27 +212,20 @@ async def get_download_queue(
     Returns pending, in-progress, pending_review, and failed downloads.
     """
     query = db.query(Download).filter(
-        Download.status.in_([
-            DownloadStatus.PENDING.value,
-            DownloadStatus.DOWNLOADING.value,
-            DownloadStatus.IMPORTING.value,
-            DownloadStatus.PENDING_REVIEW.value,
-            DownloadStatus.FAILED.value
-        ]),
+        Download.status.in_(QUEUE_STATUSES),
         Download.user_id == user.id
     )
 
     return query.order_by(Download.created_at.asc()).all()
 
 
-@router.get("/{download_id}", response_model=DownloadResponse)
-async def get_download(
+def get_owned_download(
     download_id: int,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
-):
-    """Get download details."""
-    download = db.query(Download).filter(Download.id == download_id).first()
+) -> Download:
+    """Resolve ``download_id`` to the current user's download (404/403 otherwise)."""
+    download = db.get(Download, download_id)
 
     if not download:
         raise HTTPException(status_code=404, detail="Download not found")
@@ -215,8 +236,14 @@ async def get_download(
     return download
 
 
+@router.get("/{download_id}", response_model=DownloadResponse)
+async def get_download(download: Download = Depends(get_owned_download)):
+    """Get download details."""
+    return download
+
+
 @router.get("/{download_id}/status", response_model=DownloadStatusResponse)
-async def get_download_status(
+def get_download_status(
     download_id: int,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
@@ -224,8 +251,23 @@ async def get_download_status(
     """Get download status for polling.
 
     Lightweight endpoint for status updates when WebSocket unavailable.
+    Reads only the status columns (no ORM object, no URLs or timestamps),
+    in the threadpool so polling never blocks the event loop.
     """
-    download = db.query(Download).filter(Download.id == download_id).first()
+    download = (
+        db.query(
+            Download.id,
+            Download.user_id,
+            Download.status,
+            Download.progress,
+            Download.speed,
+            Download.eta,
+            Download.error_message,
+            Download.result_album_id,
+        )
+        .filter(Download.id == download_id)
+        .first()
+    )
 
     if not download:
         raise HTTPException(status_code=404, detail="Download not found")
@@ -233,24 +275,15 @@ async def get_download_status(
     if download.user_id != user.id:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    return download
+    return DownloadStatusResponse.model_validate(download)
 
 
 @router.post("/{download_id}/cancel")
 async def cancel_download(
-    download_id: int,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    download: Download = Depends(get_owned_download),
+    db: Session = Depends(get_db)
 ):
     """Cancel pending/active download."""
-    download = db.query(Download).filter(Download.id == download_id).first()
-
-    if not download:
-        raise HTTPException(status_code=404, detail="Download not found")
-
-    if download.user_id != user.id:
-        raise HTTPException(status_code=403, detail="Access denied")
-
     cancellable_statuses = [
         DownloadStatus.PENDING.value,
         DownloadStatus.DOWNLOADING.value
@@ -263,31 +296,21 @@ async def cancel_download(
 
     # Cancel Celery task
     if download.celery_task_id:
-        from app.worker import celery_app
-        celery_app.control.revoke(download.celery_task_id, terminate=True)
+        revoke_task(download.celery_task_id)
 
     download.status = DownloadStatus.CANCELLED.value
     download.completed_at = datetime.utcnow()
     db.commit()
 
-    return {"status": "cancelled", "id": download_id}
+    return {"status": "cancelled", "id": download.id}
 
 
 @router.post("/{download_id}/retry", response_model=DownloadResponse)
 async def retry_download(
-    download_id: int,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    download: Download = Depends(get_owned_download),
+    db: Session = Depends(get_db)
 ):
     """Retry a failed download."""
-    download = db.query(Download).filter(Download.id == download_id).first()
-
-    if not download:
-        raise HTTPException(status_code=404, detail="Download not found")
-
-    if download.user_id != user.id:
-        raise HTTPException(status_code=403, detail="Access denied")
-
     if download.status != DownloadStatus.FAILED.value:
         raise HTTPException(
             status_code=400,
@@ -298,41 +321,26 @@ async def retry_download(
     download.status = DownloadStatus.PENDING.value
     download.progress = 0
     download.error_message = None
-    download.started_at = datetime.utcnow()
     download.completed_at = None
-    db.commit()
 
     # Restart the appropriate task based on source
     if download.source == DownloadSource.QOBUZ.value:
-        task = download_qobuz_task.delay(download.id, download.source_url, 4)
+        _commit_and_enqueue(db, download, download_qobuz_task, download.source_url, 4)
     else:
-        task = download_url_task.delay(download.id, download.source_url)
-
-    download.celery_task_id = task.id
-    db.commit()
-    db.refresh(download)
+        _commit_and_enqueue(db, download, download_url_task, download.source_url)
 
     return download
 
 
 @router.delete("/{download_id}")
 async def delete_download(
-    download_id: int,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    download: Download = Depends(get_owned_download),
+    db: Session = Depends(get_db)
 ):
     """Delete download record.
 
     Only completed, failed, or cancelled downloads can be deleted.
     """
-    download = db.query(Download).filter(Download.id == download_id).first()
-
-    if not download:
-        raise HTTPException(status_code=404, detail="Download not found")
-
-    if download.user_id != user.id:
-        raise HTTPException(status_code=403, detail="Access denied")
-
     deletable_statuses = [
         DownloadStatus.COMPLETE.value,
         DownloadStatus.DUPLICATE.value,
@@ -353,10 +361,11 @@ async def delete_download(
         ).first()
         if review and review.status == PendingReviewStatus.PENDING:
             review.status = PendingReviewStatus.REJECTED
-            review.reviewed_by = user.id
+            review.reviewed_by = download.user_id
             review.reviewed_at = datetime.utcnow()
             review.notes = "Dismissed from download queue"
 
+    download_id = download.id
     db.delete(download)
     db.commit()
 
@@ -364,6 +373,17 @@ async def delete_download(
 
 
 # WebSocket endpoint for real-time updates
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    """Park until the client goes away.
+
+    These sockets are push-only: keepalive is uvicorn's protocol-level
+    ping/pong (--ws-ping-interval), so client frames are drained unread
+    rather than decoded and answered.
+    """
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
 @router.websocket("/ws/{download_id}")
 async def websocket_download_progress(
     websocket: WebSocket,
@@ -375,12 +395,8 @@ async def websocket_download_progress(
     """
     await manager.connect(websocket, download_id)
     try:
-        while True:
-            # Keep connection alive, wait for messages
-            data = await websocket.receive_text()
-            # Client can send ping, we just acknowledge
-            await websocket.send_json({"type": "pong"})
-    except WebSocketDisconnect:
+        await _wait_for_disconnect(websocket)
+    finally:
         manager.disconnect(websocket, download_id)
 
 
@@ -392,8 +408,6 @@ async def websocket_global(websocket: WebSocket):
     """
     await manager.connect(websocket)
     try:
-        while True:
-            data = await websocket.receive_text()
-            await websocket.send_json({"type": "pong"})
-    except WebSocketDisconnect:
+        await _wait_for_disconnect(websocket)
+    finally:
         manager.disconnect(websocket)
@@ -2,8 +2,10 @@
 
 Phase 8 of audit-014: REST API for metadata enrichment.
 """
+import asyncio
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -103,9 +105,10 @@ async def enrich_album(
             message=f"Enrichment started for album '{album.title}'"
         )
     else:
-        # Synchronous execution (actually async since we're in async context)
+        # The service mixes lyric fetches with blocking session work (lazy
+        # loads, commits), so it gets its own loop on a worker thread
         service = EnrichmentService(db)
-        result = await service.enrich_album_lyrics(album_id)
+        result = await run_in_threadpool(asyncio.run, service.enrich_album_lyrics(album_id))
         return EnrichmentJobResponse(
             task_id="sync",
             message=f"Enriched {result.enriched}/{result.total} tracks"
@@ -136,9 +139,9 @@ async def enrich_track(
             message=f"Enrichment task started: {task.id}"
         )
     else:
-        # Synchronous execution (actually async since we're in async context)
+        # Off the server loop, as for albums above
         service = EnrichmentService(db)
-        result = await service.enrich_track_lyrics(track)
+        result = await run_in_threadpool(asyncio.run, service.enrich_track_lyrics(track))
         return TrackEnrichmentResponse(
             track_id=track_id,
             success=result.success,
@@ -173,7 +176,7 @@ async def enrich_batch(
 
 
 @router.get("/tracks/missing-lyrics")
-async def get_tracks_missing_lyrics(
+def get_tracks_missing_lyrics(
     limit: int = Query(50, le=200, description="Maximum tracks to return"),
     album_id: Optional[int] = Query(None, description="Filter by album"),
     db: Session = Depends(get_db),
@@ -1,5 +1,5 @@
 """Export API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -9,6 +9,7 @@ from app.models.export import Export, ExportStatus
 from app.schemas.export import ExportCreate, ExportResponse
 from app.services.export_service import ExportService
 from app.tasks.exports import run_export_task
+from app.worker import revoke_task
 
 
 router = APIRouter(prefix="/exports", tags=["exports"])
@@ -42,24 +43,24 @@ async def create_export(
 
 
 @router.get("", response_model=list[ExportResponse])
-async def list_exports(
+def list_exports(
+    limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
-    """List user's exports."""
+    """List user's exports, newest first."""
     query = db.query(Export).filter(Export.user_id == user.id)
 
-    return query.order_by(Export.created_at.desc()).all()
+    return query.order_by(Export.created_at.desc()).limit(limit).all()
 
 
-@router.get("/{export_id}", response_model=ExportResponse)
-async def get_export(
+def get_owned_export(
     export_id: int,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
-):
-    """Get export details."""
-    export = db.query(Export).filter(Export.id == export_id).first()
+) -> Export:
+    """Resolve ``export_id`` to the current user's export (404/403 otherwise)."""
+    export = db.get(Export, export_id)
 
     if not export:
         raise HTTPException(status_code=404, detail="Export not found")
@@ -70,28 +71,24 @@ async def get_export(
     return export
 
 
+@router.get("/{export_id}", response_model=ExportResponse)
+async def get_export(export: Export = Depends(get_owned_export)):
+    """Get export details."""
+    return export
+
+
 @router.post("/{export_id}/cancel")
 async def cancel_export(
-    export_id: int,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    export: Export = Depends(get_owned_export),
+    db: Session = Depends(get_db)
 ):
     """Cancel running export."""
-    export = db.query(Export).filter(Export.id == export_id).first()
-
-    if not export:
-        raise HTTPException(status_code=404, detail="Export not found")
-
-    if export.user_id != user.id:
-        raise HTTPException(status_code=403, detail="Access denied")
-
     if export.status not in [ExportStatus.PENDING, ExportStatus.RUNNING]:
         raise HTTPException(status_code=400, detail="Cannot cancel completed export")
 
     # Cancel Celery task
     if export.celery_task_id:
-        from app.worker import celery_app
-        celery_app.control.revoke(export.celery_task_id, terminate=True)
+        revoke_task(export.celery_task_id)
 
     export.status = ExportStatus.CANCELLED
     db.commit()
@@ -1,6 +1,10 @@
 """Health check endpoints for monitoring and load balancers."""
+import asyncio
+import time
 from pathlib import Path
+from typing import Optional
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 import redis
@@ -12,13 +16,49 @@ from app import __version__
 
 router = APIRouter(tags=["health"])
 
+_redis_client: Optional[redis.Redis] = None
+
+READY_CACHE_SECONDS = 2.5
+# (time.monotonic() of the last database check, its result)
+_last_ready = (float("-inf"), False)
+
+
+def _check_database(db: Session) -> str:
+    db.execute(text("SELECT 1"))
+    return "ok"
+
+
+def _get_redis() -> redis.Redis:
+    """Shared client, so frequent probes reuse pooled connections."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(
+            settings.redis_url,
+            socket_connect_timeout=1,
+            socket_timeout=1,
+            health_check_interval=30,
+            max_connections=16,
+        )
+    return _redis_client
+
+
+def _check_redis() -> str:
+    _get_redis().ping()
+    return "ok"
+
+
+def _is_dir(path: str) -> bool:
+    return Path(path).is_dir()
+
 
 @router.get("/health")
-def health_check(db: Session = Depends(get_db)):
+async def health_check(db: Session = Depends(get_db)):
     """
     Health check endpoint for load balancers and monitoring.
 
-    Returns status of all critical dependencies.
+    Returns status of all critical dependencies. The probes run concurrently
+    in the threadpool, so the response takes as long as the slowest one
+    rather than the sum of all four.
     """
     status = {
         "status": "healthy",
@@ -26,34 +66,32 @@ def health_check(db: Session = Depends(get_db)):
         "checks": {}
     }
 
-    # Database check
-    try:
-        db.execute(text("SELECT 1"))
-        status["checks"]["database"] = "ok"
-    except Exception as e:
-        status["checks"]["database"] = f"error: {str(e)}"
-        status["status"] = "unhealthy"
-
-    # Redis check
-    try:
-        r = redis.from_url(settings.redis_url)
-        r.ping()
-        status["checks"]["redis"] = "ok"
-    except Exception as e:
-        status["checks"]["redis"] = f"error: {str(e)}"
-        status["status"] = "unhealthy"
+    database, redis_status, library_ok, users_ok = await asyncio.gather(
+        run_in_threadpool(_check_database, db),
+        run_in_threadpool(_check_redis),
+        run_in_threadpool(_is_dir, settings.music_library),
+        run_in_threadpool(_is_dir, settings.music_users),
+        return_exceptions=True,
+    )
+
+    # Database and Redis checks
+    for name, result in (("database", database), ("redis", redis_status)):
+        if isinstance(result, Exception):
+            status["checks"][name] = f"error: {str(result)}"
+            status["status"] = "unhealthy"
+        else:
+            status["checks"][name] = result
 
     # Music library path check
-    music_path = Path(settings.music_library)
-    if music_path.exists() and music_path.is_dir():
+    if library_ok is True:
         status["checks"]["music_library"] = "ok"
     else:
         status["checks"]["music_library"] = "not accessible"
-        status["status"] = "degraded"
+        if status["status"] == "healthy":
+            status["status"] = "degraded"
 
     # Users directory check
-    users_path = Path(settings.music_users)
-    if users_path.exists() and users_path.is_dir():
+    if users_ok is True:
         status["checks"]["music_users"] = "ok"
     else:
         status["checks"]["music_users"] = "not accessible"
@@ -69,12 +107,22 @@ def readiness_check(db: Session = Depends(get_db)):
     Readiness check - is the service ready to handle requests?
 
     Used by Kubernetes/orchestrators to determine if traffic can be routed.
+    The answer is reused for READY_CACHE_SECONDS so frequent probes from
+    every orchestrator don't each cost a database round trip.
     """
+    global _last_ready
+    checked_at, ready = _last_ready
+    now = time.monotonic()
+    if now - checked_at < READY_CACHE_SECONDS:
+        return {"ready": ready}
+
     try:
         db.execute(text("SELECT 1"))
-        return {"ready": True}
+        ready = True
     except Exception:
-        return {"ready": False}
+        ready = False
+    _last_ready = (now, ready)
+    return {"ready": ready}
 
 
 @router.get("/live")
@@ -1,19 +1,51 @@
 """Library browsing and user library endpoints."""
-from typing import Optional, List, Dict, Any
+from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.dependencies import get_current_user
+from pydantic import TypeAdapter
+from app.dependencies import (
+    get_current_user,
+    get_cursor_row_id,
+    get_library_service,
+    get_user_library_service,
+)
 from app.services.library import LibraryService
 from app.services.user_library import UserLibraryService
 from app.schemas.artist import ArtistResponse, ArtistListResponse
-from app.schemas.album import AlbumResponse, AlbumDetailResponse, AlbumListResponse
+from app.schemas.album import (
+    AlbumResponse,
+    AlbumDetailResponse,
+    AlbumListResponse,
+    ArtistBrief,
+    TrackBrief,
+)
 from app.schemas.track import TrackResponse
-from app.schemas.common import MessageResponse
+from app.schemas.common import MessageResponse, LibrarySearchResponse
 from app.models.user import User
+from app.utils.responses import json_response
 
 router = APIRouter()
 
+_ALBUM_LIST = TypeAdapter(List[AlbumResponse])
+_ARTIST_LIST = TypeAdapter(List[ArtistResponse])
+_TRACK_LIST = TypeAdapter(List[TrackResponse])
+
+
+def _album_item(album, artist_name: Optional[str], is_hearted: bool) -> AlbumResponse:
+    """Album list row built from a trusted ORM row without field validation."""
+    return AlbumResponse.model_construct(
+        id=album.id,
+        artist_id=album.artist_id,
+        artist_name=artist_name,
+        title=album.title,
+        year=album.year,
+        path=album.path,
+        artwork_path=album.artwork_path,
+        total_tracks=album.total_tracks,
+        available_tracks=album.available_tracks,
+        source=album.source,
+        is_hearted=is_hearted,
+    )
+
 
 # ============================================================================
 # Master Library - Artists
@@ -24,38 +56,42 @@ def list_artists(
     letter: Optional[str] = Query(None, max_length=1),
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
+    after_id: Optional[int] = Depends(get_cursor_row_id),
+    service: LibraryService = Depends(get_library_service),
+    user_lib: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
-    """List all artists in the library."""
-    service = LibraryService(db)
-    user_lib = UserLibraryService(db)
-    result = service.list_artists(letter, page, limit)
+    """List all artists in the library.
+
+    Page with ``cursor`` (returned as ``next_cursor``) rather than ``page``:
+    cursor pages cost the same however deep they are.
+    """
+    result = service.list_artists(letter, page, limit, after_id=after_id)
     hearted_artist_ids = user_lib.get_hearted_artist_ids(user.id)
 
-    items = []
-    for a in result["items"]:
-        artist_data = ArtistResponse.model_validate(a)
-        artist_data.is_hearted = a.id in hearted_artist_ids
-        items.append(artist_data)
+    # One validator call for the whole page, then serialized straight to JSON
+    items = _ARTIST_LIST.validate_python(result["items"], from_attributes=True)
+    for item in items:
+        item.is_hearted = item.id in hearted_artist_ids
 
-    return ArtistListResponse(
+    page = ArtistListResponse.model_construct(
         items=items,
         total=result["total"],
         page=result["page"],
         limit=result["limit"],
+        next_cursor=result["next_cursor"],
     )
+    return json_response(page.model_dump_json())
 
 
 @router.get("/artists/{artist_id}", response_model=ArtistResponse)
 def get_artist(
     artist_id: int,
-    db: Session = Depends(get_db),
+    service: LibraryService = Depends(get_library_service),
+    user_lib: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Get a single artist by ID."""
-    service = LibraryService(db)
-    user_lib = UserLibraryService(db)
     artist = service.get_artist(artist_id)
     if not artist:
         raise HTTPException(status_code=404, detail="Artist not found")
@@ -68,12 +104,10 @@ def get_artist(
 def delete_artist(
     artist_id: int,
     delete_files: bool = Query(True, description="Also delete files from disk"),
-    db: Session = Depends(get_db),
+    service: LibraryService = Depends(get_library_service),
     user: User = Depends(get_current_user),
 ):
     """Delete artist and all their albums from library."""
-    service = LibraryService(db)
-
     success, error = service.delete_artist(artist_id, delete_files)
 
     if not success:
@@ -87,13 +121,11 @@ def delete_artist(
 @router.get("/artists/{artist_id}/albums", response_model=List[AlbumResponse])
 def get_artist_albums(
     artist_id: int,
-    db: Session = Depends(get_db),
+    service: LibraryService = Depends(get_library_service),
+    user_lib: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Get all albums for an artist."""
-    service = LibraryService(db)
-    user_lib = UserLibraryService(db)
-
     # Check artist exists
     artist = service.get_artist(artist_id)
     if not artist:
@@ -102,22 +134,8 @@ def get_artist_albums(
     albums = service.get_artist_albums(artist_id)
     hearted_ids = user_lib.get_hearted_album_ids(user.id)
 
-    return [
-        AlbumResponse(
-            id=a.id,
-            artist_id=a.artist_id,
-            artist_name=artist.name,
-            title=a.title,
-            year=a.year,
-            path=a.path,
-            artwork_path=a.artwork_path,
-            total_tracks=a.total_tracks,
-            available_tracks=a.available_tracks,
-            source=a.source,
-            is_hearted=a.id in hearted_ids,
-        )
-        for a in albums
-    ]
+    items = [_album_item(a, artist.name, a.id in hearted_ids) for a in albums]
+    return json_response(_ALBUM_LIST.dump_json(items))
 
 
 # ============================================================================
@@ -130,80 +148,77 @@ def list_albums(
     letter: Optional[str] = Query(None, max_length=1),
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
+    after_id: Optional[int] = Depends(get_cursor_row_id),
+    service: LibraryService = Depends(get_library_service),
     user: User = Depends(get_current_user),
 ):
-    """List albums with optional filters."""
-    service = LibraryService(db)
-    user_lib = UserLibraryService(db)
+    """List albums with optional filters.
 
-    result = service.list_albums(artist_id, letter, page, limit)
-    hearted_ids = user_lib.get_hearted_album_ids(user.id)
+    Page with ``cursor`` (returned as ``next_cursor``) rather than ``page``.
+    """
 
+    result = service.list_albums(artist_id, letter, page, limit, user_id=user.id, after_id=after_id)
+    hearted_ids = result["hearted_ids"]
+    artist_names = result["artist_names"]
+
+    # Rows are trusted, so the page is assembled with model_construct and
+    # serialized to JSON in one pydantic-core pass, skipping FastAPI's
+    # re-validation against response_model
     items = [
-        AlbumResponse(
-            id=a.id,
-            artist_id=a.artist_id,
-            artist_name=a.artist.name if a.artist else None,
-            title=a.title,
-            year=a.year,
-            path=a.path,
-            artwork_path=a.artwork_path,
-            total_tracks=a.total_tracks,
-            available_tracks=a.available_tracks,
-            source=a.source,
-            is_hearted=a.id in hearted_ids,
-        )
+        _album_item(a, artist_names[a.id], a.id in hearted_ids)
         for a in result["items"]
     ]
-
-    return AlbumListResponse(
+    page = AlbumListResponse.model_construct(
         items=items,
         total=result["total"],
         page=result["page"],
         limit=result["limit"],
+        next_cursor=result["next_cursor"],
     )
+    return json_response(page.model_dump_json())
 
 
 @router.get("/albums/{album_id}", response_model=AlbumDetailResponse)
 def get_album(
     album_id: int,
-    db: Session = Depends(get_db),
+    service: LibraryService = Depends(get_library_service),
+    user_lib: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Get album details with tracks."""
-    service = LibraryService(db)
-    user_lib = UserLibraryService(db)
-
     album = service.get_album(album_id)
     if not album:
         raise HTTPException(status_code=404, detail="Album not found")
 
     is_hearted = user_lib.is_album_hearted(user.id, album_id)
 
-    # Get tracks for this album
-    tracks = service.get_album_tracks(album_id)
+    # Artist is already loaded; the tracks need only their own columns here,
+    # so read them off the album rather than re-joining album and artist
+    tracks = album.tracks.all()
     hearted_track_ids = user_lib.get_hearted_track_ids(user.id)
 
+    # Built from trusted ORM rows with model_construct and returned as a
+    # ready response: no per-field validation of every track, and FastAPI
+    # skips re-validating the whole payload against response_model
     track_list = [
-        {
-            "id": t.id,
-            "title": t.title,
-            "track_number": t.track_number,
-            "disc_number": t.disc_number,
-            "duration": t.duration,
-            "path": t.path,
-            "sample_rate": t.sample_rate,
-            "bit_depth": t.bit_depth,
-            "format": t.format,
-            "is_lossy": t.is_lossy,
-            "quality_display": t.quality_display,
-            "is_hearted": t.id in hearted_track_ids,
-        }
+        TrackBrief.model_construct(
+            id=t.id,
+            title=t.title,
+            track_number=t.track_number,
+            disc_number=t.disc_number,
+            duration=t.duration,
+            path=t.path,
+            sample_rate=t.sample_rate,
+            bit_depth=t.bit_depth,
+            format=t.format,
+            is_lossy=t.is_lossy,
+            quality_display=t.quality_display,
+            is_hearted=t.id in hearted_track_ids,
+        )
         for t in tracks
     ]
 
-    return AlbumDetailResponse(
+    detail = AlbumDetailResponse.model_construct(
         id=album.id,
         artist_id=album.artist_id,
         artist_name=album.artist.name,
@@ -215,7 +230,7 @@ def get_album(
         available_tracks=album.available_tracks,
         source=album.source,
         is_hearted=is_hearted,
-        artist={"id": album.artist.id, "name": album.artist.name},
+        artist=ArtistBrief.model_construct(id=album.artist.id, name=album.artist.name),
         tracks=track_list,
         disc_count=album.disc_count,
         genre=album.genre,
@@ -223,18 +238,17 @@ def get_album(
         musicbrainz_id=album.musicbrainz_id,
         created_at=album.created_at,
     )
+    return json_response(detail.model_dump_json())
 
 
 @router.get("/albums/{album_id}/tracks", response_model=List[TrackResponse])
 def get_album_tracks(
     album_id: int,
-    db: Session = Depends(get_db),
+    service: LibraryService = Depends(get_library_service),
+    user_lib: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Get all tracks for an album."""
-    service = LibraryService(db)
-    user_lib = UserLibraryService(db)
-
     album = service.get_album(album_id)
     if not album:
         raise HTTPException(status_code=404, detail="Album not found")
@@ -242,22 +256,17 @@ def get_album_tracks(
     tracks = service.get_album_tracks(album_id)
     hearted_ids = user_lib.get_hearted_track_ids(user.id)
 
-    return [
-        TrackResponse.from_orm_with_quality(t, t.id in hearted_ids)
-        for t in tracks
-    ]
+    return json_response(_TRACK_LIST.dump_json(TrackResponse.from_orm_batch(tracks, hearted_ids)))
 
 
 @router.delete("/albums/{album_id}", response_model=MessageResponse)
 def delete_album(
     album_id: int,
     delete_files: bool = Query(True, description="Also delete files from disk"),
-    db: Session = Depends(get_db),
+    service: LibraryService = Depends(get_library_service),
     user: User = Depends(get_current_user),
 ):
     """Delete album from library."""
-    service = LibraryService(db)
-
     success, error = service.delete_album(album_id, delete_files)
 
     if not success:
@@ -272,52 +281,42 @@ def delete_album(
 # Search
 # ============================================================================
 
-@router.get("/search")
+@router.get("/search", response_model=LibrarySearchResponse)
 def search(
     q: str = Query(..., min_length=1),
     type: str = Query("all", pattern="^(all|artist|album|track)$"),
     limit: int = Query(20, ge=1, le=50),
-    db: Session = Depends(get_db),
+    service: LibraryService = Depends(get_library_service),
+    user_lib: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
-) -> Dict[str, Any]:
+):
     """Search the library."""
-    service = LibraryService(db)
-    user_lib = UserLibraryService(db)
-
     results = service.search(q, type, limit)
-    hearted_album_ids = user_lib.get_hearted_album_ids(user.id)
-    hearted_track_ids = user_lib.get_hearted_track_ids(user.id)
-    hearted_artist_ids = user_lib.get_hearted_artist_ids(user.id)
-
-    artists_with_hearted = []
-    for a in results["artists"]:
-        artist_data = ArtistResponse.model_validate(a)
-        artist_data.is_hearted = a.id in hearted_artist_ids
-        artists_with_hearted.append(artist_data)
-
-    return {
-        "artists": artists_with_hearted,
-        "albums": [
-            AlbumResponse(
-                id=a.id,
-                artist_id=a.artist_id,
-                artist_name=a.artist.name if a.artist else None,
-                title=a.title,
-                year=a.year,
-                path=a.path,
-                artwork_path=a.artwork_path,
-                total_tracks=a.total_tracks,
-                available_tracks=a.available_tracks,
-                source=a.source,
-                is_hearted=a.id in hearted_album_ids,
-            )
+    # Only look up hearts for the categories that have results, all in one
+    # cache round trip
+    hearted = user_lib.get_hearted_ids(
+        user.id, [kind for kind in ("artist", "album", "track") if results[f"{kind}s"]]
+    )
+    hearted_album_ids = hearted.get("album", frozenset())
+    hearted_track_ids = hearted.get("track", frozenset())
+    hearted_artist_ids = hearted.get("artist", frozenset())
+
+    artists_with_hearted = _ARTIST_LIST.validate_python(results["artists"], from_attributes=True)
+    for artist in artists_with_hearted:
+        artist.is_hearted = artist.id in hearted_artist_ids
+
+    # Declared as a model and encoded by pydantic-core: as a bare dict of
+    # models it went through jsonable_encoder, the slowest path for the
+    # largest payload in the library
+    payload = LibrarySearchResponse.model_construct(
+        artists=artists_with_hearted,
+        albums=[
+            _album_item(a, results["artist_names"][a.id], a.id in hearted_album_ids)
             for a in results["albums"]
         ],
-        "tracks": [
-            TrackResponse.from_orm_with_quality(t, t.id in hearted_track_ids)
-            for t in results["tracks"]
-        ],
-    }
+        tracks=TrackResponse.from_orm_batch(results["tracks"], hearted_track_ids),
+    )
+    return json_response(payload.model_dump_json())
 
 
 # ============================================================================
@@ -328,36 +327,28 @@ def search(
 def get_user_library(
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
+    after_id: Optional[int] = Depends(get_cursor_row_id),
+    service: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
-    """Get current user's hearted albums."""
-    service = UserLibraryService(db)
-    result = service.get_library(user.id, page, limit)
+    """Get current user's hearted albums.
+
+    Page with ``cursor`` (returned as ``next_cursor``) rather than ``page``.
+    """
+    result = service.get_library(user.id, page, limit, after_id=after_id)
 
     items = [
-        AlbumResponse(
-            id=a.id,
-            artist_id=a.artist_id,
-            artist_name=a.artist.name if a.artist else None,
-            title=a.title,
-            year=a.year,
-            path=a.path,
-            artwork_path=a.artwork_path,
-            total_tracks=a.total_tracks,
-            available_tracks=a.available_tracks,
-            source=a.source,
-            is_hearted=True,
-        )
+        _album_item(a, a.artist.name if a.artist else None, True)
         for a in result["items"]
     ]
-
-    return AlbumListResponse(
+    page = AlbumListResponse.model_construct(
         items=items,
         total=result["total"],
         page=result["page"],
         limit=result["limit"],
+        next_cursor=result["next_cursor"],
     )
+    return json_response(page.model_dump_json())
 
 
 @router.get("/me/library/artists", response_model=ArtistListResponse)
@@ -365,33 +356,31 @@ def get_user_library_artists(
     letter: Optional[str] = Query(None, max_length=1),
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
+    service: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Get artists in current user's library (artists with hearted albums)."""
-    service = UserLibraryService(db)
     result = service.get_library_artists(user.id, letter, page, limit)
 
-    items = [
-        ArtistResponse.model_validate(a)
-        for a in result["items"]
-    ]
+    items = _ARTIST_LIST.validate_python(result["items"], from_attributes=True)
     # Mark all as hearted
     for item in items:
         item.is_hearted = True
 
-    return ArtistListResponse(
+    page = ArtistListResponse.model_construct(
         items=items,
         total=result["total"],
         page=result["page"],
         limit=result["limit"],
+        next_cursor=None,
     )
+    return json_response(page.model_dump_json())
 
 
 @router.get("/me/library/artists/{artist_id}/albums", response_model=List[AlbumResponse])
 def get_user_library_artist_albums(
     artist_id: int,
-    db: Session = Depends(get_db),
+    service: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Get user's library albums for a specific artist.
@@ -400,55 +389,39 @@ def get_user_library_artist_albums(
     - Hearted directly (is_hearted=True), OR
     - Contain at least one hearted track (is_hearted=False)
     """
-    service = UserLibraryService(db)
     albums = service.get_library_artist_albums(user.id, artist_id)
 
     if not albums:
         raise HTTPException(status_code=404, detail="No albums found for this artist in your library")
 
-    return [
-        AlbumResponse(
-            id=a.id,
-            artist_id=a.artist_id,
-            artist_name=a.artist.name if a.artist else None,
-            title=a.title,
-            year=a.year,
-            path=a.path,
-            artwork_path=a.artwork_path,
-            total_tracks=a.total_tracks,
-            available_tracks=a.available_tracks,
-            source=a.source,
-            is_hearted=a.is_hearted,  # Use actual value from service
-        )
-        for a in albums
-    ]
+    # is_hearted is the actual value set by the service
+    items = [_album_item(a, a.artist.name if a.artist else None, a.is_hearted) for a in albums]
+    return json_response(_ALBUM_LIST.dump_json(items))
 
 
 @router.get("/me/library/tracks", response_model=List[TrackResponse])
 def get_user_library_tracks(
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
+    service: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Get current user's hearted tracks."""
-    service = UserLibraryService(db)
     result = service.get_library_tracks(user.id, page, limit)
 
-    return [
-        TrackResponse.from_orm_with_quality(t, is_hearted=True, include_album=True)
-        for t in result["items"]
-    ]
+    # Every track in the user's library is hearted
+    tracks = result["items"]
+    items = TrackResponse.from_orm_batch(tracks, {t.id for t in tracks}, include_album=True)
+    return json_response(_TRACK_LIST.dump_json(items))
 
 
 @router.post("/me/library/albums/{album_id}", response_model=MessageResponse)
 def heart_album(
     album_id: int,
-    db: Session = Depends(get_db),
+    service: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Heart an album (add to user library)."""
-    service = UserLibraryService(db)
     try:
         if service.heart_album(user.id, album_id, user.username):
             return MessageResponse(message="Album added to library")
@@ -460,11 +433,10 @@ def heart_album(
 @router.delete("/me/library/albums/{album_id}", response_model=MessageResponse)
 def unheart_album(
     album_id: int,
-    db: Session = Depends(get_db),
+    service: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Unheart an album (remove from user library)."""
-    service = UserLibraryService(db)
     if service.unheart_album(user.id, album_id, user.username):
         return MessageResponse(message="Album removed from library")
     return MessageResponse(message="Album not in library")
@@ -473,11 +445,10 @@ def unheart_album(
 @router.post("/me/library/tracks/{track_id}", response_model=MessageResponse)
 def heart_track(
     track_id: int,
-    db: Session = Depends(get_db),
+    service: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Heart a track (add to user library)."""
-    service = UserLibraryService(db)
     try:
         if service.heart_track(user.id, track_id, user.username):
             return MessageResponse(message="Track added to library")
@@ -489,11 +460,10 @@ def heart_track(
 @router.delete("/me/library/tracks/{track_id}", response_model=MessageResponse)
 def unheart_track(
     track_id: int,
-    db: Session = Depends(get_db),
+    service: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Unheart a track (remove from user library)."""
-    service = UserLibraryService(db)
     if service.unheart_track(user.id, track_id, user.username):
         return MessageResponse(message="Track removed from library")
     return MessageResponse(message="Track not in library")
@@ -502,11 +472,10 @@ def unheart_track(
 @router.post("/me/library/artists/{artist_id}", response_model=MessageResponse)
 def heart_artist(
     artist_id: int,
-    db: Session = Depends(get_db),
+    service: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Heart all albums by an artist (add to user library)."""
-    service = UserLibraryService(db)
     try:
         count = service.heart_artist(user.id, artist_id, user.username)
         if count > 0:
@@ -519,11 +488,10 @@ def heart_artist(
 @router.delete("/me/library/artists/{artist_id}", response_model=MessageResponse)
 def unheart_artist(
     artist_id: int,
-    db: Session = Depends(get_db),
+    service: UserLibraryService = Depends(get_user_library_service),
     user: User = Depends(get_current_user),
 ):
     """Unheart all albums by an artist (remove from user library)."""
-    service = UserLibraryService(db)
     try:
         count = service.unheart_artist(user.id, artist_id, user.username)
         if count > 0:
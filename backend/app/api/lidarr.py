@@ -5,7 +5,7 @@ from pydantic import BaseModel
 from typing import Optional
 
 from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, get_lidarr_client
 from app.models.user import User
 from app.integrations.lidarr import LidarrClient, LidarrError
 
@@ -22,10 +22,10 @@ class AddArtistRequest(BaseModel):
 
 @router.get("/status")
 async def check_lidarr_status(
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    client: LidarrClient = Depends(get_lidarr_client),
 ):
     """Check Lidarr connection status."""
-    client = LidarrClient()
     connected = await client.test_connection()
 
     return {
@@ -36,11 +36,10 @@ async def check_lidarr_status(
 
 @router.get("/artists")
 async def list_monitored_artists(
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    client: LidarrClient = Depends(get_lidarr_client),
 ):
     """List monitored artists in Lidarr."""
-    client = LidarrClient()
-
     try:
         artists = await client.get_artists()
         return {
@@ -63,11 +62,10 @@ async def list_monitored_artists(
 @router.get("/search")
 async def search_lidarr(
     q: str,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    client: LidarrClient = Depends(get_lidarr_client),
 ):
     """Search for artists via Lidarr."""
-    client = LidarrClient()
-
     try:
         results = await client.search_artist(q)
         return {
@@ -90,11 +88,10 @@ async def search_lidarr(
 async def add_artist_to_lidarr(
     data: AddArtistRequest,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    client: LidarrClient = Depends(get_lidarr_client),
 ):
     """Add artist to Lidarr for monitoring."""
-    client = LidarrClient()
-
     try:
         result = await client.add_artist(
             mbid=data.mbid,
@@ -113,11 +110,10 @@ async def add_artist_to_lidarr(
 
 @router.get("/queue")
 async def get_lidarr_queue(
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    client: LidarrClient = Depends(get_lidarr_client),
 ):
     """Get Lidarr download queue."""
-    client = LidarrClient()
-
     try:
         queue = await client.get_queue()
         return {
@@ -140,11 +136,10 @@ async def get_lidarr_queue(
 @router.get("/history")
 async def get_lidarr_history(
     limit: int = 50,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    client: LidarrClient = Depends(get_lidarr_client),
 ):
     """Get Lidarr download history."""
-    client = LidarrClient()
-
     try:
         history = await client.get_history(limit=limit)
         return {
@@ -1,7 +1,9 @@
 """Metadata editing endpoints."""
+import os
 from typing import Optional
 from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import String, func, select, update
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
@@ -66,15 +68,15 @@ async def update_album_metadata(
     if data.label is not None:
         album.label = data.label
 
-    # Update file tags for all tracks
-    for track in album.tracks:
-        track_path = Path(track.path)
-        if track_path.exists():
-            await exiftool.write_metadata(
-                track_path,
-                album=data.title or album.title,
-                year=data.year or album.year
-            )
+    # Update file tags for all tracks; only their paths are needed
+    track_paths = db.scalars(
+        select(Track.path).where(Track.album_id == album_id, Track.path.is_not(None))
+    ).all()
+    await exiftool.write_metadata_many(
+        [Path(path) for path in track_paths if Path(path).exists()],
+        album=data.title or album.title,
+        year=data.year or album.year
+    )
 
     db.commit()
     return {"status": "updated"}
@@ -150,24 +152,33 @@ async def update_artist_metadata(
             old_path.rename(new_path)
             artist.path = str(new_path)
 
-            # Update all album paths
-            for album in artist.albums:
-                if album.path:
-                    album.path = album.path.replace(str(old_path), str(new_path))
-                    for track in album.tracks:
-                        if track.path:
-                            track.path = track.path.replace(str(old_path), str(new_path))
+            # Rewrite album and track paths under the old folder in the
+            # database, two statements however large the catalog
+            old_prefix = f"{old_path}{os.sep}"
+            new_prefix = f"{new_path}{os.sep}"
+            artist_album_ids = select(Album.id).where(Album.artist_id == artist_id)
+            for model, owned in (
+                (Album, Album.artist_id == artist_id),
+                (Track, Track.album_id.in_(artist_album_ids)),
+            ):
+                db.execute(
+                    update(model)
+                    .where(owned, model.path.startswith(old_prefix, autoescape=True))
+                    .values(path=new_prefix + func.substr(model.path, len(old_prefix) + 1, type_=String))
+                    .execution_options(synchronize_session=False)
+                )
 
     # Update file tags
+    track_paths = db.scalars(
+        select(Track.path)
+        .join(Album, Track.album_id == Album.id)
+        .where(Album.artist_id == artist_id, Track.path.is_not(None))
+    ).all()
     exiftool = ExifToolClient()
-    for album in artist.albums:
-        for track in album.tracks:
-            track_path = Path(track.path) if track.path else None
-            if track_path and track_path.exists():
-                await exiftool.write_metadata(
-                    track_path,
-                    artist=new_name
-                )
+    await exiftool.write_metadata_many(
+        [Path(path) for path in track_paths if Path(path).exists()],
+        artist=new_name
+    )
 
     db.commit()
     return {"status": "updated", "old_name": old_name, "new_name": new_name}
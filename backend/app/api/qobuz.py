@@ -5,7 +5,9 @@ Downloads still use streamrip via the /downloads endpoints.
 """
 from typing import Optional, List
 from fastapi import APIRouter, Query, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 
 from app.integrations.qobuz_api import get_qobuz_api, QobuzAPIError
@@ -13,13 +15,16 @@ from app.dependencies import get_current_user
 from app.database import get_db
 from app.models.user import User
 from app.models.album import Album
+from app.models.artist import Artist
 from app.utils.normalize import normalize_text
+from app.utils.responses import json_response
 
 
 router = APIRouter(prefix="/qobuz", tags=["qobuz"])
 
 
-# Response schemas
+# Response schemas. Results are built with model_construct from the dicts
+# QobuzAPI._parse_* already shaped, so they must keep matching these fields.
 class AlbumResult(BaseModel):
     """Qobuz album search result."""
     id: str
@@ -100,25 +105,25 @@ class AlbumDetailResponse(AlbumResult):
 def check_albums_in_library(db: Session, albums: List[dict]) -> List[dict]:
     """Check which Qobuz albums exist in local library.
 
-    Matches by normalized artist + album title.
+    Matches by normalized artist + album title, for the whole list in one
+    query.
     """
-    for album in albums:
-        # Normalize for comparison
-        artist_norm = normalize_text(album["artist_name"])
-        title_norm = normalize_text(album["title"])
-
-        # Check if exists locally (using has() for relationship filter)
-        local = db.query(Album).filter(
-            Album.normalized_title == title_norm,
-            Album.artist.has(normalized_name=artist_norm)
-        ).first()
-
-        if local:
-            album["in_library"] = True
-            album["local_album_id"] = local.id
-        else:
-            album["in_library"] = False
-            album["local_album_id"] = None
+    keys = [(normalize_text(album["title"]), normalize_text(album["artist_name"])) for album in albums]
+
+    local_ids = {}
+    if keys:
+        rows = (
+            db.query(Album.id, Album.normalized_title, Artist.normalized_name)
+            .join(Album.artist)
+            .filter(tuple_(Album.normalized_title, Artist.normalized_name).in_(set(keys)))
+            .order_by(Album.id)
+        )
+        for album_id, title_norm, artist_norm in rows:
+            local_ids.setdefault((title_norm, artist_norm), album_id)
+
+    for album, key in zip(albums, keys):
+        album["local_album_id"] = local_ids.get(key)
+        album["in_library"] = album["local_album_id"] is not None
 
     return albums
 
@@ -146,29 +151,30 @@ async def search_qobuz(
         if type == "album":
             items = await api.search_albums(q, limit)
             # Check which albums are already in library
-            items = check_albums_in_library(db, items)
-            return SearchResponse(
+            items = await run_in_threadpool(check_albums_in_library, db, items)
+            response = SearchResponse(
                 query=q,
                 type=type,
                 count=len(items),
-                albums=[AlbumResult(**item) for item in items],
+                albums=[AlbumResult.model_construct(**item) for item in items],
             )
         elif type == "artist":
             items = await api.search_artists(q, limit)
-            return SearchResponse(
+            response = SearchResponse(
                 query=q,
                 type=type,
                 count=len(items),
-                artists=[ArtistResult(**item) for item in items],
+                artists=[ArtistResult.model_construct(**item) for item in items],
             )
         elif type == "track":
             items = await api.search_tracks(q, limit)
-            return SearchResponse(
+            response = SearchResponse(
                 query=q,
                 type=type,
                 count=len(items),
-                tracks=[TrackResult(**item) for item in items],
+                tracks=[TrackResult.model_construct(**item) for item in items],
             )
+        return json_response(response.model_dump_json())
     except QobuzAPIError as e:
         raise HTTPException(status_code=502, detail=str(e))
 
@@ -193,7 +199,7 @@ async def get_qobuz_artist(
 
         # Check which albums are in library
         if artist.get("albums"):
-            artist["albums"] = check_albums_in_library(db, artist["albums"])
+            artist["albums"] = await run_in_threadpool(check_albums_in_library, db, artist["albums"])
 
             # Filter explicit only
             if explicit_only:
@@ -207,7 +213,7 @@ async def get_qobuz_artist(
             elif sort == "popularity":
                 artist["albums"].sort(key=lambda a: a.get("popularity", 0), reverse=True)
 
-        return ArtistDetailResponse(
+        response = ArtistDetailResponse.model_construct(
             id=artist["id"],
             name=artist["name"],
             biography=artist.get("biography", ""),
@@ -216,8 +222,9 @@ async def get_qobuz_artist(
             image_medium=artist.get("image_medium", ""),
             image_large=artist.get("image_large", ""),
             image_url=artist.get("image_url", ""),
-            albums=[AlbumResult(**a) for a in artist.get("albums", [])],
+            albums=[AlbumResult.model_construct(**a) for a in artist.get("albums", [])],
         )
+        return json_response(response.model_dump_json())
     except QobuzAPIError as e:
         raise HTTPException(status_code=502, detail=str(e))
 
@@ -239,10 +246,10 @@ async def get_qobuz_album(
         album = await api.get_album(album_id)
 
         # Check if this album is in library
-        albums_checked = check_albums_in_library(db, [album])
+        albums_checked = await run_in_threadpool(check_albums_in_library, db, [album])
         album = albums_checked[0]
 
-        return AlbumDetailResponse(
+        response = AlbumDetailResponse.model_construct(
             id=album["id"],
             title=album["title"],
             artist_id=album["artist_id"],
@@ -263,7 +270,8 @@ async def get_qobuz_album(
             url=album.get("url", ""),
             in_library=album.get("in_library", False),
             local_album_id=album.get("local_album_id"),
-            tracks=[TrackResult(**t) for t in album.get("tracks", [])],
+            tracks=[TrackResult.model_construct(**t) for t in album.get("tracks", [])],
         )
+        return json_response(response.model_dump_json())
     except QobuzAPIError as e:
         raise HTTPException(status_code=502, detail=str(e))
@@ -2,9 +2,12 @@
 from typing import Optional
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from pathlib import Path
 import shutil
+import uuid
 
 from app.database import get_db
 from app.dependencies import get_current_admin_user, get_current_user
@@ -16,13 +19,16 @@ from app.services.import_service import ImportService
 from app.integrations.beets import BeetsClient
 from app.integrations.exiftool import ExifToolClient
 from app.config import settings
+from app.utils.responses import json_response
 
 
 router = APIRouter(prefix="/import/review", tags=["review"])
 
+_REVIEW_LIST = TypeAdapter(list[ReviewResponse])
+
 
 @router.get("", response_model=list[ReviewResponse])
-async def list_pending_review(
+def list_pending_review(
     status: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
@@ -35,25 +41,26 @@ async def list_pending_review(
     else:
         query = query.filter(PendingReview.status == PendingReviewStatus.PENDING)
 
-    return query.all()
+    return json_response(_REVIEW_LIST.dump_json(_REVIEW_LIST.validate_python(query.all())))
 
 
 @router.get("/failed", response_model=list[ReviewResponse])
-async def list_failed_reviews(
+def list_failed_reviews(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """List reviews that failed during processing."""
-    return (
+    reviews = (
         db.query(PendingReview)
         .filter(PendingReview.status == PendingReviewStatus.FAILED)
         .order_by(PendingReview.created_at.desc())
         .all()
     )
+    return json_response(_REVIEW_LIST.dump_json(_REVIEW_LIST.validate_python(reviews)))
 
 
 @router.get("/{review_id}", response_model=ReviewResponse)
-async def get_review_item(
+def get_review_item(
     review_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
@@ -63,6 +70,21 @@ async def get_review_item(
     if not review:
         raise HTTPException(status_code=404, detail="Review item not found")
 
+    return json_response(ReviewResponse.model_validate(review).model_dump_json())
+
+
+def _get_pending_review(db: Session, review_id: int) -> PendingReview:
+    """Review still awaiting a decision, else 404/400.
+
+    The approve/reject handlers are async (they await beets and the file
+    moves), so they run this lookup in the threadpool.
+    """
+    review = db.query(PendingReview).filter(PendingReview.id == review_id).first()
+    if not review:
+        raise HTTPException(status_code=404, detail="Review item not found")
+
+    if review.status != PendingReviewStatus.PENDING:
+        raise HTTPException(status_code=400, detail="Item already processed")
     return review
 
 
@@ -77,12 +99,7 @@ async def approve_import(
 
     Can override artist/album/year if auto-detection was wrong.
     """
-    review = db.query(PendingReview).filter(PendingReview.id == review_id).first()
-    if not review:
-        raise HTTPException(status_code=404, detail="Review item not found")
-
-    if review.status != PendingReviewStatus.PENDING:
-        raise HTTPException(status_code=400, detail="Item already processed")
+    review = await run_in_threadpool(_get_pending_review, db, review_id)
 
     try:
         beets = BeetsClient()
@@ -147,6 +164,28 @@ async def approve_import(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _set_aside(folder: Path, delete_files: bool) -> Optional[Path]:
+    """Delete a rejected folder, or move it under import/rejected.
+
+    Returns where the folder was moved to. Both walk every file, which can
+    take seconds on a network mount, so callers run this in the threadpool.
+    """
+    if not folder.exists():
+        return None
+    if delete_files:
+        shutil.rmtree(folder)
+        return None
+
+    rejected_dir = Path(settings.music_import) / "rejected"
+    rejected_dir.mkdir(parents=True, exist_ok=True)
+    rejected_path = rejected_dir / folder.name
+    if rejected_path.exists():
+        # Random suffix rather than probing name_1, name_2, ... one stat at a time
+        rejected_path = rejected_dir / f"{folder.name}_{uuid.uuid4().hex[:8]}"
+    shutil.move(str(folder), str(rejected_path))
+    return rejected_path
+
+
 @router.post("/{review_id}/reject")
 async def reject_import(
     review_id: int,
@@ -155,30 +194,12 @@ async def reject_import(
     current_user: User = Depends(get_current_user)
 ):
     """Reject and optionally delete pending item."""
-    review = db.query(PendingReview).filter(PendingReview.id == review_id).first()
-    if not review:
-        raise HTTPException(status_code=404, detail="Review item not found")
+    review = await run_in_threadpool(_get_pending_review, db, review_id)
 
-    if review.status != PendingReviewStatus.PENDING:
-        raise HTTPException(status_code=400, detail="Item already processed")
-
-    # Optionally delete files
-    folder = Path(review.path)
-    if data.delete_files:
-        if folder.exists():
-            shutil.rmtree(folder)
-    else:
-        # Move to rejected folder
-        if folder.exists():
-            rejected_dir = Path(settings.music_import) / "rejected"
-            rejected_dir.mkdir(parents=True, exist_ok=True)
-            rejected_path = rejected_dir / folder.name
-            counter = 1
-            while rejected_path.exists():
-                rejected_path = rejected_dir / f"{folder.name}_{counter}"
-                counter += 1
-            shutil.move(str(folder), str(rejected_path))
-            review.path = str(rejected_path)
+    # Delete files or move them to the rejected folder, off the event loop
+    moved_to = await run_in_threadpool(_set_aside, Path(review.path), data.delete_files)
+    if moved_to is not None:
+        review.path = str(moved_to)
 
     review.status = PendingReviewStatus.REJECTED
     review.reviewed_by = current_user.id
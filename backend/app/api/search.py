@@ -1,8 +1,10 @@
 """Unified search API endpoint."""
 from fastapi import APIRouter, Query, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Any
+import asyncio
 import logging
 
 from app.database import get_db
@@ -10,6 +12,7 @@ from app.dependencies import get_current_user
 from app.models.user import User
 from app.services.library import LibraryService
 from app.services.download import DownloadService
+from app.utils.responses import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -59,20 +62,34 @@ async def unified_search(
     """
     Unified search endpoint.
 
-    1. Always searches local library first
-    2. If include_external=True AND local results empty, searches Qobuz
+    1. Always searches local library
+    2. If include_external=True, searches Qobuz at the same time and
+       returns those results only when the local ones are empty
     3. Returns both result sets with source indicators
 
     Note: Playlist type excluded per contracts.md line 94
     """
     library_service = LibraryService(db)
 
+    # With include_external, Qobuz is searched alongside the library and
+    # dropped if the library has results, so a local miss costs the slower
+    # of the two searches rather than both
+    qobuz_search = None
+    if include_external:
+        qobuz_search = asyncio.create_task(DownloadService(db).search_qobuz(q, type, limit))
+        # Retrieve any failure so a dropped search is not logged as unhandled
+        qobuz_search.add_done_callback(lambda task: task.cancelled() or task.exception())
+
     # Local search
+    local_results = None
     try:
-        local_results = library_service.search(q, type, limit)
+        local_results = await run_in_threadpool(library_service.search, q, type, limit)
     except Exception as e:
         logger.error(f"Local search failed: {e}")
         raise HTTPException(status_code=500, detail="Search failed")
+    finally:
+        if qobuz_search and local_results is None:
+            qobuz_search.cancel()
 
     # Build response - convert ORM objects to dicts
     albums = [
@@ -82,7 +99,7 @@ async def unified_search(
             "year": a.year,
             "artwork_path": a.artwork_path,
             "artist_id": a.artist_id,
-            "artist_name": a.artist.name if a.artist else None,
+            "artist_name": local_results["artist_names"].get(a.id),
             "source": getattr(a, 'source', None),
             "status": a.status
         }
@@ -93,7 +110,7 @@ async def unified_search(
             "id": a.id,
             "name": a.name,
             "sort_name": a.sort_name,
-            "album_count": len(a.albums) if hasattr(a, 'albums') else 0
+            "album_count": local_results["album_counts"].get(a.id, 0)
         }
         for a in local_results.get("artists", [])
     ]
@@ -124,11 +141,12 @@ async def unified_search(
         external=None
     )
 
-    # External search (on demand, only if local empty)
-    if include_external and response.local.count == 0:
-        download_service = DownloadService(db)
+    # External results (on demand, only if local empty)
+    if qobuz_search and response.local.count > 0:
+        qobuz_search.cancel()
+    elif qobuz_search:
         try:
-            qobuz_results = await download_service.search_qobuz(q, type, limit)
+            qobuz_results = await qobuz_search
             response.external = ExternalResults(
                 source="qobuz",
                 count=len(qobuz_results) if qobuz_results else 0,
@@ -143,4 +161,4 @@ async def unified_search(
                 error=str(e)
             )
 
-    return response
+    return json_response(response.model_dump_json())
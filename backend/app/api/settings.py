@@ -1,13 +1,14 @@
 """Settings API endpoints."""
+import asyncio
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Awaitable, Callable
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, get_lidarr_client
 from app.models.user import User
 from app.config import get_settings
 from app.integrations.lidarr import LidarrClient
@@ -69,31 +70,33 @@ class SettingsUpdate(BaseModel):
     plex_auto_scan: Optional[bool] = None
 
 
+async def _probe_connection(test: Callable[[], Awaitable[bool]]) -> bool:
+    """Result of a connection test, with any error counted as not connected."""
+    try:
+        return await test()
+    except Exception:
+        return False
+
+
 @router.get("", response_model=SettingsResponse)
 async def get_current_settings(
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    lidarr: LidarrClient = Depends(get_lidarr_client),
 ):
     """Get application settings."""
     # Get fresh settings instance (not stale module-level cache)
     settings = get_settings()
 
-    # Test connections
-    lidarr_connected = None
-    plex_connected = None
-
+    # Test configured connections side by side, so a down server costs one
+    # timeout rather than adding to the others
+    probes = {}
     if settings.lidarr_url and settings.lidarr_api_key:
-        try:
-            lidarr = LidarrClient()
-            lidarr_connected = await lidarr.test_connection()
-        except Exception:
-            lidarr_connected = False
-
+        probes["lidarr"] = _probe_connection(lidarr.test_connection)
     if settings.plex_url and settings.plex_token:
-        try:
-            plex = PlexClient()
-            plex_connected = await plex.test_connection()
-        except Exception:
-            plex_connected = False
+        probes["plex"] = _probe_connection(PlexClient().test_connection)
+    connected = dict(zip(probes, await asyncio.gather(*probes.values())))
+    lidarr_connected = connected.get("lidarr")
+    plex_connected = connected.get("plex")
 
     # Mask email for display (show first 2 chars + domain)
     qobuz_email_masked = ""
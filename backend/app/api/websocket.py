@@ -1,5 +1,5 @@
 """WebSocket API endpoint."""
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
+from fastapi import APIRouter, WebSocket, Query
 from jose import jwt, JWTError
 
 from app.config import settings
@@ -25,7 +25,7 @@ def get_user_from_token(token: str) -> User:
 
         db = SessionLocal()
         try:
-            return db.query(User).filter(User.id == int(user_id)).first()
+            return db.get(User, int(user_id))
         finally:
             db.close()
 
@@ -86,9 +86,12 @@ async def websocket_endpoint(
                 # Handle unsubscription
                 await handle_unsubscribe(websocket, user, data)
 
-    except WebSocketDisconnect:
-        manager.disconnect(websocket, user.id)
     except Exception:
+        # Client disconnects and malformed frames both end the session quietly
+        pass
+    finally:
+        # Also runs when the handler task is cancelled (server shutdown),
+        # which is not an Exception and used to leave the socket registered
         manager.disconnect(websocket, user.id)
 
 
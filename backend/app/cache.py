@@ -0,0 +1,245 @@
+"""Small Redis-backed JSON cache for expensive read-mostly endpoints.
+
+The cache is best effort: any Redis error is logged and treated as a miss
+(reads) or a no-op (writes and deletes), so requests never fail because
+Redis is down. After a connection failure Redis is skipped for a short
+back-off instead of paying the connect timeout on every call.
+"""
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import orjson
+import redis
+from redis.commands.core import Script
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CACHE_KEY = "admin:health:v1"
+
+# Per-user hearted id sets: user:{id}:hearted_{artist|album|track}, written
+# only while user:{id}:hearted_gen and HEARTED_LIBRARY_GEN_KEY still hold
+# the values read before loading. Every stored key is listed in
+# HEARTED_LIVE_KEY so library changes can drop them without a SCAN.
+HEARTED_KINDS = ("artist", "album", "track")
+HEARTED_STATS_KEY = "user:hearted"
+HEARTED_LIBRARY_GEN_KEY = "library:hearted_gen"
+HEARTED_LIVE_KEY = "library:hearted_keys"
+
+_RETRY_AFTER_SECONDS = 30
+
+# Generation counter values, as read from Redis
+Generation = Tuple[bytes, ...]
+
+# Read keys and count the hits and misses in one round trip, then append
+# the values of any further keys uncounted.
+# KEYS: cached keys..., hits counter, misses counter, uncounted keys...
+# ARGV: number of cached keys
+_GET_COUNTED = """
+local n = tonumber(ARGV[1])
+local values = redis.call('MGET', unpack(KEYS, 1, n))
+local hits = 0
+for i = 1, n do
+    if values[i] then hits = hits + 1 end
+end
+if hits > 0 then redis.call('INCRBY', KEYS[n + 1], hits) end
+if hits < n then redis.call('INCRBY', KEYS[n + 2], n - hits) end
+for i = n + 3, #KEYS do
+    values[#values + 1] = redis.call('GET', KEYS[i])
+end
+return values
+"""
+
+# Store a value and list its key unless a generation moved on since it
+# was read.
+# KEYS: key, live key set, generations...
+# ARGV: value, ttl, generations as read...
+_SET_IF_CURRENT = """
+for i = 3, #KEYS do
+    if (redis.call('GET', KEYS[i]) or '0') ~= ARGV[i] then return 0 end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+redis.call('SADD', KEYS[2], KEYS[1])
+return 1
+"""
+
+_client: Optional[redis.Redis] = None
+# Lua scripts registered on _client, sent by SHA (reloaded on NOSCRIPT)
+_scripts: Dict[str, Script] = {}
+_unavailable_until = 0.0
+
+
+def _get_client() -> Optional[redis.Redis]:
+    """Shared client, or None while backing off after a failure."""
+    global _client
+    if time.monotonic() < _unavailable_until:
+        return None
+    if _client is None:
+        _client = redis.from_url(
+            settings.redis_url,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+        _scripts["get_counted"] = _client.register_script(_GET_COUNTED)
+        _scripts["set_if_current"] = _client.register_script(_SET_IF_CURRENT)
+    return _client
+
+
+def _mark_unavailable(e: Exception) -> None:
+    global _unavailable_until
+    _unavailable_until = time.monotonic() + _RETRY_AFTER_SECONDS
+    logger.warning(f"Redis cache unavailable, skipping for {_RETRY_AFTER_SECONDS}s: {e}")
+
+
+def get_json(key: str, stats_key: Optional[str] = None) -> Optional[Any]:
+    """Cached value for ``key``, or None on a miss.
+
+    Hits and misses are counted in ``<stats_key>:hits`` / ``<stats_key>:misses``
+    (``stats_key`` defaults to ``key``).
+    """
+    return get_json_many([key], stats_key=stats_key or key)[0]
+
+
+def get_json_many(keys: List[str], stats_key: str) -> List[Optional[Any]]:
+    """Cached values for ``keys`` in order, None for each miss.
+
+    All keys are read in a single round trip; hits and misses are counted
+    under ``stats_key`` as in :func:`get_json`.
+    """
+    raws = _get_counted(keys, stats_key)
+    if raws is None:
+        return [None] * len(keys)
+    return [_loads(raw) for raw in raws]
+
+
+def _get_counted(keys: List[str], stats_key: str, uncounted: Sequence[str] = ()) -> Optional[list]:
+    """Raw values of ``keys`` then ``uncounted``, or None if Redis is unavailable."""
+    client = _get_client()
+    if client is None:
+        return None
+    try:
+        return _scripts["get_counted"](
+            keys=[*keys, f"{stats_key}:hits", f"{stats_key}:misses", *uncounted],
+            args=[len(keys)],
+        )
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+        return None
+
+
+def _loads(raw: Optional[bytes]) -> Optional[Any]:
+    return orjson.loads(raw) if raw is not None else None
+
+
+def _dumps(value: Any) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+def set_json(key: str, value: Any, ttl: int) -> None:
+    """Store ``value`` under ``key`` for ``ttl`` seconds."""
+    client = _get_client()
+    if client is None:
+        return
+    try:
+        client.set(key, _dumps(value), ex=ttl)
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+
+
+def delete(*keys: str) -> None:
+    """Drop ``keys`` so the next read recomputes them."""
+    client = _get_client()
+    if client is None:
+        return
+    try:
+        client.delete(*keys)
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+
+
+def hearted_key(user_id: int, kind: str) -> str:
+    """Key for ``user_id``'s hearted ids of ``kind``."""
+    return f"user:{user_id}:hearted_{kind}"
+
+
+def _hearted_generations(user_id: int) -> List[str]:
+    """Keys bumped whenever ``user_id``'s cached hearted ids go stale."""
+    return [f"user:{user_id}:hearted_gen", HEARTED_LIBRARY_GEN_KEY]
+
+
+def get_hearted(user_id: int, kinds: Sequence[str]) -> Tuple[List[Optional[Any]], Optional[Generation]]:
+    """Cached hearted ids of each of ``kinds`` (None per miss), in one round trip.
+
+    Also returns the generation they were read at, to hand to
+    :func:`set_hearted` for the misses; None if Redis is unavailable.
+    """
+    keys = [hearted_key(user_id, kind) for kind in kinds]
+    raws = _get_counted(keys, HEARTED_STATS_KEY, _hearted_generations(user_id))
+    if raws is None:
+        return [None] * len(keys), None
+    values, generation = raws[:len(keys)], raws[len(keys):]
+    return [_loads(raw) for raw in values], tuple(gen or b"0" for gen in generation)
+
+
+def set_hearted(user_id: int, kind: str, ids: Any, ttl: int, generation: Optional[Generation]) -> None:
+    """Cache ``ids`` unless they were invalidated since ``generation`` was read.
+
+    Without the check, a reader that loaded ids just before a heart
+    committed could store them after the heart's invalidation.
+    """
+    client = _get_client()
+    if client is None or generation is None:
+        return
+    try:
+        _scripts["set_if_current"](
+            keys=[hearted_key(user_id, kind), HEARTED_LIVE_KEY, *_hearted_generations(user_id)],
+            args=[_dumps(ids), ttl, *generation],
+        )
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+
+
+def invalidate_hearted(user_id: int) -> None:
+    """Drop a user's hearted id sets after they heart or unheart something.
+
+    All kinds go together: hearting an album also hearts its tracks and
+    its artist. The generation moves on first, so loads already under way
+    are not stored.
+    """
+    client = _get_client()
+    if client is None:
+        return
+    try:
+        keys = [hearted_key(user_id, kind) for kind in HEARTED_KINDS]
+        pipe = client.pipeline()
+        pipe.incr(_hearted_generations(user_id)[0])
+        pipe.delete(*keys)
+        pipe.srem(HEARTED_LIVE_KEY, *keys)
+        pipe.execute()
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+
+
+def invalidate_library() -> None:
+    """Drop cached views derived from the library contents.
+
+    Hearted track and artist ids follow album contents, so every user's
+    sets go too: the library generation moves on so loads under way are
+    not stored, then every listed key is dropped.
+    """
+    client = _get_client()
+    if client is None:
+        return
+    try:
+        pipe = client.pipeline()
+        pipe.incr(HEARTED_LIBRARY_GEN_KEY)
+        pipe.smembers(HEARTED_LIVE_KEY)
+        _, keys = pipe.execute()
+        pipe.delete(HEALTH_CACHE_KEY, *keys)
+        if keys:
+            pipe.srem(HEARTED_LIVE_KEY, *keys)
+        pipe.execute()
+    except redis.RedisError as e:
+        _mark_unavailable(e)
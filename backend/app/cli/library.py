@@ -48,13 +48,12 @@ def albums(
     user, db = get_current_user()
     try:
         from app.services.library import LibraryService
-        from app.services.user_library import UserLibraryService
 
         service = LibraryService(db)
-        user_lib = UserLibraryService(db)
 
-        result = service.list_albums(artist_id, letter, page, limit)
-        hearted_ids = user_lib.get_hearted_album_ids(user.id)
+        result = service.list_albums(artist_id, letter, page, limit, user_id=user.id)
+        hearted_ids = result["hearted_ids"]
+        artist_names = result["artist_names"]
 
         table = Table(title=f"Albums (Page {result['page']}, Total: {result['total']})")
         table.add_column("ID", style="dim")
@@ -66,7 +65,7 @@ def albums(
 
         for album in result["items"]:
             hearted = "[green]Y[/green]" if album.id in hearted_ids else ""
-            artist_name = album.artist.name if album.artist else "Unknown"
+            artist_name = artist_names.get(album.id) or "Unknown"
             table.add_row(
                 str(album.id),
                 album.title,
@@ -156,7 +155,7 @@ def search(
             table.add_column("Title", style="cyan")
             table.add_column("Artist")
             for album in results["albums"]:
-                artist_name = album.artist.name if album.artist else "Unknown"
+                artist_name = results["artist_names"].get(album.id) or "Unknown"
                 table.add_row(str(album.id), album.title, artist_name)
             console.print(table)
 
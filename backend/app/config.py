@@ -10,9 +10,15 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "postgresql://barbossa:barbossa@db:5432/barbossa"
+    db_pool_size: int = 20          # Matches the 40-thread request threadpool with overflow
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800     # Seconds before a pooled connection is replaced
+    db_external_pool: bool = False  # Behind pgbouncer: let it pool, open per checkout
 
     # Redis
     redis_url: str = "redis://redis:6379/0"
+    health_cache_ttl: int = 60  # Seconds to cache /admin/health; 0 disables
+    hearted_cache_ttl: int = 60  # Seconds to cache per-user hearted ids; 0 disables
 
     # Authentication
     jwt_secret: str = "change-me-in-production-use-random-string"
@@ -64,6 +70,9 @@ class Settings(BaseSettings):
     # Bandcamp
     bandcamp_cookies: str = ""  # Path to cookies.txt file
 
+    # Activity log retention (whole monthly partitions older than this are dropped)
+    activity_retention_days: int = 90
+
     # Logging
     log_level: str = "info"
     log_path: str = ""
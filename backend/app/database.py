@@ -1,6 +1,7 @@
 """Database connection and session management."""
-from sqlalchemy import create_engine
+from sqlalchemy import DDL, BigInteger, Integer, create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool
 from app.config import settings
 
 # Configure engine based on database type
@@ -11,12 +12,21 @@ if settings.database_url.startswith("sqlite"):
     _engine_options = {
         "connect_args": {"check_same_thread": False}
     }
+elif settings.db_external_pool:
+    # PostgreSQL behind pgbouncer (transaction pooling): pgbouncer owns the
+    # pool, so hand connections back at once instead of holding them idle
+    _engine_options = {
+        "poolclass": NullPool,
+    }
 else:
-    # PostgreSQL: full connection pool
+    # PostgreSQL: full connection pool. LIFO reuse keeps the hot connections
+    # warm and lets surplus ones age out through pool_recycle.
     _engine_options = {
         "pool_pre_ping": True,
-        "pool_size": 10,
-        "max_overflow": 20
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_use_lifo": True,
     }
 
 engine = create_engine(settings.database_url, **_engine_options)
@@ -25,6 +35,45 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Ids of high-churn tables (tracks, downloads, logs). SQLite only
+# autoincrements a column declared INTEGER PRIMARY KEY, so it keeps INTEGER.
+BigIntId = BigInteger().with_variant(Integer(), "sqlite")
+
+
+def set_fillfactor(table, percent: int) -> None:
+    """Leave free space in a Postgres table's pages once create_all builds it.
+
+    For tables whose rows are updated repeatedly after insert: the spare room
+    lets new row versions stay on the same page (HOT updates) instead of
+    migrating and touching every index.
+    """
+    event.listen(
+        table,
+        "after_create",
+        DDL(f"ALTER TABLE %(table)s SET (fillfactor = {percent})").execute_if(dialect="postgresql"),
+    )
+
+
+# Trigram (gin_trgm_ops) indexes on name/title need pg_trgm before create_all
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+def conflict_insert(db, entity):
+    """INSERT for ``entity`` supporting ``on_conflict_do_*`` on the session's dialect.
+
+    Postgres and SQLite share the ON CONFLICT syntax but SQLAlchemy exposes
+    it through per-dialect ``insert`` constructs.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(entity)
+
 
 def get_db():
     """Dependency that provides a database session."""
@@ -1,11 +1,15 @@
-"""FastAPI dependencies for authentication."""
+"""FastAPI dependencies for authentication, pagination, services and integration clients."""
 from typing import Optional
-from fastapi import Depends, HTTPException, status, Query
+from fastapi import Depends, HTTPException, Request, status, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.integrations.lidarr import LidarrClient
 from app.services.auth import AuthService
+from app.services.library import LibraryService
+from app.services.user_library import UserLibraryService
 from app.models.user import User
+from app.utils.pagination import decode_cursor
 
 security = HTTPBearer(auto_error=False)
 
@@ -100,3 +104,37 @@ async def get_stream_user(
         )
 
     return user
+
+
+def get_cursor_row_id(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+) -> Optional[int]:
+    """Row id behind a pagination cursor (400 if it was tampered with)."""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def get_lidarr_client(request: Request) -> LidarrClient:
+    """Lidarr client sending through the app's pooled HTTP client.
+
+    Falls back to a client per call when the lifespan has not run.
+    """
+    return LidarrClient(http=getattr(request.app.state, "lidarr_http", None))
+
+
+def get_library_service(db: Session = Depends(get_db)) -> LibraryService:
+    """Library service bound to the request's session."""
+    return LibraryService(db)
+
+
+def get_user_library_service(db: Session = Depends(get_db)) -> UserLibraryService:
+    """User library service bound to the request's session.
+
+    FastAPI caches dependencies per request, so everything resolving this
+    shares one instance and its memoized hearted-id sets.
+    """
+    return UserLibraryService(db)
@@ -2,7 +2,7 @@
 import asyncio
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 
 class ExifToolClient:
@@ -68,6 +68,9 @@ class ExifToolClient:
     AUDIO_EXTENSIONS = {".flac", ".mp3", ".m4a", ".ogg", ".wav", ".aac", ".opus", ".wma"}
     LOSSY_FORMATS = {"mp3", "aac", "ogg", "opus", "m4a", "wma"}
 
+    # Most exiftool processes run at once by write_metadata_many
+    WRITE_CONCURRENCY = 8
+
     async def get_metadata(self, path: Path) -> dict:
         """Extract audio metadata from file.
 
@@ -315,18 +318,7 @@ class ExifToolClient:
             **kwargs: Tag values to write
         """
         cmd = ["exiftool", "-overwrite_original"]
-
-        if artist:
-            cmd.append(f"-Artist={artist}")
-        if album:
-            cmd.append(f"-Album={album}")
-        if title:
-            cmd.append(f"-Title={title}")
-        if track_number:
-            cmd.append(f"-TrackNumber={track_number}")
-        if year:
-            cmd.append(f"-Year={year}")
-
+        cmd.extend(self._tag_args(artist, album, title, track_number, year))
         cmd.append(str(path))
 
         process = await asyncio.create_subprocess_exec(
@@ -336,6 +328,65 @@ class ExifToolClient:
         )
         await process.communicate()
 
+    async def write_metadata_many(self, paths: Iterable[Path], **tags) -> None:
+        """Write the same tags to several audio files.
+
+        The files are split into at most WRITE_CONCURRENCY batches written
+        in parallel. Each batch is one exiftool process reading its file
+        list from stdin (``-@ -``), so interpreter startup is paid per batch
+        rather than per file. Every batch runs to completion before the
+        first failure, if any, is raised.
+
+        Args:
+            paths: Paths to audio files
+            **tags: Tag values to write, as for write_metadata
+        """
+        paths = [str(path) for path in paths]
+        if not paths:
+            return
+        cmd = ["exiftool", "-overwrite_original", *self._tag_args(**tags), "-@", "-"]
+        batch_count = min(self.WRITE_CONCURRENCY, len(paths))
+
+        async def write(batch: list) -> None:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            # Argfile: one argument per line
+            await process.communicate("\n".join(batch).encode())
+
+        results = await asyncio.gather(
+            *(write(paths[i::batch_count]) for i in range(batch_count)),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    @staticmethod
+    def _tag_args(
+        artist: Optional[str] = None,
+        album: Optional[str] = None,
+        title: Optional[str] = None,
+        track_number: Optional[int] = None,
+        year: Optional[int] = None
+    ) -> list:
+        """exiftool arguments setting the given tags."""
+        args = []
+        if artist:
+            args.append(f"-Artist={artist}")
+        if album:
+            args.append(f"-Album={album}")
+        if title:
+            args.append(f"-Title={title}")
+        if track_number:
+            args.append(f"-TrackNumber={track_number}")
+        if year:
+            args.append(f"-Year={year}")
+        return args
+
     def _basic_metadata(self, path: Path) -> dict:
         """Return basic metadata when exiftool fails."""
         return {
@@ -1,6 +1,9 @@
 """Lidarr integration for artist requests."""
+import asyncio
+import time
+from contextlib import asynccontextmanager
 import httpx
-from typing import Optional, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, List, Tuple
 from app.config import settings
 
 
@@ -10,11 +13,33 @@ class LidarrError(Exception):
 
 
 class LidarrClient:
-    """Lidarr API client."""
-
-    def __init__(self):
+    """Lidarr API client.
+
+    Status, queue, artist and history reads are cached per process for a
+    few seconds and concurrent identical reads share one upstream request,
+    so polling UIs do not fan out to Lidarr.
+    """
+
+    # Seconds a read is reused
+    STATUS_TTL = 5
+    QUEUE_TTL = 5
+    ARTISTS_TTL = 60
+    HISTORY_TTL = 60
+
+    # Shared by every client in the process, keyed by (base_url, read)
+    _responses: Dict[Tuple, Tuple[float, Any]] = {}
+    _inflight: Dict[Tuple, asyncio.Future] = {}
+
+    def __init__(self, http: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            http: Pooled client to send requests with; the API passes the
+                one owned by the app lifespan. Without it each call opens
+                and closes its own client.
+        """
         self.base_url = settings.lidarr_url.rstrip("/") if settings.lidarr_url else ""
         self.api_key = settings.lidarr_api_key
+        self.http = http
 
     @property
     def headers(self) -> dict:
@@ -23,12 +48,66 @@ class LidarrClient:
             "Content-Type": "application/json"
         }
 
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """The pooled client if there is one, else a client for this call."""
+        if self.http is not None:
+            yield self.http
+        else:
+            async with httpx.AsyncClient() as client:
+                yield client
+
+    async def _shared(self, read: Tuple, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Result of ``fetch()``, reused for ``ttl`` seconds.
+
+        While a fetch is in flight, callers with the same ``read`` await it
+        instead of starting their own. Failures are passed to those callers
+        and not cached; if the fetching caller is cancelled, they retry.
+        """
+        key = (self.base_url, *read)
+        while True:
+            cached = self._responses.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved: no warning when nobody was waiting
+            raise
+        else:
+            now = time.monotonic()
+            for stale in [k for k, (expires, _) in self._responses.items() if expires <= now]:
+                del self._responses[stale]
+            self._responses[key] = (now + ttl, value)
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
     async def test_connection(self) -> bool:
         """Test connection to Lidarr."""
         if not self.base_url or not self.api_key:
             return False
+        return await self._shared(("status",), self.STATUS_TTL, self._fetch_status)
 
-        async with httpx.AsyncClient() as client:
+    async def _fetch_status(self) -> bool:
+        async with self._client() as client:
             try:
                 response = await client.get(
                     f"{self.base_url}/api/v1/system/status",
@@ -44,7 +123,7 @@ class LidarrClient:
         if not self.base_url:
             raise LidarrError("Lidarr URL not configured")
 
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             response = await client.get(
                 f"{self.base_url}/api/v1/artist/lookup",
                 headers=self.headers,
@@ -78,7 +157,7 @@ class LidarrClient:
             }
         }
 
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             response = await client.post(
                 f"{self.base_url}/api/v1/artist",
                 headers=self.headers,
@@ -86,11 +165,16 @@ class LidarrClient:
                 timeout=30
             )
             response.raise_for_status()
+            # The monitored artist list changed
+            self._responses.pop((self.base_url, "artists"), None)
             return response.json()
 
     async def get_queue(self) -> List[dict]:
         """Get current download queue."""
-        async with httpx.AsyncClient() as client:
+        return await self._shared(("queue",), self.QUEUE_TTL, self._fetch_queue)
+
+    async def _fetch_queue(self) -> List[dict]:
+        async with self._client() as client:
             response = await client.get(
                 f"{self.base_url}/api/v1/queue",
                 headers=self.headers,
@@ -102,7 +186,10 @@ class LidarrClient:
 
     async def get_artists(self) -> List[dict]:
         """Get all monitored artists."""
-        async with httpx.AsyncClient() as client:
+        return await self._shared(("artists",), self.ARTISTS_TTL, self._fetch_artists)
+
+    async def _fetch_artists(self) -> List[dict]:
+        async with self._client() as client:
             response = await client.get(
                 f"{self.base_url}/api/v1/artist",
                 headers=self.headers,
@@ -113,7 +200,12 @@ class LidarrClient:
 
     async def get_history(self, limit: int = 50) -> List[dict]:
         """Get download history."""
-        async with httpx.AsyncClient() as client:
+        return await self._shared(
+            ("history", limit), self.HISTORY_TTL, lambda: self._fetch_history(limit)
+        )
+
+    async def _fetch_history(self, limit: int) -> List[dict]:
+        async with self._client() as client:
             response = await client.get(
                 f"{self.base_url}/api/v1/history",
                 headers=self.headers,
@@ -129,7 +221,7 @@ class LidarrClient:
 
     async def trigger_search(self, artist_id: int):
         """Trigger search for artist's music."""
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             await client.post(
                 f"{self.base_url}/api/v1/command",
                 headers=self.headers,
@@ -139,7 +231,7 @@ class LidarrClient:
 
     async def _get_root_folder(self) -> str:
         """Get first root folder path."""
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             response = await client.get(
                 f"{self.base_url}/api/v1/rootfolder",
                 headers=self.headers,
@@ -1,7 +1,8 @@
 """Plex integration for library scanning."""
 import httpx
 import logging
-from typing import Optional
+import time
+from typing import Dict, Optional, Tuple
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,12 @@ class PlexError(Exception):
 class PlexClient:
     """Plex Media Server API client."""
 
+    # Seconds a connection test result is reused
+    STATUS_TTL = 30
+
+    # Shared by every client in the process, keyed by (base_url, token)
+    _status: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+
     def __init__(self):
         self.base_url = settings.plex_url.rstrip("/") if settings.plex_url else ""
         self.token = settings.plex_token
@@ -33,10 +40,24 @@ class PlexClient:
         }
 
     async def test_connection(self) -> bool:
-        """Test connection to Plex server."""
+        """Test connection to Plex server.
+
+        The result is reused for STATUS_TTL seconds per server and token, so
+        a settings page polled by several admins probes Plex once.
+        """
         if not self.enabled:
             return False
 
+        key = (self.base_url, self.token)
+        cached = self._status.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        connected = await self._fetch_status()
+        self._status[key] = (time.monotonic() + self.STATUS_TTL, connected)
+        return connected
+
+    async def _fetch_status(self) -> bool:
         async with httpx.AsyncClient() as client:
             try:
                 response = await client.get(
@@ -172,16 +172,17 @@ class QobuzAPI:
 
     async def _check_rate_limit(self) -> None:
         """Enforce rate limiting."""
-        now = time.time()
-        # Remove requests older than 1 minute
-        while self._request_times and now - self._request_times[0] > 60:
-            self._request_times.popleft()
-
-        if len(self._request_times) >= self._rate_limit:
-            # Wait until oldest request is > 1 minute old
-            wait_time = 60 - (now - self._request_times[0])
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+        while True:
+            now = time.time()
+            # Remove requests older than 1 minute
+            while self._request_times and now - self._request_times[0] > 60:
+                self._request_times.popleft()
+
+            if len(self._request_times) < self._rate_limit:
+                break
+            # Wait until oldest request is > 1 minute old, then re-check:
+            # concurrent callers may have taken the freed slot meanwhile
+            await asyncio.sleep(max(60 - (now - self._request_times[0]), 0.01))
 
         self._request_times.append(now)
 
@@ -363,7 +363,12 @@ class StreamripClient:
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
-        stdout, stderr = await process.communicate()
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            # Speculative searches are cancelled; do not leave rip running
+            process.kill()
+            raise
 
         if process.returncode != 0:
             raise StreamripError(stderr.decode() or stdout.decode())
@@ -1,9 +1,11 @@
 """Barbossa API - Main application entry point."""
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
 import shutil
+import httpx
 from app.api import api_router, ws_router
 from app.api.health import router as health_router
 from app import __version__
@@ -28,8 +30,13 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown events."""
     # Startup
     ensure_beets_config()
+    # Keep-alive pool for Lidarr calls, shared by every request
+    app.state.lidarr_http = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
     yield
-    # Shutdown (nothing needed)
+    # Shutdown
+    await app.state.lidarr_http.aclose()
 
 
 app = FastAPI(
@@ -39,6 +46,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
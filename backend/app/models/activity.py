@@ -1,22 +1,34 @@
 """Activity log model."""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
-from sqlalchemy.sql import func
-from app.database import Base
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import text
+from app.database import Base, BigIntId
 
 
 class ActivityLog(Base):
     """Audit log of all user actions."""
 
     __tablename__ = "activity_log"
+    __table_args__ = (
+        # BRIN on append-only timestamps (b-tree on SQLite)
+        Index('ix_activity_log_created_at', 'created_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        # Keyset pagination order (created_at DESC, id DESC), scanned backwards
+        Index('ix_activity_log_created_id', 'created_at', 'id'),
+        # GIN containment index on details (Postgres only)
+        Index(
+            'ix_activity_log_details_gin', 'details',
+            postgresql_using='gin', postgresql_ops={'details': 'jsonb_path_ops'},
+        ).ddl_if(dialect='postgresql'),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntId, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"))
     action = Column(String(50), nullable=False, index=True)  # download, import, heart, unheart, delete, export
     entity_type = Column(String(50))  # artist, album, track
-    entity_id = Column(Integer)
-    details = Column(JSON)  # Additional context (use JSON for SQLite compat)
+    entity_id = Column(BigIntId)
+    details = Column(JSON().with_variant(JSONB(), "postgresql"))  # Additional context (JSONB on Postgres, JSON on SQLite)
     ip_address = Column(String(45))  # Use String for SQLite compat (supports IPv6)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
 
     def __repr__(self):
         return f"<Activity {self.action} by user {self.user_id}>"
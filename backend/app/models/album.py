@@ -1,7 +1,7 @@
 """Album model."""
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, JSON, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, JSON, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.database import Base
 
 
@@ -11,12 +11,23 @@ class Album(Base):
     __tablename__ = "albums"
     __table_args__ = (
         UniqueConstraint('artist_id', 'normalized_title', name='uq_album_artist_title'),
+        # Trigram GIN index serves ILIKE '%term%' search (Postgres only)
+        Index(
+            'ix_albums_title_trgm', 'title',
+            postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
+        # Covering index for the health report's per-source counts (Postgres only)
+        Index('ix_albums_health', 'source', postgresql_include=['status']).ddl_if(dialect='postgresql'),
+        # Keyset pages of the album browse list: (title, id)
+        Index('ix_albums_title_id', 'title', 'id'),
+        # ... and of one artist's albums (/albums?artist_id=)
+        Index('ix_albums_artist_title_id', 'artist_id', 'title', 'id'),
     )
 
     id = Column(Integer, primary_key=True, index=True)
     artist_id = Column(Integer, ForeignKey("artists.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False, index=True)
-    normalized_title = Column(String(255), nullable=False, index=True)
+    normalized_title = Column(String(255), nullable=False)  # indexed via uq_album_artist_title
     year = Column(Integer, index=True)
     path = Column(String(1000))
     artwork_path = Column(String(1000))
@@ -37,7 +48,7 @@ class Album(Base):
     is_compilation = Column(Boolean, default=False)
     status = Column(String(20), default='complete')  # complete, incomplete, pending
     missing_tracks = Column(JSON, nullable=True)  # ["Track 11", "Track 12"]
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     artist = relationship("Artist", back_populates="albums")
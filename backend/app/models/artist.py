@@ -1,7 +1,7 @@
 """Artist model."""
-from sqlalchemy import Column, Integer, String, DateTime, Text
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import CHAR, Column, Integer, String, DateTime, Text, Index
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.sql import func, text
 from app.database import Base
 
 
@@ -9,6 +9,16 @@ class Artist(Base):
     """Music artist in the library."""
 
     __tablename__ = "artists"
+    __table_args__ = (
+        # Trigram GIN index serves ILIKE '%term%' search (Postgres only)
+        Index(
+            'ix_artists_name_trgm', 'name',
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
+        # Keyset pages of the artist browse list: (sort key, id), where
+        # artists without a sort_name sort by name (ARTIST_SORT_KEY below)
+        Index('ix_artists_sort_key_id', text('coalesce(sort_name, name)'), 'id'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False, index=True)
@@ -19,13 +29,17 @@ class Artist(Base):
     musicbrainz_id = Column(String(36))
 
     # Extended metadata
-    biography = Column(Text)  # Artist bio from Qobuz or other sources
-    country = Column(String(2))  # ISO 3166-1 alpha-2 code (US, GB, DE)
+    biography = deferred(Column(Text))  # Artist bio from Qobuz or other sources (loaded on access)
+    country = Column(CHAR(2))  # ISO 3166-1 alpha-2 code (US, GB, DE)
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     albums = relationship("Album", back_populates="artist", lazy="dynamic")
 
     def __repr__(self):
         return f"<Artist {self.name}>"
+
+
+# Browse-list sort key: never NULL, unlike sort_name, so it can key keyset pages
+ARTIST_SORT_KEY = func.coalesce(Artist.sort_name, Artist.name)
@@ -1,24 +1,34 @@
 """Backup history model."""
-from sqlalchemy import Column, Integer, String, BigInteger, DateTime, Text
-from sqlalchemy.sql import func
-from app.database import Base
+from sqlalchemy import Column, Integer, String, BigInteger, DateTime, Text, Index
+from sqlalchemy.sql import text
+from app.database import Base, set_fillfactor
 
 
 class BackupHistory(Base):
     """Backup operation history."""
 
     __tablename__ = "backup_history"
+    __table_args__ = (
+        # BRIN on append-only timestamps (b-tree on SQLite)
+        Index('ix_backup_history_created_at', 'created_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        # Newest-first listing (created_at DESC, id DESC), scanned backwards
+        Index('ix_backup_history_created_id', 'created_at', 'id'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     destination = Column(String(500), nullable=False)
     destination_type = Column(String(50))  # local, nas, s3, b2
-    status = Column(String(20), nullable=False)  # running, complete, failed
+    status = Column(String(20), nullable=False, index=True)  # running, complete, failed
     files_backed_up = Column(Integer, default=0)
     total_size = Column(BigInteger, default=0)
     error_message = Column(Text)
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
 
     def __repr__(self):
         return f"<BackupHistory {self.id}: {self.status}>"
+
+
+# Rows are updated in place when a backup finishes
+set_fillfactor(BackupHistory.__table__, 70)
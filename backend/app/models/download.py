@@ -1,7 +1,7 @@
 """Download queue model."""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum
-from sqlalchemy.sql import func
-from app.database import Base
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, Index
+from sqlalchemy.sql import text
+from app.database import Base, BigIntId, set_fillfactor
 import enum
 
 
@@ -17,6 +17,16 @@ class DownloadStatus(str, enum.Enum):
     PENDING_REVIEW = "pending_review"  # Low beets confidence, needs manual review
 
 
+# Statuses listed by the per-user download queue (GET /downloads/queue)
+QUEUE_STATUSES = (
+    DownloadStatus.PENDING.value,
+    DownloadStatus.DOWNLOADING.value,
+    DownloadStatus.IMPORTING.value,
+    DownloadStatus.PENDING_REVIEW.value,
+    DownloadStatus.FAILED.value,
+)
+
+
 class DownloadSource(str, enum.Enum):
     """Download source types."""
     QOBUZ = "qobuz"
@@ -32,30 +42,54 @@ class SearchType(str, enum.Enum):
     ARTIST = "artist"
     ALBUM = "album"
     TRACK = "track"
+    PLAYLIST = "playlist"
 
 
 class Download(Base):
     """Download queue entry."""
 
     __tablename__ = "downloads"
+    __table_args__ = (
+        # BRIN on append-only timestamps (b-tree on SQLite)
+        Index('ix_downloads_created_at', 'created_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        # Filtered history: equality on (user_id, status), newest first
+        Index(
+            'ix_downloads_user_status_created', 'user_id', 'status', text('created_at DESC'),
+            postgresql_with={'fillfactor': 70},
+        ),
+        # Queue poll: only non-terminal rows, so it stays small as history grows
+        Index(
+            'ix_downloads_active', 'user_id', 'created_at',
+            postgresql_where=text("status IN ({})".format(", ".join(f"'{s}'" for s in QUEUE_STATUSES))),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntId, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     source = Column(String(50), nullable=False)
     source_url = Column(String(1000))
     search_query = Column(String(500))
     search_type = Column(String(20))
-    status = Column(String(20), default=DownloadStatus.PENDING.value, index=True)
+    # Native ENUM on Postgres (VARCHAR elsewhere); extend with ALTER TYPE ... ADD VALUE
+    status = Column(
+        Enum(*(s.value for s in DownloadStatus), name="download_status"),
+        default=DownloadStatus.PENDING.value,
+    )
     progress = Column(Integer, default=0)  # 0-100
     speed = Column(String(50))  # "2.5 MB/s"
     eta = Column(String(50))  # "00:05:32"
     error_message = Column(Text)
     celery_task_id = Column(String(255))
-    result_album_id = Column(Integer, ForeignKey("albums.id", ondelete="SET NULL"))
-    result_review_id = Column(Integer, ForeignKey("pending_review.id", ondelete="SET NULL"))
+    # Deferred so a download and its album/review can be written in either order
+    result_album_id = Column(Integer, ForeignKey("albums.id", ondelete="SET NULL", deferrable=True, initially="DEFERRED"))
+    result_review_id = Column(Integer, ForeignKey("pending_review.id", ondelete="SET NULL", deferrable=True, initially="DEFERRED"))
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
 
     def __repr__(self):
         return f"<Download {self.id} {self.source} {self.status}>"
+
+
+# Progress, speed and eta are rewritten many times while a download runs
+set_fillfactor(Download.__table__, 70)
@@ -1,7 +1,7 @@
 """Export model for user library exports."""
 from sqlalchemy import Column, Integer, String, Boolean, BigInteger, DateTime, ForeignKey, Enum
-from sqlalchemy.sql import func
-from app.database import Base
+from sqlalchemy.sql import text
+from app.database import Base, set_fillfactor
 import enum
 
 
@@ -34,7 +34,11 @@ class Export(Base):
     include_playlist = Column(Boolean, default=False)
 
     # Progress tracking
-    status = Column(String(20), default=ExportStatus.PENDING, index=True)
+    status = Column(
+        Enum(*(s.value for s in ExportStatus), name="export_status"),
+        default=ExportStatus.PENDING,
+        index=True,
+    )
     progress = Column(Integer, default=0)  # 0-100
     total_albums = Column(Integer, default=0)
     exported_albums = Column(Integer, default=0)
@@ -47,9 +51,13 @@ class Export(Base):
     error_message = Column(String(1000))
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
 
     def __repr__(self):
         return f"<Export {self.id} ({self.status})>"
+
+
+# Status and counters are updated while an export runs
+set_fillfactor(Export.__table__, 70)
@@ -1,7 +1,7 @@
 """Import history model for duplicate detection."""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
-from sqlalchemy.sql import func
-from app.database import Base
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, LargeBinary
+from sqlalchemy.sql import text
+from app.database import Base, BigIntId
 
 
 class ImportHistory(Base):
@@ -13,17 +13,20 @@ class ImportHistory(Base):
     """
 
     __tablename__ = "import_history"
+    __table_args__ = (
+        Index('ix_import_history_artist_album', 'artist_normalized', 'album_normalized'),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    artist_normalized = Column(String(255), nullable=False, index=True)
-    album_normalized = Column(String(255), nullable=False, index=True)
+    id = Column(BigIntId, primary_key=True, index=True)
+    artist_normalized = Column(String(255), nullable=False)
+    album_normalized = Column(String(255), nullable=False)
     track_normalized = Column(String(255), index=True)
     source = Column(String(50), nullable=False)
     quality_score = Column(Integer)  # sample_rate * 100 + bit_depth
-    checksum = Column(String(64), index=True)  # BLAKE3 hash for content-based dedup
-    track_id = Column(Integer, ForeignKey("tracks.id", ondelete="SET NULL"))
+    checksum = Column(LargeBinary(32), index=True)  # BLAKE3 digest for content-based dedup
+    track_id = Column(BigIntId, ForeignKey("tracks.id", ondelete="SET NULL"))
     album_id = Column(Integer, ForeignKey("albums.id", ondelete="SET NULL"))
-    import_date = Column(DateTime(timezone=True), server_default=func.now())
+    import_date = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
 
     def __repr__(self):
         return f"<ImportHistory {self.artist_normalized} - {self.album_normalized}>"
@@ -1,7 +1,8 @@
 """Pending review model for unidentified imports."""
 from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON
-from sqlalchemy.sql import func
-from app.database import Base
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import text
+from app.database import Base, set_fillfactor
 
 
 class PendingReviewStatus:
@@ -28,7 +29,7 @@ class PendingReview(Base):
     suggested_year = Column(Integer)
     beets_confidence = Column(Float)  # 0.0 to 1.0
     track_count = Column(Integer)
-    quality_info = Column(JSON)  # {sample_rate, bit_depth, format}
+    quality_info = Column(JSON().with_variant(JSONB(), "postgresql"))  # {sample_rate, bit_depth, format}
     source = Column(String(50))  # Where files came from originally
     source_url = Column(String(1000))  # Original download URL
     status = Column(String(20), default=PendingReviewStatus.PENDING, index=True)
@@ -36,7 +37,11 @@ class PendingReview(Base):
     reviewed_at = Column(DateTime(timezone=True))
     error_message = Column(String(1000))
     notes = Column(String(1000))  # Additional notes (e.g., duplicate info)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
 
     def __repr__(self):
         return f"<PendingReview {self.path} ({self.status})>"
+
+
+# Rows are updated in place as a review is resolved
+set_fillfactor(PendingReview.__table__, 70)
@@ -1,8 +1,8 @@
 """Track model."""
-from sqlalchemy import Column, Integer, String, Boolean, BigInteger, DateTime, ForeignKey, Text, UniqueConstraint
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-from app.database import Base
+from sqlalchemy import Column, Integer, SmallInteger, String, Boolean, BigInteger, DateTime, ForeignKey, Text, LargeBinary, UniqueConstraint, Index
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.sql import func, text
+from app.database import Base, BigIntId
 
 
 class Track(Base):
@@ -11,9 +11,16 @@ class Track(Base):
     __tablename__ = "tracks"
     __table_args__ = (
         UniqueConstraint('album_id', 'disc_number', 'track_number', name='uq_track_album_position'),
+        # Trigram GIN index serves ILIKE '%term%' search (Postgres only)
+        Index(
+            'ix_tracks_title_trgm', 'title',
+            postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
+        # Covering index for the health report's quality/size totals (Postgres only)
+        Index('ix_tracks_health', 'is_lossy', postgresql_include=['file_size']).ddl_if(dialect='postgresql'),
     )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntId, primary_key=True, index=True)
     album_id = Column(Integer, ForeignKey("albums.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False, index=True)
     normalized_title = Column(String(255), nullable=False, index=True)
@@ -24,9 +31,9 @@ class Track(Base):
 
     # Quality metadata (from ExifTool)
     sample_rate = Column(Integer)  # 44100, 96000, 192000
-    bit_depth = Column(Integer)  # 16, 24
+    bit_depth = Column(SmallInteger)  # 16, 24
     bitrate = Column(Integer)  # kbps for lossy
-    channels = Column(Integer, default=2)
+    channels = Column(SmallInteger, default=2)
     file_size = Column(BigInteger)  # bytes
     format = Column(String(10))  # FLAC, MP3, AAC
     is_lossy = Column(Boolean, default=False)
@@ -37,10 +44,10 @@ class Track(Base):
     source_quality = Column(String(100))  # "24/192 FLAC", "320kbps MP3"
 
     # Integrity
-    checksum = Column(String(64))  # BLAKE3 hash
+    checksum = Column(LargeBinary(32))  # BLAKE3 digest (32 raw bytes)
 
     # Metadata
-    lyrics = Column(Text)
+    lyrics = deferred(Column(Text))  # Wide and rarely read: kept out of list/scan SELECTs
     musicbrainz_id = Column(String(36))
 
     # Extended metadata
@@ -48,7 +55,7 @@ class Track(Base):
     composer = Column(String(255))  # Important for classical music
     explicit = Column(Boolean, default=False)  # Parental advisory flag
 
-    imported_at = Column(DateTime(timezone=True), server_default=func.now())
+    imported_at = Column(DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"))
     imported_by = Column(Integer, ForeignKey("users.id"))
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
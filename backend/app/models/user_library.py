@@ -1,7 +1,7 @@
 """User library junction tables for hearts."""
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Table
-from sqlalchemy.sql import func
-from app.database import Base
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, Table
+from sqlalchemy.sql import text
+from app.database import Base, BigIntId
 
 # Album hearts - many-to-many between users and albums
 user_albums = Table(
@@ -9,7 +9,9 @@ user_albums = Table(
     Base.metadata,
     Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
     Column("album_id", Integer, ForeignKey("albums.id", ondelete="CASCADE"), primary_key=True),
-    Column("added_at", DateTime(timezone=True), server_default=func.now()),
+    Column("added_at", DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")),
+    # Keyset pages of a user's library, newest heart first (scanned backwards)
+    Index("ix_user_albums_user_added", "user_id", "added_at", "album_id"),
 )
 
 # Track hearts - many-to-many between users and tracks
@@ -17,6 +19,6 @@ user_tracks = Table(
     "user_tracks",
     Base.metadata,
     Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
-    Column("track_id", Integer, ForeignKey("tracks.id", ondelete="CASCADE"), primary_key=True),
-    Column("added_at", DateTime(timezone=True), server_default=func.now()),
+    Column("track_id", BigIntId, ForeignKey("tracks.id", ondelete="CASCADE"), primary_key=True),
+    Column("added_at", DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")),
 )
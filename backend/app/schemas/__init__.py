@@ -1,9 +1,9 @@
 """Pydantic schemas for API request/response validation."""
-from app.schemas.user import UserCreate, UserResponse, UserLogin, LoginResponse
+from app.schemas.user import UserCreate, UserUpdate, UserResponse, UserLogin, LoginResponse
 from app.schemas.artist import ArtistResponse, ArtistListResponse
 from app.schemas.album import AlbumResponse, AlbumDetailResponse, AlbumListResponse
 from app.schemas.track import TrackResponse
-from app.schemas.common import PaginatedResponse, MessageResponse
+from app.schemas.common import PaginatedResponse, MessageResponse, LibrarySearchResponse
 from app.schemas.download import (
     DownloadCreate,
     DownloadResponse,
@@ -14,6 +14,7 @@ from app.schemas.download import (
 
 __all__ = [
     "UserCreate",
+    "UserUpdate",
     "UserResponse",
     "UserLogin",
     "LoginResponse",
@@ -25,6 +26,7 @@ __all__ = [
     "TrackResponse",
     "PaginatedResponse",
     "MessageResponse",
+    "LibrarySearchResponse",
     "DownloadCreate",
     "DownloadResponse",
     "DownloadStatusResponse",
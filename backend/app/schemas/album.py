@@ -73,3 +73,5 @@ class AlbumListResponse(BaseModel):
     total: int
     page: int
     limit: int
+    # Pass back as ``cursor`` for the next page; None on the last page
+    next_cursor: Optional[str] = None
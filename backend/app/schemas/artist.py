@@ -27,3 +27,5 @@ class ArtistListResponse(BaseModel):
     total: int
     page: int
     limit: int
+    # Pass back as ``cursor`` for the next page; None on the last page
+    next_cursor: Optional[str] = None
@@ -2,6 +2,10 @@
 from pydantic import BaseModel
 from typing import Generic, TypeVar, List
 
+from app.schemas.artist import ArtistResponse
+from app.schemas.album import AlbumResponse
+from app.schemas.track import TrackResponse
+
 T = TypeVar("T")
 
 
@@ -17,3 +21,10 @@ class PaginatedResponse(BaseModel, Generic[T]):
 class MessageResponse(BaseModel):
     """Simple message response."""
     message: str
+
+
+class LibrarySearchResponse(BaseModel):
+    """Library search results, one list per kind."""
+    artists: List[ArtistResponse] = []
+    albums: List[AlbumResponse] = []
+    tracks: List[TrackResponse] = []
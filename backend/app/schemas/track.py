@@ -1,7 +1,7 @@
 """Track schemas."""
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
-from typing import Optional
+from typing import AbstractSet, Iterable, List, Optional
 
 
 class TrackBase(BaseModel):
@@ -49,6 +49,32 @@ class TrackResponse(TrackBase):
             is_hearted: Whether user has hearted this track
             include_album: Whether to include album/artist context (for player)
         """
+        return cls(**cls._orm_fields(track, is_hearted, include_album))
+
+    @classmethod
+    def from_orm_batch(
+        cls,
+        tracks: Iterable,
+        hearted_ids: AbstractSet[int],
+        include_album: bool = True,
+    ) -> List["TrackResponse"]:
+        """Responses for a list of tracks, as from_orm_with_quality.
+
+        The rows are trusted ORM data, so they are built with model_construct
+        and skip per-field validation.
+
+        Args:
+            tracks: Track ORM objects
+            hearted_ids: IDs of the tracks the user has hearted
+            include_album: Whether to include album/artist context (for player)
+        """
+        return [
+            cls.model_construct(**cls._orm_fields(t, t.id in hearted_ids, include_album))
+            for t in tracks
+        ]
+
+    @staticmethod
+    def _orm_fields(track, is_hearted: bool, include_album: bool) -> dict:
         data = {
             "id": track.id,
             "album_id": track.album_id,
@@ -75,4 +101,4 @@ class TrackResponse(TrackBase):
             if hasattr(track.album, 'artist') and track.album.artist:
                 data["artist_name"] = track.album.artist.name
 
-        return cls(**data)
+        return data
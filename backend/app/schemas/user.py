@@ -15,6 +15,12 @@ class UserCreate(UserBase):
     is_admin: Optional[bool] = False
 
 
+class UserUpdate(BaseModel):
+    """User update request; omitted fields are left unchanged."""
+    password: Optional[str] = None
+    is_admin: Optional[bool] = None
+
+
 class UserResponse(UserBase):
     """User response."""
     model_config = ConfigDict(from_attributes=True)
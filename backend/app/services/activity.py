@@ -1,9 +1,10 @@
 """Activity logging and broadcasting service."""
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from app.models.activity import ActivityLog
+from app.utils.pagination import after_row
 from app.websocket import broadcast_activity, notify_user
 
 
@@ -23,6 +24,30 @@ class ActivityService:
         ip_address: Optional[str] = None,
     ) -> ActivityLog:
         """Log a user activity (synchronous)."""
+        activity = self.add(
+            user_id=user_id,
+            action=action,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            details=details,
+            ip_address=ip_address,
+        )
+        self.db.commit()
+        return activity
+
+    def add(
+        self,
+        user_id: int,
+        action: str,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+    ) -> ActivityLog:
+        """Stage an activity row in the caller's transaction without committing.
+
+        Lets a mutation and its log entry share one commit.
+        """
         activity = ActivityLog(
             user_id=user_id,
             action=action,
@@ -32,8 +57,6 @@ class ActivityService:
             ip_address=ip_address,
         )
         self.db.add(activity)
-        self.db.commit()
-        self.db.refresh(activity)
         return activity
 
     async def log_and_broadcast(
@@ -241,15 +264,23 @@ class ActivityService:
         limit: int = 100,
         offset: int = 0,
         action: Optional[str] = None,
+        after_id: Optional[int] = None,
     ) -> List[ActivityLog]:
-        """Get all activity logs (admin)."""
-        query = self.db.query(ActivityLog)
+        """Get all activity logs (admin), newest first.
+
+        ``after_id`` continues after that row (keyset pagination, served by
+        ix_activity_log_created_id); ``offset`` is kept for older clients.
+        """
+        # Callers serialize rows column by column; fail loudly on lazy loads
+        query = self.db.query(ActivityLog).options(raiseload("*"))
 
         if action:
             query = query.filter(ActivityLog.action == action)
+        if after_id is not None:
+            query = query.filter(after_row(ActivityLog, after_id))
 
         return (
-            query.order_by(ActivityLog.created_at.desc())
+            query.order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc())
             .offset(offset)
             .limit(limit)
             .all()
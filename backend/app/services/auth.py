@@ -1,13 +1,47 @@
 """Authentication service."""
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 from app.config import settings
 from app.models.user import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2id for new hashes (OWASP minimum: 19 MiB, 2 passes, 1 lane), called
+# directly rather than through passlib's per-call scheme dispatch.
+_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# bcrypt hashes from before argon2 still verify and are rehashed on the next
+# successful login.
+_legacy_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def hash_password(password: str) -> str:
+    """Hash a password for storage."""
+    return _hasher.hash(password)
+
+
+def check_password(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """Verify ``password`` against ``hashed``.
+
+    Returns ``(valid, new_hash)``; ``new_hash`` is set when the stored hash
+    uses a legacy scheme or outdated parameters and should be replaced.
+    """
+    if hashed.startswith("$argon2"):
+        try:
+            _hasher.verify(hashed, password)
+        except (VerificationError, InvalidHashError):
+            return False, None
+        return True, hash_password(password) if _hasher.check_needs_rehash(hashed) else None
+
+    try:
+        valid = _legacy_context.verify(password, hashed)
+    except ValueError:
+        # Not a hash format we recognise
+        return False, None
+    return valid, hash_password(password) if valid else None
 
 
 class AuthService:
@@ -18,11 +52,11 @@ class AuthService:
 
     def verify_password(self, plain: str, hashed: str) -> bool:
         """Verify a password against its hash."""
-        return pwd_context.verify(plain, hashed)
+        return check_password(plain, hashed)[0]
 
     def hash_password(self, password: str) -> str:
         """Hash a password for storage."""
-        return pwd_context.hash(password)
+        return hash_password(password)
 
     def create_token(self, user_id: int) -> str:
         """Create a JWT token for a user."""
@@ -44,15 +78,25 @@ class AuthService:
             return None
 
     def authenticate(self, username: str, password: str) -> Optional[User]:
-        """Authenticate a user by username and password."""
+        """Authenticate a user by username and password.
+
+        Hashes made with an outdated scheme or parameters are replaced
+        with a current one after a successful match.
+        """
         user = self.db.query(User).filter(User.username == username).first()
-        if user and self.verify_password(password, user.password_hash):
-            return user
-        return None
+        if not user:
+            return None
+        valid, new_hash = check_password(password, user.password_hash)
+        if not valid:
+            return None
+        if new_hash:
+            user.password_hash = new_hash
+            self.db.commit()
+        return user
 
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get a user by ID."""
-        return self.db.query(User).filter(User.id == user_id).first()
+        return self.db.get(User, user_id)
 
     def create_user(self, username: str, password: str, is_admin: bool = False) -> User:
         """Create a new user."""
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 import httpx
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, undefer
 
 from app.models.track import Track
 from app.models.album import Album
@@ -251,9 +251,7 @@ class EnrichmentService:
         Returns:
             BatchEnrichmentResult with per-track results
         """
-        query = self.db.query(Track).filter(
-            Track.lyrics.is_(None)
-        )
+        query = self._missing_lyrics_query()
 
         if album_id:
             query = query.filter(Track.album_id == album_id)
@@ -301,15 +299,27 @@ class EnrichmentService:
         Returns:
             List of tracks without lyrics
         """
-        query = self.db.query(Track).filter(
-            Track.lyrics.is_(None)
-        )
+        query = self._missing_lyrics_query()
 
         if album_id:
             query = query.filter(Track.album_id == album_id)
 
         return query.limit(limit).all()
 
+    def _missing_lyrics_query(self):
+        """Tracks without lyrics, with everything a lyrics lookup reads.
+
+        lyrics is deferred on Track; load it with the row so the per-track
+        "already has lyrics" check doesn't issue its own SELECT. Album and
+        artist names come in the same query rather than two lazy loads per
+        track.
+        """
+        return (
+            self.db.query(Track)
+            .options(undefer(Track.lyrics), joinedload(Track.album).joinedload(Album.artist))
+            .filter(Track.lyrics.is_(None))
+        )
+
     def get_enrichment_stats(self) -> dict:
         """Get statistics about enrichable metadata.
 
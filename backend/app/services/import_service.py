@@ -2,7 +2,7 @@
 import shutil
 import logging
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import TYPE_CHECKING, Optional, List, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -11,11 +11,15 @@ from app.models.album import Album
 from app.models.track import Track
 from app.models.import_history import ImportHistory
 from app.models.pending_review import PendingReview, PendingReviewStatus
+from app import cache
 from app.utils.normalize import normalize_text
 from app.integrations.exiftool import quality_score, format_quality
 from app.services.quality import generate_checksum
 from app.services.integrity import IntegrityService, IntegrityStatus
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
 
@@ -112,7 +116,7 @@ class ImportService:
         """Async wrapper for find_duplicate."""
         return self.find_duplicate(artist, album)
 
-    def find_duplicate_by_checksum(self, checksums: list[str]) -> Optional[tuple[Album, int]]:
+    def find_duplicate_by_checksum(self, checksums: list[bytes]) -> Optional[tuple[Album, int]]:
         """Find existing album containing tracks with matching checksums.
 
         Content-based deduplication catches exact copies regardless of metadata.
@@ -158,7 +162,7 @@ class ImportService:
 
         return None
 
-    def find_all_duplicate_tracks(self, checksums: list[str]) -> dict[str, Track]:
+    def find_all_duplicate_tracks(self, checksums: list[bytes]) -> dict[bytes, Track]:
         """Find all existing tracks matching any of these checksums.
 
         Args:
@@ -177,7 +181,7 @@ class ImportService:
 
         return {t.checksum: t for t in matching}
 
-    def generate_track_checksums(self, path: Path) -> list[tuple[Path, str]]:
+    def generate_track_checksums(self, path: Path) -> list[tuple[Path, bytes]]:
         """Generate checksums for all audio files in a directory.
 
         Args:
@@ -340,7 +344,7 @@ class ImportService:
 
         # PHASE 5: Generate checksums FIRST, before any database operations
         # This enables content-based deduplication regardless of metadata
-        track_checksums: list[tuple[Path, str]] = []
+        track_checksums: list[tuple[Path, bytes]] = []
         if check_content_dupe:
             track_checksums = self.generate_track_checksums(path)
             checksums_only = [cs for _, cs in track_checksums]
@@ -543,6 +547,8 @@ class ImportService:
                     return existing
             raise ImportError(f"Database error during import: {e}")
 
+        cache.invalidate_library()
+
         # PHASE 8: Trigger lyrics enrichment if enabled
         # Only for tracks that don't already have embedded lyrics
         if enrich_on_import:
@@ -653,6 +659,7 @@ class ImportService:
             self.db.add(history)
 
         self.db.commit()
+        cache.invalidate_library()
 
         # Delete old files after database update succeeds
         if old_path and old_path.exists() and old_path != new_path:
@@ -1083,7 +1090,12 @@ class ImportService:
 
         return None
 
-    async def fetch_artist_image_from_qobuz(self, artist: Artist, artist_name: str) -> Optional[str]:
+    async def fetch_artist_image_from_qobuz(
+        self,
+        artist: Artist,
+        artist_name: str,
+        http_client: Optional["httpx.AsyncClient"] = None,
+    ) -> Optional[str]:
         """Fetch artist image and biography from Qobuz API.
 
         Updates artist with:
@@ -1093,6 +1105,8 @@ class ImportService:
         Args:
             artist: Artist model
             artist_name: Artist name to search
+            http_client: Shared client for the image download (batch callers
+                pass one to reuse connections); a short-lived one otherwise
 
         Returns:
             Path to saved artist image or None
@@ -1147,16 +1161,20 @@ class ImportService:
             artwork_path = artist_path / "artist.jpg"
 
             # Download image
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(image_url)
-                if response.status_code == 200:
-                    with open(artwork_path, "wb") as f:
-                        f.write(response.content)
-
-                    artist.artwork_path = str(artwork_path)
-                    self.db.commit()
-                    logger.info(f"Downloaded Qobuz artist image for: {artist_name}")
-                    return str(artwork_path)
+            if http_client is None:
+                async with httpx.AsyncClient(timeout=30.0) as client:
+                    response = await client.get(image_url)
+            else:
+                response = await http_client.get(image_url)
+
+            if response.status_code == 200:
+                with open(artwork_path, "wb") as f:
+                    f.write(response.content)
+
+                artist.artwork_path = str(artwork_path)
+                self.db.commit()
+                logger.info(f"Downloaded Qobuz artist image for: {artist_name}")
+                return str(artwork_path)
 
         except Exception as e:
             logger.warning(f"Failed to fetch Qobuz artist data for {artist_name}: {e}")
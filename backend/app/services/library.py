@@ -4,14 +4,16 @@ import logging
 import time
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_
-from app.models.artist import Artist
+from sqlalchemy.orm import Session, joinedload, raiseload
+from sqlalchemy import exists, func, or_, select
+from app import cache
+from app.models.artist import ARTIST_SORT_KEY, Artist
 from app.models.album import Album
 from app.models.track import Track
 from app.models.user import User
 from app.models.user_library import user_albums
 from app.services.symlink import SymlinkService
+from app.utils.pagination import after_key, next_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -81,20 +83,30 @@ class LibraryService:
         self,
         letter: Optional[str] = None,
         page: int = 1,
-        limit: int = 50
+        limit: int = 50,
+        after_id: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """List all artists, optionally filtered by starting letter."""
-        query = self.db.query(Artist).order_by(Artist.sort_name)
+        """List all artists, optionally filtered by starting letter.
+
+        Artists are ordered by sort_name, falling back to name when it is
+        unset. ``after_id`` continues after that artist (keyset pagination,
+        served by ix_artists_sort_key_id) and takes precedence over ``page``.
+        """
+        query = self.db.query(Artist).options(raiseload("*")).order_by(ARTIST_SORT_KEY, Artist.id)
 
         if letter:
             if letter == "#":
                 # Non-alphabetic starting character
-                query = query.filter(~Artist.sort_name.regexp_match("^[A-Za-z]"))
+                query = query.filter(~ARTIST_SORT_KEY.regexp_match("^[A-Za-z]"))
             else:
-                query = query.filter(Artist.sort_name.ilike(f"{letter}%"))
+                query = query.filter(ARTIST_SORT_KEY.ilike(f"{letter}%"))
 
         total = query.count()
-        items = query.offset((page - 1) * limit).limit(limit).all()
+        if after_id is not None:
+            query = query.filter(after_key((ARTIST_SORT_KEY, Artist.id), Artist.id == after_id))
+        else:
+            query = query.offset((page - 1) * limit)
+        items = query.limit(limit).all()
         pages = (total + limit - 1) // limit
 
         return {
@@ -103,6 +115,7 @@ class LibraryService:
             "page": page,
             "limit": limit,
             "pages": pages,
+            "next_cursor": next_cursor(items, limit),
         }
 
     def get_artist(self, artist_id: int) -> Optional[Artist]:
@@ -113,6 +126,7 @@ class LibraryService:
         """Get all albums for an artist, ordered by year descending."""
         return (
             self.db.query(Album)
+            .options(raiseload("*"))
             .filter(Album.artist_id == artist_id)
             .order_by(Album.year.desc())
             .all()
@@ -123,10 +137,25 @@ class LibraryService:
         artist_id: Optional[int] = None,
         letter: Optional[str] = None,
         page: int = 1,
-        limit: int = 50
+        limit: int = 50,
+        user_id: Optional[int] = None,
+        after_id: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """List albums with optional filters and artist info."""
-        query = self.db.query(Album).options(joinedload(Album.artist))
+        """List albums with optional filters and artist info.
+
+        ``artist_names`` maps each page album to its artist's name, selected
+        as a column of the page query rather than loaded as Artist objects;
+        relationship access on the returned albums raises instead of lazy
+        loading per row. With ``user_id``, ``hearted_ids`` holds the page's
+        albums that user has hearted, computed by an EXISTS in the same
+        query. ``after_id`` continues after that album (keyset pagination,
+        served by ix_albums_title_id) and takes precedence over ``page``.
+        """
+        query = (
+            self.db.query(Album, Artist.name.label("artist_name"))
+            .join(Album.artist)
+            .options(raiseload("*"))
+        )
 
         if artist_id:
             query = query.filter(Album.artist_id == artist_id)
@@ -137,23 +166,43 @@ class LibraryService:
             else:
                 query = query.filter(Album.title.ilike(f"{letter}%"))
 
-        query = query.order_by(Album.title)
+        query = query.order_by(Album.title, Album.id)
 
         total = query.count()
-        items = query.offset((page - 1) * limit).limit(limit).all()
+        if after_id is not None:
+            query = query.filter(after_key((Album.title, Album.id), Album.id == after_id))
+        else:
+            query = query.offset((page - 1) * limit)
+        query = query.limit(limit)
         pages = (total + limit - 1) // limit
 
+        hearted_ids = set()
+        if user_id is None:
+            rows = query.all()
+        else:
+            # Primary-key probe per page row instead of the user's whole set
+            is_hearted = exists().where(
+                user_albums.c.user_id == user_id,
+                user_albums.c.album_id == Album.id,
+            )
+            rows = query.add_columns(is_hearted.label("is_hearted")).all()
+            hearted_ids = {row.Album.id for row in rows if row.is_hearted}
+        items = [row.Album for row in rows]
+
         return {
             "items": items,
             "total": total,
             "page": page,
             "limit": limit,
             "pages": pages,
+            "next_cursor": next_cursor(items, limit),
+            "artist_names": {row.Album.id: row.artist_name for row in rows},
+            "hearted_ids": hearted_ids,
         }
 
     def get_album(self, album_id: int) -> Optional[Album]:
-        """Get a single album by ID."""
-        return self.db.query(Album).filter(Album.id == album_id).first()
+        """Get a single album by ID, with its artist joined in."""
+        return self.db.get(Album, album_id, options=[joinedload(Album.artist), raiseload("*")])
 
     def get_album_tracks(self, album_id: int) -> List[Track]:
         """Get all tracks for an album, ordered by disc and track number.
@@ -177,32 +226,49 @@ class LibraryService:
         query: str,
         search_type: str = "all",
         limit: int = 20
-    ) -> Dict[str, List]:
-        """Search library by query string."""
-        results = {"artists": [], "albums": [], "tracks": []}
+    ) -> Dict[str, Any]:
+        """Search library by query string.
+
+        ``artist_names`` maps each album in ``albums`` to its artist's name;
+        the albums' own relationships are not loaded. ``album_counts`` maps
+        each artist in ``artists`` to its number of albums, counted in the
+        same query.
+        """
+        results = {"artists": [], "albums": [], "tracks": [], "artist_names": {}, "album_counts": {}}
         pattern = f"%{query}%"
 
         if search_type in ("all", "artist"):
-            results["artists"] = (
-                self.db.query(Artist)
+            album_count = (
+                select(func.count(Album.id))
+                .where(Album.artist_id == Artist.id)
+                .correlate(Artist)
+                .scalar_subquery()
+            )
+            rows = (
+                self.db.query(Artist, album_count)
                 .filter(Artist.name.ilike(pattern))
                 .limit(limit)
                 .all()
             )
+            results["artists"] = [artist for artist, _ in rows]
+            results["album_counts"] = {artist.id: count for artist, count in rows}
 
         if search_type in ("all", "album"):
-            results["albums"] = (
-                self.db.query(Album)
-                .options(joinedload(Album.artist))
+            rows = (
+                self.db.query(Album, Artist.name)
+                .join(Album.artist)
+                .options(raiseload("*"))
                 .filter(Album.title.ilike(pattern))
                 .limit(limit)
                 .all()
             )
+            results["albums"] = [album for album, _ in rows]
+            results["artist_names"] = {album.id: name for album, name in rows}
 
         if search_type in ("all", "track"):
             results["tracks"] = (
                 self.db.query(Track)
-                .options(joinedload(Track.album).joinedload(Album.artist))
+                .options(joinedload(Track.album).joinedload(Album.artist), raiseload("*"))
                 .filter(Track.title.ilike(pattern))
                 .limit(limit)
                 .all()
@@ -322,6 +388,7 @@ class LibraryService:
             # Delete album from database
             self.db.delete(album)
             self.db.commit()
+            cache.invalidate_library()
 
             logger.info(f"Successfully deleted album from database: {artist_name} - {album_title}")
             return True, None
@@ -403,6 +470,7 @@ class LibraryService:
 
             self.db.delete(artist)
             self.db.commit()
+            cache.invalidate_library()
             logger.info(f"Successfully deleted artist from database: {artist_name}")
             return True, None
         except Exception as e:
@@ -141,7 +141,7 @@ class QualityService:
         return "Unknown"
 
 
-def generate_checksum(file_path: Path, algorithm: str = "blake3") -> str:
+def generate_checksum(file_path: Path, algorithm: str = "blake3") -> bytes:
     """Generate checksum for integrity verification and deduplication.
 
     Args:
@@ -149,7 +149,8 @@ def generate_checksum(file_path: Path, algorithm: str = "blake3") -> str:
         algorithm: Hash algorithm - "blake3" (default, faster) or "sha256" (fallback)
 
     Returns:
-        Hex digest of the file contents
+        Raw 32-byte digest of the file contents (stored as BYTEA/BLOB;
+        use ``.hex()`` for display)
 
     BLAKE3 benefits over SHA-256:
         - 3-5x faster on single core
@@ -169,15 +170,15 @@ def generate_checksum(file_path: Path, algorithm: str = "blake3") -> str:
         for chunk in iter(lambda: f.read(chunk_size), b""):
             hasher.update(chunk)
 
-    return hasher.hexdigest()
+    return hasher.digest()
 
 
-def verify_checksum(file_path: Path, expected: str) -> bool:
+def verify_checksum(file_path: Path, expected: bytes) -> bool:
     """Verify file integrity against stored checksum.
 
     Args:
         file_path: Path to the file to verify
-        expected: Expected checksum (hex digest)
+        expected: Expected checksum (raw digest)
 
     Returns:
         True if checksum matches, False otherwise
@@ -1,8 +1,11 @@
 """User library service for managing hearted albums/tracks."""
 import logging
-from typing import Dict, Any, Optional, List, Tuple
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import insert, delete, select, update
+from typing import Dict, Any, Optional, List, Sequence, Tuple
+from sqlalchemy.orm import Session, joinedload, raiseload
+from sqlalchemy import and_, delete, literal, select
+from app import cache
+from app.config import settings
+from app.database import conflict_insert
 from app.models.user import User
 from app.models.album import Album
 from app.models.track import Track
@@ -10,6 +13,7 @@ from app.models.user_library import user_albums, user_tracks
 from app.models.user_artists import user_artists
 from app.services.symlink import SymlinkService
 from app.services.activity import ActivityService
+from app.utils.pagination import after_key, next_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -20,24 +24,37 @@ class UserLibraryService:
     def __init__(self, db: Session):
         self.db = db
         self.symlink = SymlinkService()
+        # Hearted id sets already read during this request, by (user_id, kind)
+        self._hearted: Dict[Tuple[int, str], frozenset] = {}
 
     def get_library(
         self,
         user_id: int,
         page: int = 1,
-        limit: int = 50
+        limit: int = 50,
+        after_id: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Get user's hearted albums with artist info."""
+        """Get user's hearted albums with artist info, most recently hearted first.
+
+        ``after_id`` continues after that album (keyset pagination, served
+        by ix_user_albums_user_added) and takes precedence over ``page``.
+        """
+        key = (user_albums.c.added_at, user_albums.c.album_id)
         query = (
             self.db.query(Album)
-            .options(joinedload(Album.artist))
+            .options(joinedload(Album.artist), raiseload("*"))
             .join(user_albums, Album.id == user_albums.c.album_id)
             .filter(user_albums.c.user_id == user_id)
-            .order_by(user_albums.c.added_at.desc())
+            .order_by(*(column.desc() for column in key))
         )
 
         total = query.count()
-        items = query.offset((page - 1) * limit).limit(limit).all()
+        if after_id is not None:
+            anchor = and_(user_albums.c.user_id == user_id, user_albums.c.album_id == after_id)
+            query = query.filter(after_key(key, anchor, descending=True))
+        else:
+            query = query.offset((page - 1) * limit)
+        items = query.limit(limit).all()
         pages = (total + limit - 1) // limit
 
         # Mark all as hearted
@@ -50,40 +67,36 @@ class UserLibraryService:
             "page": page,
             "limit": limit,
             "pages": pages,
+            "next_cursor": next_cursor(items, limit),
         }
 
     def heart_album(self, user_id: int, album_id: int, username: str) -> bool:
         """Heart an album - add to user library and create symlinks."""
-        # Check if already hearted
-        existing = self.db.execute(
-            select(user_albums).where(
-                user_albums.c.user_id == user_id,
-                user_albums.c.album_id == album_id
-            )
-        ).first()
-
-        if existing:
-            return False  # Already hearted
-
         # Get album for path
         album = self.db.query(Album).filter(Album.id == album_id).first()
         if not album:
             raise ValueError("Album not found")
 
-        # Add to database
-        self.db.execute(
-            insert(user_albums).values(user_id=user_id, album_id=album_id)
-        )
+        # Add to database; the primary key decides whether it was already
+        # hearted, so concurrent hearts cannot both log and link
+        added = self.db.execute(
+            conflict_insert(self.db, user_albums)
+            .values(user_id=user_id, album_id=album_id)
+            .on_conflict_do_nothing(index_elements=[user_albums.c.user_id, user_albums.c.album_id])
+            .returning(user_albums.c.album_id)
+        ).first()
+        if added is None:
+            return False  # Already hearted
+
+        # Log activity in the same commit
+        ActivityService(self.db).add(user_id, "heart", "album", album_id)
         self.db.commit()
+        self._invalidate_hearted(user_id)
 
         # Create symlinks
         if album.path:
             self.symlink.create_album_links(username, album.path)
 
-        # Log activity
-        activity = ActivityService(self.db)
-        activity.log(user_id, "heart", "album", album_id)
-
         return True
 
     def unheart_album(self, user_id: int, album_id: int, username: str) -> bool:
@@ -93,34 +106,25 @@ class UserLibraryService:
         if not album:
             return False
 
-        # Check if hearted
-        existing = self.db.execute(
-            select(user_albums).where(
-                user_albums.c.user_id == user_id,
-                user_albums.c.album_id == album_id
-            )
-        ).first()
-
-        if not existing:
-            return False  # Not hearted
-
         # Remove from database
-        self.db.execute(
+        removed = self.db.execute(
             delete(user_albums).where(
                 user_albums.c.user_id == user_id,
                 user_albums.c.album_id == album_id
             )
         )
+        if not removed.rowcount:
+            return False  # Not hearted
+
+        # Log activity in the same commit
+        ActivityService(self.db).add(user_id, "unheart", "album", album_id)
         self.db.commit()
+        self._invalidate_hearted(user_id)
 
         # Remove symlinks
         if album.path:
             self.symlink.remove_album_links(username, album.path)
 
-        # Log activity
-        activity = ActivityService(self.db)
-        activity.log(user_id, "unheart", "album", album_id)
-
         return True
 
     def is_album_hearted(self, user_id: int, album_id: int) -> bool:
@@ -135,36 +139,30 @@ class UserLibraryService:
 
     def heart_track(self, user_id: int, track_id: int, username: str) -> bool:
         """Heart an individual track."""
-        # Check if already hearted
-        existing = self.db.execute(
-            select(user_tracks).where(
-                user_tracks.c.user_id == user_id,
-                user_tracks.c.track_id == track_id
-            )
-        ).first()
-
-        if existing:
-            return False  # Already hearted
-
         # Get track for path
         track = self.db.query(Track).filter(Track.id == track_id).first()
         if not track:
             raise ValueError("Track not found")
 
-        # Add to database
-        self.db.execute(
-            insert(user_tracks).values(user_id=user_id, track_id=track_id)
-        )
+        # Add to database unless already hearted
+        added = self.db.execute(
+            conflict_insert(self.db, user_tracks)
+            .values(user_id=user_id, track_id=track_id)
+            .on_conflict_do_nothing(index_elements=[user_tracks.c.user_id, user_tracks.c.track_id])
+            .returning(user_tracks.c.track_id)
+        ).first()
+        if added is None:
+            return False  # Already hearted
+
+        # Log activity in the same commit
+        ActivityService(self.db).add(user_id, "heart", "track", track_id)
         self.db.commit()
+        self._invalidate_hearted(user_id)
 
         # Create symlink for individual track
         if track.path:
             self.symlink.create_track_link(username, track.path)
 
-        # Log activity
-        activity = ActivityService(self.db)
-        activity.log(user_id, "heart", "track", track_id)
-
         # Check if all tracks on the album are now hearted - auto-heart album
         self._check_auto_heart_album(user_id, track.album_id, username)
 
@@ -252,30 +250,22 @@ class UserLibraryService:
         if not track:
             return False
 
-        existing = self.db.execute(
-            select(user_tracks).where(
-                user_tracks.c.user_id == user_id,
-                user_tracks.c.track_id == track_id
-            )
-        ).first()
-
-        if not existing:
-            return False
-
-        self.db.execute(
+        removed = self.db.execute(
             delete(user_tracks).where(
                 user_tracks.c.user_id == user_id,
                 user_tracks.c.track_id == track_id
             )
         )
+        if not removed.rowcount:
+            return False
+
+        ActivityService(self.db).add(user_id, "unheart", "track", track_id)
         self.db.commit()
+        self._invalidate_hearted(user_id)
 
         if track.path:
             self.symlink.remove_track_link(username, track.path)
 
-        activity = ActivityService(self.db)
-        activity.log(user_id, "unheart", "track", track_id)
-
         return True
 
     def is_track_hearted(self, user_id: int, track_id: int) -> bool:
@@ -309,20 +299,67 @@ class UserLibraryService:
 
         return False
 
-    def get_hearted_album_ids(self, user_id: int) -> set:
-        """Get set of album IDs hearted by user."""
+    def get_hearted_ids(self, user_id: int, kinds: Sequence[str]) -> Dict[str, frozenset]:
+        """Hearted ids of each of ``kinds`` ("artist", "album", "track").
+
+        Each set is read at most once per service instance. The ones not yet
+        read come from Redis in a single round trip, and any misses there
+        from their loaders. Heart/unheart and library changes drop the
+        cached sets and stop loads already under way from storing theirs;
+        the TTL only bounds staleness from writes that bypass this service.
+        """
+        missing = [kind for kind in kinds if (user_id, kind) not in self._hearted]
+        if missing:
+            for kind, ids in self._fetch_ids(user_id, missing).items():
+                self._hearted[(user_id, kind)] = ids
+        return {kind: self._hearted[(user_id, kind)] for kind in kinds}
+
+    def _fetch_ids(self, user_id: int, kinds: List[str]) -> Dict[str, frozenset]:
+        loaders = {
+            "artist": self._load_hearted_artist_ids,
+            "album": self._load_hearted_album_ids,
+            "track": self._load_hearted_track_ids,
+        }
+        ttl = settings.hearted_cache_ttl
+        if not ttl:
+            return {kind: loaders[kind](user_id) for kind in kinds}
+
+        cached, generation = cache.get_hearted(user_id, kinds)
+        fetched = {}
+        for kind, value in zip(kinds, cached):
+            if value is not None:
+                fetched[kind] = frozenset(value)
+            else:
+                fetched[kind] = loaders[kind](user_id)
+                cache.set_hearted(user_id, kind, sorted(fetched[kind]), ttl, generation)
+        return fetched
+
+    def _invalidate_hearted(self, user_id: int) -> None:
+        """Forget a user's hearted id sets here and in Redis."""
+        for kind in cache.HEARTED_KINDS:
+            self._hearted.pop((user_id, kind), None)
+        cache.invalidate_hearted(user_id)
+
+    def get_hearted_album_ids(self, user_id: int) -> frozenset:
+        """Get the album IDs hearted by user (cached)."""
+        return self.get_hearted_ids(user_id, ("album",))["album"]
+
+    def _load_hearted_album_ids(self, user_id: int) -> frozenset:
         result = self.db.execute(
             select(user_albums.c.album_id).where(user_albums.c.user_id == user_id)
         ).fetchall()
-        return {row[0] for row in result}
+        return frozenset(row[0] for row in result)
 
-    def get_hearted_track_ids(self, user_id: int) -> set:
-        """Get set of track IDs hearted by user.
+    def get_hearted_track_ids(self, user_id: int) -> frozenset:
+        """Get the track IDs hearted by user (cached).
 
         Returns track IDs that are either:
         1. Individually hearted (in user_tracks)
         2. From a hearted album (album in user_albums)
         """
+        return self.get_hearted_ids(user_id, ("track",))["track"]
+
+    def _load_hearted_track_ids(self, user_id: int) -> frozenset:
         from sqlalchemy import union
 
         # Individually hearted tracks
@@ -340,7 +377,7 @@ class UserLibraryService:
         # Combine both
         combined = union(individual, from_albums)
         result = self.db.execute(combined).fetchall()
-        return {row[0] for row in result}
+        return frozenset(row[0] for row in result)
 
     def heart_artist(self, user_id: int, artist_id: int, username: str, auto_add_new: bool = True) -> int:
         """Heart all albums by an artist and subscribe to new releases.
@@ -361,43 +398,41 @@ class UserLibraryService:
             raise ValueError("Artist not found")
 
         # Add/update user_artists subscription
-        existing = self.db.execute(
-            select(user_artists).where(
-                user_artists.c.user_id == user_id,
-                user_artists.c.artist_id == artist_id
+        self.db.execute(
+            conflict_insert(self.db, user_artists)
+            .values(user_id=user_id, artist_id=artist_id, auto_add_new=auto_add_new)
+            .on_conflict_do_update(
+                index_elements=[user_artists.c.user_id, user_artists.c.artist_id],
+                set_={"auto_add_new": auto_add_new},
             )
-        ).first()
+        )
 
-        if not existing:
-            self.db.execute(
-                insert(user_artists).values(
-                    user_id=user_id,
-                    artist_id=artist_id,
-                    auto_add_new=auto_add_new
-                )
-            )
-        else:
-            # Update auto_add_new setting
-            self.db.execute(
-                update(user_artists).where(
-                    user_artists.c.user_id == user_id,
-                    user_artists.c.artist_id == artist_id
-                ).values(auto_add_new=auto_add_new)
+        # Heart all existing albums in one statement; RETURNING yields only
+        # the ones that were not hearted already
+        added = self.db.execute(
+            conflict_insert(self.db, user_albums)
+            .from_select(
+                ["user_id", "album_id"],
+                select(literal(user_id), Album.id).where(Album.artist_id == artist_id),
             )
+            .on_conflict_do_nothing(index_elements=[user_albums.c.user_id, user_albums.c.album_id])
+            .returning(user_albums.c.album_id)
+        ).scalars().all()
+        activity = ActivityService(self.db)
+        for album_id in added:
+            activity.add(user_id, "heart", "album", album_id)
         self.db.commit()
+        count = len(added)
 
-        # Heart all existing albums
-        albums = self.db.query(Album).filter(Album.artist_id == artist_id).all()
-        count = 0
-        for album in albums:
-            try:
-                if self.heart_album(user_id, album.id, username):
-                    count += 1
-            except ValueError:
-                pass  # Album might not exist
+        if added:
+            self._invalidate_hearted(user_id)
+            paths = self.db.execute(
+                select(Album.path).where(Album.id.in_(added), Album.path.is_not(None))
+            ).scalars().all()
+            for path in paths:
+                self.symlink.create_album_links(username, path)
 
         # Log activity for artist
-        activity = ActivityService(self.db)
         activity.log(user_id, "heart", "artist", artist_id, {"album_count": count, "auto_add_new": auto_add_new})
 
         return count
@@ -427,12 +462,10 @@ class UserLibraryService:
             if self.unheart_album(user_id, album.id, username):
                 count += 1
 
+        # Log activity for artist in the same commit
+        ActivityService(self.db).add(user_id, "unheart", "artist", artist_id, {"album_count": count})
         self.db.commit()
 
-        # Log activity for artist
-        activity = ActivityService(self.db)
-        activity.log(user_id, "unheart", "artist", artist_id, {"album_count": count})
-
         return count
 
     def is_artist_hearted(self, user_id: int, artist_id: int) -> bool:
@@ -466,11 +499,14 @@ class UserLibraryService:
         ).first()
         return track_result is not None
 
-    def get_hearted_artist_ids(self, user_id: int) -> set:
-        """Get set of artist IDs where user has hearted content.
+    def get_hearted_artist_ids(self, user_id: int) -> frozenset:
+        """Get the artist IDs where user has hearted content (cached).
 
         Includes artists with hearted albums OR hearted tracks.
         """
+        return self.get_hearted_ids(user_id, ("artist",))["artist"]
+
+    def _load_hearted_artist_ids(self, user_id: int) -> frozenset:
         from sqlalchemy import union
 
         # Artists from hearted albums
@@ -490,7 +526,7 @@ class UserLibraryService:
 
         combined = union(from_albums, from_tracks)
         result = self.db.execute(combined).fetchall()
-        return {row[0] for row in result}
+        return frozenset(row[0] for row in result)
 
     def get_library_artists(
         self,
@@ -618,7 +654,7 @@ class UserLibraryService:
         # Get albums matching the combined IDs
         albums = (
             self.db.query(Album)
-            .options(joinedload(Album.artist))
+            .options(joinedload(Album.artist), raiseload("*"))
             .join(combined_ids, Album.id == combined_ids.c.album_id)
             .filter(Album.artist_id == artist_id)
             .order_by(Album.year.desc(), Album.title)
@@ -640,7 +676,7 @@ class UserLibraryService:
         """Get ALL tracks from user's hearted albums."""
         query = (
             self.db.query(Track)
-            .options(joinedload(Track.album).joinedload(Album.artist))
+            .options(joinedload(Track.album).joinedload(Album.artist), raiseload("*"))
             .join(Album, Track.album_id == Album.id)
             .join(user_albums, Album.id == user_albums.c.album_id)
             .filter(user_albums.c.user_id == user_id)
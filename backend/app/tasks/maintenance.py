@@ -136,8 +136,8 @@ def verify_integrity(include_flac_stream: bool = True):
                         issues.append({
                             "track_id": track.id,
                             "issue": "checksum_mismatch",
-                            "expected": track.checksum,
-                            "actual": current_hash,
+                            "expected": track.checksum.hex(),
+                            "actual": current_hash.hex(),
                             "path": track.path
                         })
                 except Exception as e:
@@ -353,6 +353,56 @@ def update_library_stats():
         db.close()
 
 
+@shared_task(name="app.tasks.maintenance.rotate_activity_partitions")
+def rotate_activity_partitions(months_ahead: int = 3, batch_size: int = 5000):
+    """Enforce activity_log retention.
+
+    When activity_log is range-partitioned (Postgres baseline), roll monthly
+    partitions forward and drop expired ones. Tables created unpartitioned
+    (create_all, SQLite) fall back to batched deletes of expired rows.
+    """
+    from app.config import settings
+    from app.database import engine
+    from app.utils.partitions import (
+        delete_batch_before,
+        drop_partitions_before,
+        ensure_month_partitions,
+        is_partitioned,
+    )
+
+    try:
+        today = datetime.utcnow().date()
+        cutoff = today - timedelta(days=settings.activity_retention_days)
+
+        with engine.begin() as conn:
+            partitioned = is_partitioned(conn, "activity_log")
+
+        if not partitioned:
+            deleted = 0
+            while True:
+                with engine.begin() as conn:
+                    count = delete_batch_before(conn, "activity_log", "created_at", cutoff, batch_size)
+                deleted += count
+                if count < batch_size:
+                    break
+            if deleted:
+                logger.info(f"Deleted {deleted} expired activity_log rows")
+            return {"deleted": deleted}
+
+        with engine.begin() as conn:
+            created = ensure_month_partitions(conn, "activity_log", today, months_ahead)
+            dropped = drop_partitions_before(conn, "activity_log", cutoff)
+
+        if dropped:
+            logger.info(f"Dropped expired activity_log partitions: {', '.join(dropped)}")
+
+        return {"ensured": created, "dropped": dropped}
+
+    except Exception as e:
+        logger.error(f"Activity partition rotation failed: {e}")
+        return {"error": str(e)}
+
+
 @shared_task(name="app.tasks.maintenance.cleanup_empty_folders")
 def cleanup_empty_folders():
     """Remove empty folders in library and user directories."""
@@ -378,7 +428,7 @@ def cleanup_empty_folders():
     return {"cleaned": cleaned}
 
 
-@shared_task(name="app.tasks.maintenance.run_backup")
+@shared_task(name="app.tasks.maintenance.run_backup", ignore_result=True)
 def run_backup(backup_id: int, destination: str):
     """Run backup to specified destination.
 
@@ -459,7 +509,7 @@ def run_backup(backup_id: int, destination: str):
         db.close()
 
 
-@shared_task(name="app.tasks.maintenance.scan_library")
+@shared_task(name="app.tasks.maintenance.scan_library", ignore_result=True)
 def scan_library():
     """Full library rescan.
 
@@ -468,6 +518,7 @@ def scan_library():
     - Updates metadata for existing tracks
     - Marks missing files as unavailable
     """
+    from app import cache
     from app.config import settings
     from app.models.album import Album
     from app.models.track import Track
@@ -553,6 +604,7 @@ def scan_library():
                     })
 
         db.commit()
+        cache.invalidate_library()
 
         return {
             "scanned": scanned_albums,
@@ -1,8 +1,16 @@
 """Text normalization utilities."""
 import re
 import unicodedata
+from functools import lru_cache
 
+# Compiled once: normalize_text runs per row during imports and matching
+_PARENTHETICAL = re.compile(r"\([^)]*\)")
+_BRACKETED = re.compile(r"\[[^\]]*\]")
+_PUNCTUATION = re.compile(r"[^a-z0-9\s]")
+_WHITESPACE = re.compile(r"\s+")
 
+
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """
     Normalize text for comparison.
@@ -13,6 +21,9 @@ def normalize_text(text: str) -> str:
     - Remove punctuation
     - Collapse whitespace
     - Normalize unicode
+
+    Results are memoized: imports and catalog matching normalize the same
+    artist names over and over.
     """
     if not text:
         return ""
@@ -28,16 +39,16 @@ def normalize_text(text: str) -> str:
     text = text.lower()
 
     # Remove parenthetical content
-    text = re.sub(r"\([^)]*\)", "", text)
+    text = _PARENTHETICAL.sub("", text)
 
     # Remove bracketed content
-    text = re.sub(r"\[[^\]]*\]", "", text)
+    text = _BRACKETED.sub("", text)
 
     # Remove punctuation (keep alphanumeric and spaces)
-    text = re.sub(r"[^a-z0-9\s]", "", text)
+    text = _PUNCTUATION.sub("", text)
 
     # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE.sub(" ", text).strip()
 
     return text
 
@@ -0,0 +1,56 @@
+"""Keyset cursors for paged listings.
+
+Pages are ordered by a unique key, ``(created_at DESC, id DESC)`` for
+newest-first logs or a sort column plus id for browse lists, and a cursor
+names the last row of the previous page. The next page continues strictly
+after that row, so deep pages cost the same as the first instead of
+scanning and discarding OFFSET rows.
+
+The anchor row's ``(created_at, id)`` is read back with a row-value
+subquery rather than round-tripped through the cursor, so the comparison
+always uses the stored timestamp exactly (SQLite keeps server-default
+timestamps without microseconds, which a bound datetime would not match).
+"""
+import base64
+from typing import Optional
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def encode_cursor(row_id: int) -> str:
+    """Opaque, URL-safe token for a row id."""
+    return base64.urlsafe_b64encode(str(row_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> int:
+    """Row id from an ``encode_cursor`` token; raises ValueError if malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        return int(base64.urlsafe_b64decode(padded).decode())
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+
+
+def next_cursor(rows: list, limit: int) -> Optional[str]:
+    """Cursor for the page after ``rows``, or None when this page is the last."""
+    if len(rows) < limit:
+        return None
+    return encode_cursor(rows[-1].id)
+
+
+def after_key(columns: tuple, anchor: ColumnElement, descending: bool = False) -> ColumnElement:
+    """Filter for rows sorting after the row ``anchor`` selects.
+
+    ``columns`` is the whole ORDER BY key, all ascending or all descending,
+    and must end in a unique column. Its columns must not be NULL: a NULL
+    key compares as unknown and the row would drop out of every page.
+    """
+    key = select(*columns).where(anchor).correlate(None).scalar_subquery()
+    row = tuple_(*columns)
+    return row < key if descending else row > key
+
+
+def after_row(model, row_id: int) -> ColumnElement:
+    """Filter for rows sorting after ``row_id`` under (created_at DESC, id DESC)."""
+    return after_key((model.created_at, model.id), model.id == row_id, descending=True)
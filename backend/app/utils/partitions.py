@@ -0,0 +1,118 @@
+"""Monthly range partitions for append-only Postgres tables.
+
+Partitioned tables are created by the baseline migration on Postgres only;
+every helper here is a no-op on other dialects or on tables that were
+created unpartitioned (e.g. by Base.metadata.create_all).
+"""
+import re
+from datetime import date
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+_PARTITION_SUFFIX = re.compile(r"_y(\d{4})m(\d{2})$")
+
+
+def month_start(day: date) -> date:
+    """First day of the month containing ``day``."""
+    return day.replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    """Shift a month-start date by ``count`` months."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Name of the partition holding ``month``, e.g. activity_log_y2026m01."""
+    return f"{table}_y{month.year}m{month.month:02d}"
+
+
+def month_partition_ddl(table: str, month: date) -> str:
+    """CREATE statement for the partition covering one calendar month."""
+    month = month_start(month)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} "
+        f"PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def default_partition_ddl(table: str) -> str:
+    """CREATE statement for the catch-all partition (rows outside any month)."""
+    return f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+
+
+def is_partitioned(conn: Connection, table: str) -> bool:
+    """Whether ``table`` is a declaratively partitioned Postgres table."""
+    if conn.dialect.name != "postgresql":
+        return False
+    return conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :table"
+        ),
+        {"table": table},
+    ).first() is not None
+
+
+def ensure_month_partitions(conn: Connection, table: str, start: date, months: int) -> List[str]:
+    """Create partitions for ``months`` calendar months from ``start``."""
+    if not is_partitioned(conn, table):
+        return []
+
+    created = []
+    month = month_start(start)
+    for _ in range(months):
+        conn.execute(text(month_partition_ddl(table, month)))
+        created.append(partition_name(table, month))
+        month = add_months(month, 1)
+    return created
+
+
+def delete_batch_before(conn: Connection, table: str, column: str, cutoff: date, batch_size: int) -> int:
+    """Delete up to ``batch_size`` rows older than ``cutoff``; returns the count.
+
+    Retention fallback for unpartitioned tables. Callers commit between
+    batches so no single transaction locks the whole expired range.
+    """
+    return conn.execute(
+        text(
+            f"DELETE FROM {table} WHERE id IN ("
+            f"SELECT id FROM {table} WHERE {column} < :cutoff LIMIT :batch)"
+        ),
+        {"cutoff": cutoff, "batch": batch_size},
+    ).rowcount
+
+
+def drop_partitions_before(conn: Connection, table: str, cutoff: date) -> List[str]:
+    """Drop monthly partitions whose whole range ends on or before ``cutoff``.
+
+    Dropping a partition is O(1) DDL, unlike DELETE + VACUUM on a single table.
+    """
+    if not is_partitioned(conn, table):
+        return []
+
+    children = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table"
+        ),
+        {"table": table},
+    ).scalars().all()
+
+    dropped = []
+    for name in children:
+        match = _PARTITION_SUFFIX.search(name)
+        if not match:
+            continue  # default partition
+        month = date(int(match.group(1)), int(match.group(2)), 1)
+        if add_months(month, 1) <= cutoff:
+            conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            dropped.append(name)
+    return dropped
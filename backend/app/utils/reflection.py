@@ -0,0 +1,79 @@
+"""Cached schema reflection for Alembic migrations.
+
+Each ``sa.inspect(bind)`` call builds a fresh Inspector, and every
+``get_columns``/``get_indexes`` on it is another catalog query. Migrations
+share one Inspector per connection instead, so a table is reflected once
+per upgrade run; callers invalidate after DDL that changes it.
+"""
+from typing import Any, Dict, FrozenSet, Optional, Sequence
+from weakref import WeakKeyDictionary
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.types import TypeEngine
+
+_inspectors: "WeakKeyDictionary[Connection, Inspector]" = WeakKeyDictionary()
+
+
+def inspector(bind: Connection) -> Inspector:
+    """Inspector for ``bind``, reused across migrations in the same run."""
+    cached = _inspectors.get(bind)
+    if cached is None:
+        cached = _inspectors[bind] = sa.inspect(bind)
+    return cached
+
+
+def column_types(bind: Connection, table: str) -> Dict[str, TypeEngine]:
+    """Map of column name to reflected type (empty if the table is missing)."""
+    if not inspector(bind).has_table(table):
+        return {}
+    return {c["name"]: c["type"] for c in inspector(bind).get_columns(table)}
+
+
+def column_type(bind: Connection, table: str, column: str) -> Optional[TypeEngine]:
+    """Reflected type of one column, or None if it does not exist."""
+    return column_types(bind, table).get(column)
+
+
+def index_names(bind: Connection, table: str) -> FrozenSet[str]:
+    """Names of the indexes on ``table``."""
+    if not inspector(bind).has_table(table):
+        return frozenset()
+    return frozenset(i["name"] for i in inspector(bind).get_indexes(table))
+
+
+def invalidate(bind: Connection) -> None:
+    """Forget reflected state after DDL on ``bind``."""
+    cached = _inspectors.get(bind)
+    if cached is not None:
+        cached.clear_cache()
+
+
+def create_index_once(
+    name: str,
+    table: str,
+    columns: Sequence[Any],
+    legacy: Optional[str] = None,
+    concurrently: bool = True,
+    **kw: Any,
+) -> None:
+    """Create index ``name`` unless it, or its db/init twin ``legacy``, exists.
+
+    On a live Postgres connection the index is built CONCURRENTLY, outside
+    the migration transaction, so writes to ``table`` are not blocked while
+    it builds. Offline SQL and other dialects use CREATE INDEX IF NOT EXISTS.
+    """
+    context = op.get_context()
+    if not context.as_sql:
+        existing = index_names(op.get_bind(), table)
+        if name in existing or legacy in existing:
+            return
+    if concurrently and context.dialect.name == 'postgresql' and not context.as_sql:
+        with context.autocommit_block():
+            op.create_index(name, table, columns, postgresql_concurrently=True, **kw)
+    else:
+        op.create_index(name, table, columns, if_not_exists=True, **kw)
+    if not context.as_sql:
+        invalidate(op.get_bind())
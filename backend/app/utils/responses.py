@@ -0,0 +1,13 @@
+"""Response helpers."""
+from typing import Union
+
+from fastapi.responses import Response
+
+
+def json_response(content: Union[str, bytes]) -> Response:
+    """Wrap JSON already serialized by pydantic-core.
+
+    FastAPI sends a returned Response as-is, so the route's response_model
+    still documents the payload but is not validated or re-encoded.
+    """
+    return Response(content=content, media_type="application/json")
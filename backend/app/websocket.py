@@ -5,11 +5,21 @@ Per-user tracking with heartbeat for connection keepalive.
 import asyncio
 from typing import Dict, Set, Optional
 from datetime import datetime, timezone
+import orjson
 from fastapi import WebSocket
 from app.database import SessionLocal
 from app.models.user import User
 
 
+def encode_message(message: dict) -> str:
+    """JSON text frame for ``message``.
+
+    Encoded once with orjson however many sockets receive it; clients still
+    get ordinary JSON text frames.
+    """
+    return orjson.dumps(message).decode()
+
+
 class ConnectionManager:
     """Manages WebSocket connections per user."""
 
@@ -53,6 +63,16 @@ class ConnectionManager:
 
     async def send_to_user(self, user_id: int, message: dict):
         """Send message to specific user's connections."""
+        await self._send_text(user_id, encode_message(message))
+
+    async def broadcast_all(self, message: dict):
+        """Send message to all connected users."""
+        text = encode_message(message)
+        for user_id in list(self.active_connections.keys()):
+            await self._send_text(user_id, text)
+
+    async def _send_text(self, user_id: int, text: str):
+        """Send an already encoded frame to a user's connections."""
         if user_id not in self.active_connections:
             return
 
@@ -60,7 +80,7 @@ class ConnectionManager:
 
         for connection in self.active_connections[user_id]:
             try:
-                await connection.send_json(message)
+                await connection.send_text(text)
             except Exception:
                 dead_connections.add(connection)
 
@@ -68,21 +88,16 @@ class ConnectionManager:
         for conn in dead_connections:
             self.disconnect(conn, user_id)
 
-    async def broadcast_all(self, message: dict):
-        """Send message to all connected users."""
-        for user_id in list(self.active_connections.keys()):
-            await self.send_to_user(user_id, message)
-
     async def _heartbeat(self, websocket: WebSocket, user_id: int):
         """Send periodic heartbeat to keep connection alive."""
         try:
             while websocket in self.active_connections.get(user_id, set()):
                 await asyncio.sleep(self.heartbeat_interval)
                 try:
-                    await websocket.send_json({
+                    await websocket.send_text(encode_message({
                         "type": "heartbeat",
                         "timestamp": datetime.now(timezone.utc).isoformat()
-                    })
+                    }))
                 except Exception:
                     self.disconnect(websocket, user_id)
                     break
@@ -40,6 +40,7 @@ celery_app.conf.update(
     # Task execution settings
     task_acks_late=True,  # Acknowledge after task completes
     task_reject_on_worker_lost=True,
+    task_track_started=True,  # STARTED state lets revoke_task spare queued tasks
 
     # Worker settings
     worker_prefetch_multiplier=1,  # One task at a time per worker
@@ -111,6 +112,13 @@ celery_app.conf.update(
             "options": {"queue": "maintenance"}
         },
 
+        # Roll activity_log partitions forward daily at 2:30 AM
+        "rotate-activity-partitions": {
+            "task": "app.tasks.maintenance.rotate_activity_partitions",
+            "schedule": crontab(hour=2, minute=30),
+            "options": {"queue": "maintenance"}
+        },
+
         # Clean up empty folders weekly on Sunday at 5 AM
         "cleanup-empty-folders": {
             "task": "app.tasks.maintenance.cleanup_empty_folders",
@@ -130,6 +138,17 @@ celery_app.conf.update(
 )
 
 
+def revoke_task(task_id: str) -> None:
+    """Cancel a queued or running task.
+
+    Queued and retry-scheduled tasks are dropped by id when a worker
+    receives them; only a task a worker has already started gets its
+    process signalled, instead of terminating on every cancel.
+    """
+    started = celery_app.AsyncResult(task_id).state == "STARTED"
+    celery_app.control.revoke(task_id, terminate=started)
+
+
 # Debug task for testing
 @celery_app.task(bind=True)
 def debug_task(self):
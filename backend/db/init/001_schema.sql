@@ -15,6 +15,7 @@ CREATE TABLE users (
     id              SERIAL PRIMARY KEY,
     username        VARCHAR(50) UNIQUE NOT NULL,
     password_hash   VARCHAR(255) NOT NULL,
+    is_admin        BOOLEAN NOT NULL DEFAULT FALSE,
     created_at      TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at      TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
@@ -39,6 +40,7 @@ CREATE TABLE artists (
 CREATE INDEX idx_artists_name ON artists(name);
 CREATE INDEX idx_artists_normalized ON artists(normalized_name);
 CREATE INDEX idx_artists_sort ON artists(sort_name);
+CREATE INDEX idx_artists_sort_key_id ON artists(coalesce(sort_name, name), id);
 CREATE INDEX idx_artists_name_trgm ON artists USING gin(name gin_trgm_ops);
 
 -- ==========================================================================
@@ -68,16 +70,19 @@ CREATE TABLE albums (
 
 CREATE INDEX idx_albums_artist ON albums(artist_id);
 CREATE INDEX idx_albums_title ON albums(title);
+CREATE INDEX idx_albums_title_id ON albums(title, id);
+CREATE INDEX idx_albums_artist_title_id ON albums(artist_id, title, id);
 CREATE INDEX idx_albums_normalized ON albums(normalized_title);
 CREATE INDEX idx_albums_year ON albums(year);
 CREATE INDEX idx_albums_source ON albums(source);
 CREATE INDEX idx_albums_title_trgm ON albums USING gin(title gin_trgm_ops);
+CREATE INDEX idx_albums_health ON albums(source) INCLUDE (status);
 
 -- ==========================================================================
 -- 4. TRACKS
 -- ==========================================================================
 CREATE TABLE tracks (
-    id              SERIAL PRIMARY KEY,
+    id              BIGSERIAL PRIMARY KEY,
     album_id        INTEGER NOT NULL REFERENCES albums(id) ON DELETE CASCADE,
     title           VARCHAR(255) NOT NULL,
     normalized_title VARCHAR(255) NOT NULL,
@@ -88,9 +93,9 @@ CREATE TABLE tracks (
 
     -- Quality metadata (from ExifTool)
     sample_rate     INTEGER,                -- 44100, 96000, 192000
-    bit_depth       INTEGER,                -- 16, 24
+    bit_depth       SMALLINT,               -- 16, 24
     bitrate         INTEGER,                -- kbps for lossy
-    channels        INTEGER DEFAULT 2,
+    channels        SMALLINT DEFAULT 2,
     file_size       BIGINT,                 -- Bytes
     format          VARCHAR(10),            -- FLAC, MP3, AAC, etc.
     is_lossy        BOOLEAN DEFAULT FALSE,
@@ -101,7 +106,7 @@ CREATE TABLE tracks (
     source_quality  VARCHAR(100),           -- "24/192 FLAC", "320kbps MP3"
 
     -- Integrity
-    checksum        VARCHAR(64),            -- SHA-256
+    checksum        BYTEA,                  -- BLAKE3 digest (32 bytes)
 
     -- Metadata
     lyrics          TEXT,
@@ -118,6 +123,7 @@ CREATE INDEX idx_tracks_normalized ON tracks(normalized_title);
 CREATE INDEX idx_tracks_source ON tracks(source);
 CREATE INDEX idx_tracks_quality ON tracks(sample_rate, bit_depth);
 CREATE INDEX idx_tracks_title_trgm ON tracks USING gin(title gin_trgm_ops);
+CREATE INDEX idx_tracks_health ON tracks(is_lossy) INCLUDE (file_size);
 
 -- ==========================================================================
 -- 5. USER LIBRARY - ALBUM HEARTS
@@ -131,13 +137,14 @@ CREATE TABLE user_albums (
 
 CREATE INDEX idx_user_albums_user ON user_albums(user_id);
 CREATE INDEX idx_user_albums_album ON user_albums(album_id);
+CREATE INDEX idx_user_albums_user_added ON user_albums(user_id, added_at, album_id);
 
 -- ==========================================================================
 -- 6. USER LIBRARY - TRACK HEARTS (Individual tracks)
 -- ==========================================================================
 CREATE TABLE user_tracks (
     user_id         INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-    track_id        INTEGER NOT NULL REFERENCES tracks(id) ON DELETE CASCADE,
+    track_id        BIGINT NOT NULL REFERENCES tracks(id) ON DELETE CASCADE,
     added_at        TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     PRIMARY KEY (user_id, track_id)
 );
@@ -149,11 +156,11 @@ CREATE INDEX idx_user_tracks_track ON user_tracks(track_id);
 -- 7. ACTIVITY LOG
 -- ==========================================================================
 CREATE TABLE activity_log (
-    id              SERIAL PRIMARY KEY,
+    id              BIGSERIAL PRIMARY KEY,
     user_id         INTEGER REFERENCES users(id) ON DELETE SET NULL,
     action          VARCHAR(50) NOT NULL,   -- download, import, heart, unheart, delete, export
     entity_type     VARCHAR(50),            -- artist, album, track
-    entity_id       INTEGER,
+    entity_id       BIGINT,
     details         JSONB,                  -- Additional context
     ip_address      INET,
     created_at      TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
@@ -168,14 +175,14 @@ CREATE INDEX idx_activity_created ON activity_log(created_at);
 -- 8. IMPORT HISTORY (Duplicate Detection)
 -- ==========================================================================
 CREATE TABLE import_history (
-    id                  SERIAL PRIMARY KEY,
+    id                  BIGSERIAL PRIMARY KEY,
     artist_normalized   VARCHAR(255) NOT NULL,
     album_normalized    VARCHAR(255) NOT NULL,
     track_normalized    VARCHAR(255) NOT NULL,
     source              VARCHAR(50),
     quality_score       INTEGER,            -- Computed: sample_rate * bit_depth
-    checksum            VARCHAR(64),
-    track_id            INTEGER REFERENCES tracks(id) ON DELETE SET NULL,
+    checksum            BYTEA,              -- BLAKE3 digest (32 bytes)
+    track_id            BIGINT REFERENCES tracks(id) ON DELETE SET NULL,
     import_date         TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -190,7 +197,7 @@ CREATE TYPE download_source AS ENUM ('qobuz', 'lidarr', 'youtube', 'soundcloud',
 CREATE TYPE search_type AS ENUM ('artist', 'album', 'track');
 
 CREATE TABLE downloads (
-    id              SERIAL PRIMARY KEY,
+    id              BIGSERIAL PRIMARY KEY,
     user_id         INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
     source          download_source NOT NULL,
     source_url      VARCHAR(1000),
@@ -202,7 +209,7 @@ CREATE TABLE downloads (
     eta             VARCHAR(50),            -- "00:05:32"
     error_message   TEXT,
     celery_task_id  VARCHAR(255),
-    result_album_id INTEGER REFERENCES albums(id) ON DELETE SET NULL,
+    result_album_id INTEGER REFERENCES albums(id) ON DELETE SET NULL DEFERRABLE INITIALLY DEFERRED,
     started_at      TIMESTAMP WITH TIME ZONE,
     completed_at    TIMESTAMP WITH TIME ZONE,
     created_at      TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
@@ -211,6 +218,7 @@ CREATE TABLE downloads (
 CREATE INDEX idx_downloads_user ON downloads(user_id);
 CREATE INDEX idx_downloads_status ON downloads(status);
 CREATE INDEX idx_downloads_created ON downloads(created_at);
+CREATE INDEX idx_downloads_user_status_created ON downloads(user_id, status, created_at DESC);
 
 -- ==========================================================================
 -- 10. PENDING REVIEW (Unidentified Imports)
@@ -340,6 +348,21 @@ CREATE TRIGGER update_albums_updated_at BEFORE UPDATE ON albums
 CREATE TRIGGER update_tracks_updated_at BEFORE UPDATE ON tracks
     FOR EACH ROW EXECUTE FUNCTION update_updated_at();
 
+-- Never leave the library without an admin (checked at COMMIT)
+CREATE OR REPLACE FUNCTION enforce_last_admin()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF OLD.is_admin AND NOT EXISTS (SELECT 1 FROM users WHERE is_admin) THEN
+        RAISE EXCEPTION 'Cannot remove the last admin' USING ERRCODE = '23514';
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE CONSTRAINT TRIGGER trg_last_admin AFTER DELETE OR UPDATE OF is_admin ON users
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION enforce_last_admin();
+
 -- Auto-normalize on insert/update
 CREATE OR REPLACE FUNCTION normalize_artist()
 RETURNS TRIGGER AS $$
@@ -1,7 +1,9 @@
 """Pytest fixtures for Barbossa tests."""
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from app.main import app
@@ -19,6 +21,13 @@ engine = create_engine(
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def no_hearted_cache(monkeypatch):
+    """Read hearted ids from the database unless a test opts in."""
+    from app.config import settings
+    monkeypatch.setattr(settings, "hearted_cache_ttl", 0)
+
+
 @pytest.fixture(scope="function")
 def db():
     """Create a fresh database for each test."""
@@ -31,6 +40,25 @@ def db():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture
+def count_statements():
+    """Context manager yielding the list of SQL statements run inside it."""
+    @contextmanager
+    def counting():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return counting
+
+
 @pytest.fixture(scope="function")
 def client(db):
     """Create a test client with the test database."""
@@ -0,0 +1,254 @@
+"""Tests for admin endpoints."""
+import pytest
+
+from tests.conftest import engine
+
+
+@pytest.fixture(autouse=True)
+def no_health_cache(monkeypatch):
+    """Compute the health report on every request unless a test opts in."""
+    from app.config import settings
+    monkeypatch.setattr(settings, "health_cache_ttl", 0)
+
+
+def test_create_user(client, admin_auth_headers):
+    """Test admin creates a user and a duplicate name is rejected."""
+    payload = {"username": "newuser", "password": "secret"}
+
+    response = client.post("/api/admin/users", json=payload, headers=admin_auth_headers)
+    assert response.status_code == 201
+    data = response.json()
+    assert data["username"] == "newuser"
+    assert data["is_admin"] is False
+
+    response = client.post("/api/admin/users", json=payload, headers=admin_auth_headers)
+    assert response.status_code == 400
+
+
+def test_update_user(client, db, test_user, admin_auth_headers):
+    """Test password and admin flag are read from the JSON body."""
+    from app.services.auth import AuthService
+
+    response = client.put(
+        f"/api/admin/users/{test_user.id}",
+        json={"password": "newpass", "is_admin": True},
+        headers=admin_auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["is_admin"] is True
+    db.refresh(test_user)
+    assert AuthService(db).verify_password("newpass", test_user.password_hash)
+
+
+def test_update_user_cannot_demote_self(client, admin_user, admin_auth_headers):
+    """Test an admin cannot drop their own admin flag."""
+    response = client.put(
+        f"/api/admin/users/{admin_user.id}",
+        json={"is_admin": False},
+        headers=admin_auth_headers,
+    )
+    assert response.status_code == 400
+
+
+def test_delete_user(client, db, admin_user, test_user, admin_auth_headers):
+    """Test deleting users, including another admin."""
+    from app.services.auth import AuthService
+    other_admin = AuthService(db).create_user("otheradmin", "pass", is_admin=True)
+
+    for user_id in (test_user.id, other_admin.id):
+        response = client.delete(f"/api/admin/users/{user_id}", headers=admin_auth_headers)
+        assert response.status_code == 200
+
+    response = client.delete(f"/api/admin/users/{test_user.id}", headers=admin_auth_headers)
+    assert response.status_code == 404
+
+
+def test_delete_self_rejected(client, admin_user, admin_auth_headers):
+    """Test an admin cannot delete their own account."""
+    response = client.delete(f"/api/admin/users/{admin_user.id}", headers=admin_auth_headers)
+    assert response.status_code == 400
+
+
+def test_last_admin_trigger_violation_rejected(client, db, test_user, admin_auth_headers, monkeypatch):
+    """Test the Postgres last-admin trigger firing at commit becomes a 400."""
+    from sqlalchemy.exc import IntegrityError
+
+    class CheckViolation(Exception):
+        pgcode = "23514"
+
+    def commit():
+        raise IntegrityError("COMMIT", {}, CheckViolation("Cannot remove the last admin"))
+
+    monkeypatch.setattr(db, "commit", commit)
+    response = client.delete(f"/api/admin/users/{test_user.id}", headers=admin_auth_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Cannot delete the last admin"
+
+
+def test_library_health(client, db, test_album, admin_auth_headers):
+    """Test library health aggregates."""
+    from app.models.album import Album
+    from app.models.track import Track
+
+    db.add(Album(
+        artist_id=test_album.artist_id,
+        title="Unfinished",
+        normalized_title="unfinished",
+        status="incomplete",
+        source="qobuz",
+    ))
+    for number, is_lossy in ((1, False), (2, True)):
+        db.add(Track(
+            album_id=test_album.id,
+            title=f"Track {number}",
+            normalized_title=f"track {number}",
+            track_number=number,
+            path=f"/music/Test Album/0{number}.flac",
+            is_lossy=is_lossy,
+            file_size=512,
+        ))
+    db.commit()
+
+    response = client.get("/api/admin/health", headers=admin_auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["summary"]["artists"] == 1
+    assert data["summary"]["albums"] == 2
+    assert data["summary"]["tracks"] == 2
+    assert data["summary"]["users"] == 1
+    assert data["summary"]["total_size_bytes"] == 1024
+    assert data["quality"] == {"lossless": 1, "lossy": 1, "lossless_pct": 50.0}
+    assert data["incomplete_albums"] == 1
+    assert data["albums_by_source"] == {"qobuz": 1}
+
+
+def test_library_health_requires_admin(client, auth_headers):
+    """Test regular users cannot read the health report."""
+    response = client.get("/api/admin/health", headers=auth_headers)
+    assert response.status_code == 403
+
+
+def test_library_health_empty_library(client, admin_auth_headers):
+    """Test health report on an empty library."""
+    response = client.get("/api/admin/health", headers=admin_auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["summary"]["albums"] == 0
+    assert data["summary"]["tracks"] == 0
+    assert data["summary"]["total_size_bytes"] == 0
+    assert data["quality"]["lossless_pct"] == 0
+    assert data["incomplete_albums"] == 0
+
+
+def test_library_health_cached(client, admin_auth_headers, monkeypatch):
+    """Test a cached report is served as-is and a fresh one is stored."""
+    from app import cache
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "health_cache_ttl", 60)
+    stored = {}
+    monkeypatch.setattr(cache, "get_json", lambda key: stored.get(key))
+    monkeypatch.setattr(cache, "set_json", lambda key, value, ttl: stored.__setitem__(key, value))
+
+    response = client.get("/api/admin/health", headers=admin_auth_headers)
+    assert response.status_code == 200
+    assert stored[cache.HEALTH_CACHE_KEY] == response.json()
+
+    stored[cache.HEALTH_CACHE_KEY] = {"status": "cached"}
+    response = client.get("/api/admin/health", headers=admin_auth_headers)
+    assert response.json() == {"status": "cached"}
+
+
+def test_connection_pool_status(client, admin_auth_headers):
+    """Test the pool probe reports the engine's pool."""
+    response = client.get("/api/admin/health/pool", headers=admin_auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["pool"]
+    assert data["status"]
+
+
+def test_list_activity_cursor_pagination(client, db, admin_user, admin_auth_headers):
+    """Test activity pages chain through next_cursor without gaps or repeats."""
+    from app.models.activity import ActivityLog
+
+    for i in range(5):
+        db.add(ActivityLog(user_id=admin_user.id, action=f"action_{i}"))
+    db.commit()
+
+    seen = []
+    cursor = None
+    for _ in range(5):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/admin/activity", params=params, headers=admin_auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert cursor is None
+    assert seen == sorted(seen, reverse=True)
+    assert len(seen) == len(set(seen)) == 5
+
+
+def test_list_activity_invalid_cursor(client, admin_auth_headers):
+    """Test a malformed cursor is rejected."""
+    response = client.get(
+        "/api/admin/activity", params={"cursor": "not-a-cursor"}, headers=admin_auth_headers
+    )
+    assert response.status_code == 400
+
+
+def test_backup_history_order_served_by_index(db):
+    """Test the newest-first backup listing walks an index instead of sorting."""
+    from sqlalchemy import text
+    from app.models.backup_history import BackupHistory
+
+    query = (
+        db.query(BackupHistory)
+        .order_by(BackupHistory.created_at.desc(), BackupHistory.id.desc())
+        .limit(20)
+    )
+    sql = query.statement.compile(engine, compile_kwargs={"literal_binds": True})
+    plan = " ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+    # SQLite appends the rowid (id) to every index, so either created_at
+    # index satisfies the order here; what matters is that nothing sorts
+    assert "USING INDEX ix_backup_history_created_" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.parametrize("path", ["/api/admin/users", "/api/admin/activity", "/api/admin/backup/history"])
+def test_admin_lists_query_count_independent_of_rows(client, db, admin_user, admin_auth_headers, count_statements, path):
+    """Test admin list endpoints do not issue a query per row (no N+1)."""
+    from app.models.activity import ActivityLog
+    from app.models.backup_history import BackupHistory
+    from app.models.user import User
+
+    def add_rows(count):
+        for _ in range(count):
+            db.add(User(username=f"user{db.query(User).count()}", password_hash="x"))
+            db.flush()
+            db.add(ActivityLog(user_id=admin_user.id, action="heart"))
+            db.add(BackupHistory(destination="/backups", destination_type="local", status="complete"))
+        db.commit()
+
+    def count_queries():
+        with count_statements() as statements:
+            response = client.get(path, headers=admin_auth_headers)
+        assert response.status_code == 200
+        return len(statements)
+
+    add_rows(1)
+    few = count_queries()
+    add_rows(5)
+    assert count_queries() == few
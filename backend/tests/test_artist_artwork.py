@@ -71,6 +71,24 @@ class TestArtistHeartEndpoints:
         )
         assert response.status_code == 200
 
+    def test_heart_unheart_artist_logs_activity(self, client, db, auth_headers, test_artist, test_album):
+        """Test album and artist hearts are logged alongside the change."""
+        from app.models.activity import ActivityLog
+
+        client.post(f"/api/me/library/artists/{test_artist.id}", headers=auth_headers)
+        client.delete(f"/api/me/library/artists/{test_artist.id}", headers=auth_headers)
+
+        logged = [
+            (a.action, a.entity_type)
+            for a in db.query(ActivityLog).order_by(ActivityLog.id)
+        ]
+        assert logged == [
+            ("heart", "album"),
+            ("heart", "artist"),
+            ("unheart", "album"),
+            ("unheart", "artist"),
+        ]
+
     def test_unheart_artist_not_found(self, client, auth_headers):
         """Test 404 when artist doesn't exist."""
         response = client.delete(
@@ -116,3 +134,126 @@ class TestArtistIsHearted:
         # Back to not hearted
         response = client.get(f"/api/artists/{test_artist.id}", headers=auth_headers)
         assert response.json()["is_hearted"] == False
+
+
+class TestArtworkUpload:
+    """Tests for PUT /api/albums/{album_id}/artwork endpoint."""
+
+    JPEG = b'\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00'
+
+    def test_upload_album_artwork(self, client, auth_headers, test_album, db, tmp_path):
+        """Test uploaded JPEG replaces cover.jpg and keeps the original."""
+        (tmp_path / "cover.jpg").write_bytes(b"original")
+        test_album.path = str(tmp_path)
+        db.commit()
+
+        response = client.put(
+            f"/api/albums/{test_album.id}/artwork",
+            files={"artwork": ("new.jpg", self.JPEG, "image/jpeg")},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert (tmp_path / "cover.jpg").read_bytes() == self.JPEG
+        assert (tmp_path / "cover.original.jpg").read_bytes() == b"original"
+
+    def test_restore_album_artwork(self, client, auth_headers, test_album, db, tmp_path):
+        """Test restoring brings back the first cover and keeps the backup."""
+        (tmp_path / "cover.jpg").write_bytes(b"original")
+        test_album.path = str(tmp_path)
+        db.commit()
+
+        for _ in range(2):
+            client.put(
+                f"/api/albums/{test_album.id}/artwork",
+                files={"artwork": ("new.jpg", self.JPEG, "image/jpeg")},
+                headers=auth_headers,
+            )
+        response = client.delete(f"/api/albums/{test_album.id}/artwork", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert (tmp_path / "cover.jpg").read_bytes() == b"original"
+        assert (tmp_path / "cover.original.jpg").read_bytes() == b"original"
+        assert not (tmp_path / "cover.jpg").samefile(tmp_path / "cover.original.jpg")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["cover.jpg", "cover.original.jpg"]
+
+    def test_upload_album_artwork_too_large(self, client, auth_headers, test_album, db, tmp_path, monkeypatch):
+        """Test oversized uploads are rejected without touching the album folder."""
+        from app.api import artwork
+
+        monkeypatch.setattr(artwork, "MAX_SIZE", 8)
+        monkeypatch.setattr(artwork, "CHUNK_SIZE", 4)
+        (tmp_path / "cover.jpg").write_bytes(b"original")
+        test_album.path = str(tmp_path)
+        db.commit()
+
+        response = client.put(
+            f"/api/albums/{test_album.id}/artwork",
+            files={"artwork": ("new.jpg", self.JPEG, "image/jpeg")},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 413
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["cover.jpg"]
+        assert (tmp_path / "cover.jpg").read_bytes() == b"original"
+
+    def test_upload_album_artwork_not_an_image(self, client, auth_headers, test_album, db, tmp_path):
+        """Test content is checked by magic bytes, not the filename."""
+        test_album.path = str(tmp_path)
+        db.commit()
+
+        response = client.put(
+            f"/api/albums/{test_album.id}/artwork",
+            files={"artwork": ("cover.jpg", b"<html>not an image</html>", "image/jpeg")},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 400
+        assert list(tmp_path.iterdir()) == []
+
+    def test_upload_album_artwork_invalid_type(self, client, auth_headers, test_album):
+        """Test non-image extensions are rejected."""
+        response = client.put(
+            f"/api/albums/{test_album.id}/artwork",
+            files={"artwork": ("cover.gif", b"GIF89a", "image/gif")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+
+class TestFetchAllArtistArtwork:
+    """Tests for POST /api/artwork/artists/fetch-all endpoint."""
+
+    def test_fetch_all_runs_concurrently(self, client, auth_headers, db, monkeypatch):
+        """Test lookups overlap and results keep artist order."""
+        import asyncio
+        from app.models.artist import Artist
+        from app.services.import_service import ImportService
+
+        for name in ("Alpha", "Beta", "Gamma"):
+            db.add(Artist(name=name, normalized_name=name.lower()))
+        db.commit()
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_fetch(self, artist, artist_name, http_client=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if artist_name == "Beta":
+                raise RuntimeError("boom")
+            return f"/music/{artist_name}/artist.jpg" if artist_name == "Alpha" else None
+
+        monkeypatch.setattr(ImportService, "fetch_artist_image_from_qobuz", fake_fetch)
+
+        response = client.post("/api/artwork/artists/fetch-all", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert peak == 3
+        assert data["total"] == 3
+        assert data["fetched"] == 1
+        assert [r["status"] for r in data["results"]] == ["fetched", "error", "not_found"]
@@ -34,6 +34,52 @@ def test_login_invalid_password(client, db):
     assert response.status_code == 401
 
 
+def test_new_passwords_use_argon2(db):
+    """Test new hashes are argon2id."""
+    user = AuthService(db).create_user("testuser", "testpass")
+    assert user.password_hash.startswith("$argon2id$")
+
+
+def test_login_upgrades_bcrypt_hash(client, db):
+    """Test a legacy bcrypt hash still logs in and is rehashed with argon2."""
+    from passlib.hash import bcrypt
+    from app.models.user import User
+
+    user = User(username="legacy", password_hash=bcrypt.hash("testpass"))
+    db.add(user)
+    db.commit()
+
+    response = client.post(
+        "/api/auth/login",
+        json={"username": "legacy", "password": "testpass"},
+    )
+
+    assert response.status_code == 200
+    db.refresh(user)
+    assert user.password_hash.startswith("$argon2id$")
+
+
+def test_login_rehashes_outdated_argon2_parameters(client, db):
+    """Test an argon2 hash with weaker parameters is upgraded on login."""
+    from argon2 import PasswordHasher
+    from app.models.user import User
+
+    weak_hash = PasswordHasher(time_cost=1, memory_cost=8192, parallelism=1).hash("testpass")
+    user = User(username="weak", password_hash=weak_hash)
+    db.add(user)
+    db.commit()
+
+    response = client.post(
+        "/api/auth/login",
+        json={"username": "weak", "password": "testpass"},
+    )
+
+    assert response.status_code == 200
+    db.refresh(user)
+    assert user.password_hash != weak_hash
+    assert "m=19456,t=2,p=1" in user.password_hash
+
+
 def test_login_invalid_user(client, db):
     """Test login with non-existent user."""
     response = client.post(
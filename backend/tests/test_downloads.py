@@ -178,6 +178,21 @@ class TestDownloadAPI:
         assert response.status_code == 200
         assert response.json() == []
 
+    def test_list_downloads_status_filter(self, client, db, test_user, auth_headers):
+        """Test filtering history by status and rejecting unknown statuses."""
+        from app.models.download import Download
+
+        for status in ("complete", "failed", "complete"):
+            db.add(Download(user_id=test_user.id, source="url", status=status))
+        db.commit()
+
+        response = client.get("/api/downloads", params={"status": "complete"}, headers=auth_headers)
+        assert response.status_code == 200
+        assert [d["status"] for d in response.json()] == ["complete", "complete"]
+
+        response = client.get("/api/downloads", params={"status": "bogus"}, headers=auth_headers)
+        assert response.status_code == 422
+
     def test_download_qobuz_requires_auth(self, client):
         """Test that download endpoints require authentication."""
         response = client.post("/api/downloads/qobuz", json={"url": "https://qobuz.com/..."})
@@ -198,6 +213,113 @@ class TestDownloadAPI:
         assert response.status_code == 400
         assert "confirm_lossy" in response.json()["detail"]
 
+    @pytest.mark.parametrize("url,expected", [
+        ("https://www.youtube.com/watch?v=test", "youtube"),
+        ("https://music.youtube.com/watch?v=test", "youtube"),
+        ("https://youtu.be/test", "youtube"),
+        ("YouTube.com/watch?v=test", "youtube"),
+        ("https://artist.bandcamp.com/album/test", "bandcamp"),
+        ("https://soundcloud.com/artist/track", "soundcloud"),
+        ("https://example.com/youtube/soundcloud.mp3", "url"),
+    ])
+    def test_detect_url_source(self, url, expected):
+        """Test URL sources are detected from the host, not the path."""
+        from app.api.downloads import detect_url_source
+        assert detect_url_source(url).value == expected
+
+    def test_download_url_commits_once_and_queues_with_stored_id(self, client, db, auth_headers):
+        """Test the download row is committed once, carrying the queued task's id."""
+        from app.models.download import Download
+
+        with patch("app.api.downloads.download_url_task") as task, \
+                patch.object(db, "commit", wraps=db.commit) as commit:
+            response = client.post(
+                "/api/downloads/url",
+                headers=auth_headers,
+                json={"url": "https://example.com/album.flac"}
+            )
+
+        assert response.status_code == 200
+        assert commit.call_count == 1
+        download = db.get(Download, response.json()["id"])
+        task.apply_async.assert_called_once_with(
+            args=(download.id, "https://example.com/album.flac"),
+            task_id=download.celery_task_id,
+        )
+        assert download.started_at is not None
+
+    def test_download_url_broker_failure_marks_failed(self, client, db, auth_headers):
+        """Test a rejected enqueue leaves a failed row, not a stuck pending one."""
+        from app.models.download import Download
+
+        with patch("app.api.downloads.download_url_task") as task:
+            task.apply_async.side_effect = ConnectionError("broker down")
+            response = client.post(
+                "/api/downloads/url",
+                headers=auth_headers,
+                json={"url": "https://example.com/album.flac"}
+            )
+
+        assert response.status_code == 503
+        download = db.query(Download).one()
+        assert download.status == "failed"
+
+    def test_download_status(self, client, db, test_user, admin_user, auth_headers, admin_auth_headers):
+        """Test status polling returns the status fields and is owner-only."""
+        from app.models.download import Download
+
+        download = Download(
+            user_id=test_user.id, source="url", source_url="https://example.com/a.flac",
+            status="downloading", progress=40, speed="2 MB/s",
+        )
+        db.add(download)
+        db.commit()
+
+        response = client.get(f"/api/downloads/{download.id}/status", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == {
+            "id": download.id, "status": "downloading", "progress": 40, "speed": "2 MB/s",
+            "eta": None, "error_message": None, "result_album_id": None,
+        }
+
+        response = client.get(f"/api/downloads/{download.id}/status", headers=admin_auth_headers)
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize("state,terminate", [("PENDING", False), ("RETRY", False), ("STARTED", True)])
+    def test_revoke_task_terminates_only_started(self, state, terminate):
+        """Test cancelling signals the worker only for a task that is running."""
+        from app.worker import celery_app, revoke_task
+
+        with patch.object(celery_app, "AsyncResult") as result, \
+                patch.object(celery_app, "control") as control:
+            result.return_value.state = state
+            revoke_task("task-id")
+
+        control.revoke.assert_called_once_with("task-id", terminate=terminate)
+
+    def test_download_owner_only(self, client, db, test_user, auth_headers, admin_auth_headers):
+        """Test detail, cancel, retry and delete resolve only the owner's download."""
+        from app.models.download import Download
+
+        download = Download(user_id=test_user.id, source="url", status="failed")
+        db.add(download)
+        db.commit()
+
+        response = client.get(f"/api/downloads/{download.id}", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["id"] == download.id
+
+        for method, path in (
+            ("get", f"/api/downloads/{download.id}"),
+            ("post", f"/api/downloads/{download.id}/cancel"),
+            ("post", f"/api/downloads/{download.id}/retry"),
+            ("delete", f"/api/downloads/{download.id}"),
+        ):
+            assert client.request(method, path, headers=admin_auth_headers).status_code == 403
+
+        response = client.delete(f"/api/downloads/{download.id}", headers=auth_headers)
+        assert response.json() == {"status": "deleted", "id": download.id}
+
     def test_download_cancel_not_found(self, client, auth_headers):
         """Test canceling non-existent download."""
         response = client.post("/api/downloads/999/cancel", headers=auth_headers)
@@ -215,6 +337,19 @@ class TestDownloadAPI:
             # May fail if streamrip not available, but validation passes
             assert response.status_code in [200, 500]
 
+            response = client.get(
+                "/api/downloads/search/qobuz?q=test&type=playlist",
+                headers=auth_headers
+            )
+            assert response.status_code == 200
+            assert mock.call_args.args == ("test", "playlist", 20)
+
+        response = client.get(
+            "/api/downloads/search/qobuz?q=test&type=label",
+            headers=auth_headers
+        )
+        assert response.status_code == 422
+
 
 class TestWebSocket:
     """Test WebSocket functionality."""
@@ -225,3 +360,14 @@ class TestWebSocket:
 
         manager = ConnectionManager()
         assert len(manager.active_connections) == 0
+
+    def test_download_progress_socket_ignores_client_frames(self, client):
+        """Test the progress socket drains client frames and unregisters on close."""
+        from app.websocket import manager
+
+        with client.websocket_connect("/api/downloads/ws/4242") as websocket:
+            websocket.send_text("ping")
+            websocket.send_bytes(b"\x00")
+            assert 4242 in manager.active_connections
+
+        assert 4242 not in manager.active_connections
@@ -14,6 +14,34 @@ class TestHealthEndpoints:
         assert "checks" in data
         assert "version" in data
 
+    def test_health_endpoint_reports_failed_probe(self, client, tmp_path, monkeypatch):
+        """Test a failing dependency marks the report unhealthy with its error."""
+        from app.api import health
+        from app.config import settings
+
+        def redis_down():
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(health, "_check_redis", redis_down)
+        monkeypatch.setattr(settings, "music_library", str(tmp_path))
+        monkeypatch.setattr(settings, "music_users", str(tmp_path / "missing"))
+
+        data = client.get("/health").json()
+
+        assert data["status"] == "unhealthy"
+        assert data["checks"] == {
+            "database": "ok",
+            "redis": "error: redis down",
+            "music_library": "ok",
+            "music_users": "not accessible",
+        }
+
+    def test_health_reuses_redis_client(self):
+        """Test the Redis probe keeps one pooled client across requests."""
+        from app.api import health
+
+        assert health._get_redis() is health._get_redis()
+
     def test_ready_endpoint(self, client):
         """Test readiness check."""
         response = client.get("/ready")
@@ -21,6 +49,18 @@ class TestHealthEndpoints:
         data = response.json()
         assert "ready" in data
 
+    def test_ready_endpoint_reuses_recent_result(self, client, db, monkeypatch):
+        """Test readiness answers from the last check inside the cache window."""
+        from unittest.mock import patch
+        from app.api import health
+
+        monkeypatch.setattr(health, "_last_ready", (float("-inf"), False))
+        with patch.object(db, "execute", wraps=db.execute) as execute:
+            assert client.get("/ready").json() == {"ready": True}
+            assert client.get("/ready").json() == {"ready": True}
+
+        assert execute.call_count == 1
+
     def test_live_endpoint(self, client):
         """Test liveness check."""
         response = client.get("/live")
@@ -0,0 +1,86 @@
+"""Tests for enrichment endpoints."""
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def track(db, test_album):
+    """A track on the test album with no lyrics yet."""
+    from app.models.track import Track
+    track = Track(
+        album_id=test_album.id,
+        title="Test Track",
+        normalized_title="test track",
+        track_number=1,
+        path="/music/Test Album/01.flac",
+        duration=180,
+    )
+    db.add(track)
+    db.commit()
+    return track
+
+
+def test_enrich_track_sync(client, db, track, auth_headers):
+    """Test synchronous track enrichment stores fetched lyrics."""
+    async def fetch_lyrics(self, artist, title, album=None, duration=None):
+        assert (artist, title, album) == ("Test Artist", "Test Track", "Test Album")
+        return "la la la"
+
+    with patch("app.services.enrichment.EnrichmentService.fetch_lyrics_lrclib", fetch_lyrics):
+        response = client.post(f"/api/enrichment/track/{track.id}", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    db.refresh(track)
+    assert track.lyrics == "la la la"
+
+
+def test_enrich_album_sync(client, test_album, track, auth_headers):
+    """Test synchronous album enrichment reports per-album counts."""
+    async def fetch_lyrics(self, artist, title, album=None, duration=None):
+        return None
+
+    with patch("app.services.enrichment.EnrichmentService.fetch_lyrics_lrclib", fetch_lyrics):
+        response = client.post(
+            f"/api/enrichment/album/{test_album.id}",
+            params={"background": False},
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"task_id": "sync", "message": "Enriched 0/1 tracks"}
+
+
+def test_tracks_missing_lyrics_query_count(client, db, test_album, track, auth_headers, count_statements):
+    """Test album and artist names load with the tracks, not per track."""
+    from app.models.album import Album
+    from app.models.artist import Artist
+    from app.models.track import Track
+
+    def count_queries():
+        db.expire_all()
+        with count_statements() as statements:
+            response = client.get("/api/enrichment/tracks/missing-lyrics", headers=auth_headers)
+        assert response.status_code == 200
+        return response.json(), len(statements)
+
+    data, few = count_queries()
+    assert data[0]["album_title"] == "Test Album"
+    assert data[0]["artist_name"] == "Test Artist"
+
+    for number in range(2, 6):
+        artist = Artist(name=f"Artist {number}", normalized_name=f"artist {number}")
+        album = Album(artist=artist, title=f"Album {number}", normalized_title=f"album {number}")
+        db.add(Track(
+            album=album,
+            title=f"Track {number}",
+            normalized_title=f"track {number}",
+            track_number=1,
+            path=f"/music/Album {number}/01.flac",
+        ))
+    db.commit()
+
+    data, many = count_queries()
+    assert len(data) == 5
+    assert many == few
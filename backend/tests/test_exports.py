@@ -0,0 +1,34 @@
+"""Tests for export endpoints."""
+from app.models.export import Export
+
+
+def test_list_exports_limit(client, db, test_user, auth_headers):
+    """Test export history is capped by limit and newest first."""
+    for i in range(3):
+        db.add(Export(user_id=test_user.id, destination=f"/exports/{i}"))
+    db.commit()
+
+    response = client.get("/api/exports", params={"limit": 2}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+    response = client.get("/api/exports", params={"limit": 101}, headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_export_owner_only(client, db, test_user, auth_headers, admin_auth_headers):
+    """Test export detail and cancel resolve only the owner's export."""
+    export = Export(user_id=test_user.id, destination="/exports/mine")
+    db.add(export)
+    db.commit()
+
+    response = client.get(f"/api/exports/{export.id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["id"] == export.id
+
+    for method, path in (("get", "/api/exports/{}"), ("post", "/api/exports/{}/cancel")):
+        response = client.request(method, path.format(export.id), headers=admin_auth_headers)
+        assert response.status_code == 403
+        response = client.request(method, path.format(999), headers=auth_headers)
+        assert response.status_code == 404
@@ -1,5 +1,6 @@
 """Tests for library endpoints."""
 import pytest
+
 from app.models.artist import Artist
 from app.models.album import Album
 from app.models.track import Track
@@ -65,6 +66,26 @@ def test_list_artists(client, sample_library, auth_headers):
     assert data["items"][0]["name"] == "The Beatles"
 
 
+def test_artist_lists_flag_hearted(client, sample_library, auth_headers):
+    """Test the batch-validated artist lists carry is_hearted per row."""
+    from app.schemas.artist import ArtistListResponse
+
+    artist_id = sample_library["artist"].id
+    response = client.get("/api/artists", headers=auth_headers)
+    assert response.json()["items"][0]["is_hearted"] is False
+
+    client.post(f"/api/me/library/artists/{artist_id}", headers=auth_headers)
+
+    response = client.get("/api/artists", headers=auth_headers)
+    page = ArtistListResponse.model_validate_json(response.content)
+    assert page.items[0].is_hearted is True
+    response = client.get("/api/search?q=beatles&type=artist", headers=auth_headers)
+    assert response.json()["artists"][0]["is_hearted"] is True
+    response = client.get("/api/me/library/artists", headers=auth_headers)
+    assert [a["id"] for a in response.json()["items"]] == [artist_id]
+    assert response.json()["items"][0]["is_hearted"] is True
+
+
 def test_list_artists_filter_letter(client, sample_library, auth_headers):
     """Test filtering artists by letter."""
     response = client.get("/api/artists?letter=B", headers=auth_headers)
@@ -101,6 +122,174 @@ def test_get_artist_albums(client, sample_library, auth_headers):
     assert data[0]["title"] == "Abbey Road"
 
 
+@pytest.fixture
+def count_queries(client, db, count_statements):
+    """Number of statements issued by one GET of a path, from a cold session."""
+    def count(path, headers):
+        db.expire_all()
+        with count_statements() as statements:
+            response = client.get(path, headers=headers)
+        assert response.status_code == 200
+        return len(statements)
+
+    return count
+
+
+def test_list_albums_query_count_independent_of_rows(client, db, sample_library, auth_headers, count_queries):
+    """Test album listing loads artists with the page, not one query per album."""
+    few = count_queries("/api/albums", auth_headers)
+    for i in range(5):
+        artist = Artist(name=f"Artist {i}", normalized_name=f"artist {i}", path=f"/music/artists/Artist {i}")
+        db.add(artist)
+        db.flush()
+        db.add(Album(artist_id=artist.id, title=f"Album {i}", normalized_title=f"album {i}"))
+    db.commit()
+
+    assert count_queries("/api/albums", auth_headers) == few
+
+
+@pytest.mark.parametrize("path", ["/api/search?q=album", "/api/me/library", "/api/me/library/tracks"])
+def test_album_lists_query_count_independent_of_rows(client, db, sample_library, auth_headers, test_user, count_queries, path):
+    """Test search and library lists load album artists with the rows (no N+1)."""
+    from app.models.user_library import user_albums
+
+    def add_albums(start, count):
+        for i in range(start, start + count):
+            artist = Artist(name=f"Artist {i}", normalized_name=f"artist {i}", path=f"/music/artists/Artist {i}")
+            album = Album(artist=artist, title=f"Album {i}", normalized_title=f"album {i}")
+            db.add(Track(
+                album=album, title=f"Album Track {i}", normalized_title=f"album track {i}",
+                track_number=1, path=f"/music/artists/Artist {i}/Album {i}/01.flac",
+            ))
+            db.flush()
+            db.execute(user_albums.insert().values(user_id=test_user.id, album_id=album.id))
+        db.commit()
+
+    add_albums(0, 1)
+    few = count_queries(path, auth_headers)
+    add_albums(1, 5)
+    assert count_queries(path, auth_headers) == few
+
+
+@pytest.mark.parametrize("path", ["/api/artists", "/api/albums", "/api/me/library"])
+def test_list_cursor_pagination(client, db, auth_headers, test_user, path):
+    """Test list pages chain through next_cursor without gaps or repeats."""
+    from app.models.user_library import user_albums
+
+    # Duplicate names and titles, so the id tiebreak decides the order
+    for i in range(5):
+        artist = Artist(name="Same", normalized_name=f"same {i}", sort_name="Same", path=f"/music/{i}")
+        album = Album(artist=artist, title="Greatest Hits", normalized_title="greatest hits")
+        db.add(album)
+        db.flush()
+        db.execute(user_albums.insert().values(user_id=test_user.id, album_id=album.id))
+    db.commit()
+
+    seen = []
+    cursor = None
+    for _ in range(5):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(path, params=params, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert cursor is None
+    assert len(seen) == len(set(seen)) == 5
+    assert seen == (sorted(seen, reverse=True) if path == "/api/me/library" else sorted(seen))
+
+    response = client.get(path, params={"cursor": "not-a-cursor"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_artist_cursor_pages_include_artists_without_sort_name(client, db, auth_headers):
+    """Test artists without a sort_name page by name instead of dropping out."""
+    for name, sort_name in [("Beta", None), ("Alpha", "Alpha"), ("Delta", None), ("Gamma", "Gamma")]:
+        db.add(Artist(name=name, normalized_name=name.lower(), sort_name=sort_name))
+    db.commit()
+
+    names = []
+    cursor = None
+    while True:
+        params = {"limit": 1, **({"cursor": cursor} if cursor else {})}
+        data = client.get("/api/artists", params=params, headers=auth_headers).json()
+        names.extend(item["name"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert names == ["Alpha", "Beta", "Delta", "Gamma"]
+
+
+def test_get_album_query_count_independent_of_tracks(client, db, sample_library, auth_headers, count_queries):
+    """Test album detail loads artist and tracks in fixed queries, not per track."""
+    album = sample_library["album"]
+    path = f"/api/albums/{album.id}"
+
+    few = count_queries(path, auth_headers)
+    for i in range(4, 9):
+        db.add(Track(
+            album_id=album.id,
+            title=f"Track {i}",
+            normalized_title=f"track {i}",
+            track_number=i,
+            path=f"/music/artists/The Beatles/Abbey Road (1969)/0{i} - Track {i}.flac",
+        ))
+    db.commit()
+
+    assert count_queries(path, auth_headers) == few
+
+
+def test_album_artist_names_selected_as_column(db, sample_library):
+    """Test list_albums and search carry artist names without loading Artist rows."""
+    from sqlalchemy.exc import InvalidRequestError
+    from app.services.library import LibraryService
+
+    service = LibraryService(db)
+    album = sample_library["album"]
+    db.expire_all()
+
+    for result, albums in (
+        (service.list_albums(), "items"),
+        (service.search("abbey", "album"), "albums"),
+    ):
+        assert [a.id for a in result[albums]] == [album.id]
+        assert result["artist_names"] == {album.id: "The Beatles"}
+        with pytest.raises(InvalidRequestError):
+            result[albums][0].artist
+
+
+def test_list_albums_is_hearted(client, sample_library, auth_headers):
+    """Test album listing flags the user's hearted albums from the page query."""
+    album_id = sample_library["album"].id
+
+    response = client.get("/api/albums", headers=auth_headers)
+    assert response.json()["items"][0]["is_hearted"] is False
+
+    client.post(f"/api/me/library/albums/{album_id}", headers=auth_headers)
+
+    response = client.get("/api/albums", headers=auth_headers)
+    assert response.json()["items"][0]["is_hearted"] is True
+
+
+def test_album_list_payload_matches_schema(client, sample_library, auth_headers):
+    """Test the pre-serialized album list still matches AlbumListResponse."""
+    from app.schemas.album import AlbumListResponse
+
+    response = client.get("/api/albums", headers=auth_headers)
+
+    assert response.headers["content-type"] == "application/json"
+    page = AlbumListResponse.model_validate_json(response.content)
+    assert page.model_dump(mode="json") == response.json()
+    assert page.items[0].artist_name == sample_library["artist"].name
+
+
 def test_get_album(client, sample_library, auth_headers):
     """Test getting album details with tracks."""
     album_id = sample_library["album"].id
@@ -119,6 +308,10 @@ def test_get_album(client, sample_library, auth_headers):
     assert data["tracks"][0]["track_number"] == 1
     assert data["tracks"][0]["title"] == "Track 1"
 
+    # Built without validation, so check the payload still matches the schema
+    from app.schemas.album import AlbumDetailResponse
+    assert AlbumDetailResponse.model_validate(data).model_dump(mode="json") == data
+
 
 def test_get_album_tracks(client, sample_library, auth_headers):
     """Test getting album tracks."""
@@ -131,6 +324,23 @@ def test_get_album_tracks(client, sample_library, auth_headers):
     assert data[0]["track_number"] == 1
 
 
+def test_track_batch_matches_single_response(client, db, sample_library, auth_headers):
+    """Test batch-built track responses serialize like validated ones."""
+    from app.schemas.track import TrackResponse
+
+    tracks = sample_library["tracks"]
+    hearted = {tracks[1].id}
+
+    batch = TrackResponse.from_orm_batch(tracks, hearted)
+
+    assert [t.model_dump() for t in batch] == [
+        TrackResponse.from_orm_with_quality(t, t.id in hearted).model_dump() for t in tracks
+    ]
+    assert batch[0].artist_name == "The Beatles"
+    response = client.get(f"/api/albums/{sample_library['album'].id}/tracks", headers=auth_headers)
+    assert response.json() == [t.model_dump(mode="json") for t in TrackResponse.from_orm_batch(tracks, set())]
+
+
 def test_search(client, sample_library, auth_headers):
     """Test library search."""
     response = client.get("/api/search?q=beatles", headers=auth_headers)
@@ -141,6 +351,36 @@ def test_search(client, sample_library, auth_headers):
     assert data["artists"][0]["name"] == "The Beatles"
 
 
+def test_search_payload_matches_schema(client, sample_library, auth_headers):
+    """Test the pre-encoded search payload keeps every kind's key and shape."""
+    from app.schemas.common import LibrarySearchResponse
+
+    response = client.get("/api/search?q=abbey&type=album", headers=auth_headers)
+
+    assert response.headers["content-type"] == "application/json"
+    results = LibrarySearchResponse.model_validate_json(response.content)
+    assert results.model_dump(mode="json") == response.json()
+    assert [a.title for a in results.albums] == ["Abbey Road"]
+    assert results.artists == [] and results.tracks == []
+
+
+def test_search_reads_hearts_only_for_returned_kinds(client, sample_library, auth_headers):
+    """Test a search with only artist hits does not load album or track hearts."""
+    from unittest.mock import patch
+    from app.services.user_library import UserLibraryService
+
+    with patch.object(UserLibraryService, "_load_hearted_album_ids") as albums, \
+            patch.object(UserLibraryService, "_load_hearted_track_ids") as tracks, \
+            patch.object(UserLibraryService, "_load_hearted_artist_ids", return_value=frozenset()) as artists:
+        response = client.get("/api/search?q=beatles", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["artists"][0]["is_hearted"] is False
+    assert artists.called
+    assert not albums.called
+    assert not tracks.called
+
+
 def test_heart_album(client, sample_library, auth_headers):
     """Test hearting an album."""
     album_id = sample_library["album"].id
@@ -164,6 +404,203 @@ def test_unheart_album(client, db, sample_library, auth_headers, test_user):
     assert "removed" in response.json()["message"].lower()
 
 
+def test_repeat_hearts_are_no_ops(db, sample_library, test_user):
+    """Test a second heart/unheart, direct or through the artist, changes nothing."""
+    from app.models.activity import ActivityLog
+    from app.services.user_library import UserLibraryService
+
+    user_lib = UserLibraryService(db)
+    album_id = sample_library["album"].id
+    track_id = sample_library["tracks"][0].id
+    artist_id = sample_library["artist"].id
+    username = test_user.username
+
+    assert user_lib.heart_album(test_user.id, album_id, username) is True
+    assert user_lib.heart_album(test_user.id, album_id, username) is False
+    assert user_lib.heart_artist(test_user.id, artist_id, username) == 0
+    assert user_lib.heart_track(test_user.id, track_id, username) is True
+    assert user_lib.heart_track(test_user.id, track_id, username) is False
+    assert user_lib.unheart_track(test_user.id, track_id, username) is True
+    assert user_lib.unheart_track(test_user.id, track_id, username) is False
+    assert user_lib.unheart_album(test_user.id, album_id, username) is True
+    assert user_lib.unheart_album(test_user.id, album_id, username) is False
+    assert user_lib.heart_artist(test_user.id, artist_id, username) == 1
+
+    logged = [(a.action, a.entity_type) for a in db.query(ActivityLog).order_by(ActivityLog.id)]
+    assert logged == [
+        ("heart", "album"), ("heart", "artist"), ("heart", "track"), ("unheart", "track"),
+        ("unheart", "album"), ("heart", "album"), ("heart", "artist"),
+    ]
+
+
+def test_hearted_ids_cached_until_heart(client, sample_library, auth_headers, test_user, monkeypatch):
+    """Test hearted ids are served from the cache and dropped when the user hearts."""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "hearted_cache_ttl", 60)
+    stored = _fake_hearted_cache(monkeypatch)
+    album_id = sample_library["album"].id
+    path = f"/api/artists/{sample_library['artist'].id}/albums"
+
+    response = client.get(path, headers=auth_headers)
+    assert response.json()[0]["is_hearted"] is False
+    assert stored[(test_user.id, "album")] == []
+
+    client.post(f"/api/me/library/albums/{album_id}", headers=auth_headers)
+    assert (test_user.id, "album") not in stored
+
+    response = client.get(path, headers=auth_headers)
+    assert response.json()[0]["is_hearted"] is True
+    assert stored[(test_user.id, "album")] == [album_id]
+
+
+def test_hearted_ids_not_cached_when_invalidated_during_load(db, sample_library, test_user, monkeypatch):
+    """Test a load overtaken by a heart does not store its stale ids."""
+    from unittest.mock import patch
+    from app import cache
+    from app.config import settings
+    from app.services.user_library import UserLibraryService
+
+    monkeypatch.setattr(settings, "hearted_cache_ttl", 60)
+    stored = _fake_hearted_cache(monkeypatch)
+    user_lib = UserLibraryService(db)
+
+    def load_then_heart(user_id):
+        stale = frozenset()
+        cache.invalidate_hearted(user_id)
+        return stale
+
+    with patch.object(user_lib, "_load_hearted_album_ids", side_effect=load_then_heart):
+        assert user_lib.get_hearted_album_ids(test_user.id) == frozenset()
+    assert (test_user.id, "album") not in stored
+
+
+def _fake_hearted_cache(monkeypatch):
+    """In-memory stand-in for the hearted id cache, keyed by (user_id, kind)."""
+    from app import cache
+
+    stored = {}
+    generations = {}
+
+    def get_hearted(user_id, kinds):
+        return [stored.get((user_id, kind)) for kind in kinds], generations.get(user_id, 0)
+
+    def set_hearted(user_id, kind, ids, ttl, generation):
+        if generation == generations.get(user_id, 0):
+            stored[(user_id, kind)] = ids
+
+    def invalidate_hearted(user_id):
+        generations[user_id] = generations.get(user_id, 0) + 1
+        for kind in cache.HEARTED_KINDS:
+            stored.pop((user_id, kind), None)
+
+    monkeypatch.setattr(cache, "get_hearted", get_hearted)
+    monkeypatch.setattr(cache, "set_hearted", set_hearted)
+    monkeypatch.setattr(cache, "invalidate_hearted", invalidate_hearted)
+    return stored
+
+
+def _fake_redis(monkeypatch):
+    """Mock Redis client installed as the cache's client, with real script objects."""
+    from unittest.mock import MagicMock
+    from redis.commands.core import Script
+    from redis.connection import Encoder
+    from app import cache
+
+    client = MagicMock()
+    client.get_encoder.return_value = Encoder("utf-8", "strict", False)
+    client.register_script.side_effect = lambda source: Script(client, source)
+    monkeypatch.setattr(cache, "_client", None)
+    monkeypatch.setattr(cache, "_scripts", {})
+    monkeypatch.setattr(cache, "_unavailable_until", 0.0)
+    monkeypatch.setattr(cache.redis, "from_url", lambda *args, **kwargs: client)
+    return client
+
+
+def test_cache_read_is_one_round_trip(monkeypatch):
+    """Test a multi-key cache read fetches and counts in a single EVALSHA."""
+    from app import cache
+
+    client = _fake_redis(monkeypatch)
+    client.evalsha.return_value = [b"[1,2,3]", None]
+    keys = ["user:1:hearted_album", "user:1:hearted_track"]
+
+    assert cache.get_json_many(keys, stats_key=cache.HEARTED_STATS_KEY) == [[1, 2, 3], None]
+    assert cache.get_json_many(keys, stats_key=cache.HEARTED_STATS_KEY) == [[1, 2, 3], None]
+    sha = cache._scripts["get_counted"].sha
+    assert client.evalsha.call_args_list == [
+        ((sha, 4, *keys, "user:hearted:hits", "user:hearted:misses", 2),),
+    ] * 2
+    client.eval.assert_not_called()
+
+
+def test_hearted_write_checks_generation_read(monkeypatch):
+    """Test hearted ids are stored only against the generation read with them."""
+    from app import cache
+
+    client = _fake_redis(monkeypatch)
+    client.evalsha.return_value = [None, None]
+
+    client.evalsha.return_value = [None, None, b"3"]
+
+    assert cache.get_hearted(1, ["album"]) == ([None], (b"0", b"3"))
+    cache.set_hearted(1, "album", [5], 60, (b"0", b"3"))
+    assert client.evalsha.call_args.args == (
+        cache._scripts["set_if_current"].sha, 4,
+        "user:1:hearted_album", cache.HEARTED_LIVE_KEY, "user:1:hearted_gen", cache.HEARTED_LIBRARY_GEN_KEY,
+        b"[5]", 60, b"0", b"3",
+    )
+
+
+def test_library_invalidation_drops_listed_hearted_keys(monkeypatch):
+    """Test library changes drop the listed hearted keys without scanning."""
+    from app import cache
+
+    client = _fake_redis(monkeypatch)
+    pipe = client.pipeline.return_value
+    pipe.execute.return_value = [4, {b"user:1:hearted_album"}]
+
+    cache.invalidate_library()
+
+    pipe.incr.assert_called_once_with(cache.HEARTED_LIBRARY_GEN_KEY)
+    pipe.delete.assert_called_once_with(cache.HEALTH_CACHE_KEY, b"user:1:hearted_album")
+    pipe.srem.assert_called_once_with(cache.HEARTED_LIVE_KEY, b"user:1:hearted_album")
+    client.scan_iter.assert_not_called()
+
+
+def test_search_reads_hearted_sets_in_one_cache_call(client, sample_library, auth_headers, test_user, monkeypatch):
+    """Test search asks the cache for every kind it returned at once."""
+    from app import cache
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "hearted_cache_ttl", 60)
+    calls = []
+    monkeypatch.setattr(cache, "get_hearted", lambda user_id, kinds: calls.append((user_id, kinds)) or ([[]] * len(kinds), 0))
+
+    response = client.get("/api/search?q=a", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert calls == [(test_user.id, ["artist", "album", "track"])]
+
+
+def test_hearted_ids_read_once_per_service(db, sample_library, test_user):
+    """Test a service instance reuses hearted ids until its own heart/unheart."""
+    from unittest.mock import patch
+    from app.services.user_library import UserLibraryService
+
+    user_lib = UserLibraryService(db)
+    album_id = sample_library["album"].id
+
+    with patch.object(user_lib, "_load_hearted_album_ids", wraps=user_lib._load_hearted_album_ids) as load:
+        assert user_lib.get_hearted_album_ids(test_user.id) == frozenset()
+        assert user_lib.get_hearted_album_ids(test_user.id) == frozenset()
+        assert load.call_count == 1
+
+        user_lib.heart_album(test_user.id, album_id, test_user.username)
+        assert user_lib.get_hearted_album_ids(test_user.id) == frozenset({album_id})
+        assert load.call_count == 2
+
+
 def test_get_user_library(client, db, sample_library, auth_headers, test_user):
     """Test getting user's library."""
     album_id = sample_library["album"].id
@@ -0,0 +1,129 @@
+"""Lidarr client tests."""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.integrations.lidarr import LidarrClient
+
+
+@pytest.fixture(autouse=True)
+def clear_lidarr_cache():
+    """Start each test without shared Lidarr responses."""
+    LidarrClient._responses.clear()
+    yield
+    LidarrClient._responses.clear()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_request():
+    """Test concurrent queue reads wait on one upstream call, then reuse it."""
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return [{"id": 1}]
+
+    with patch.object(LidarrClient, "_fetch_queue", side_effect=fetch) as upstream:
+        results = await asyncio.gather(*(LidarrClient().get_queue() for _ in range(5)))
+        assert await LidarrClient().get_queue() == [{"id": 1}]
+
+    assert results == [[{"id": 1}]] * 5
+    assert upstream.call_count == 1
+    assert LidarrClient._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_read_reaches_waiters_and_is_not_cached():
+    """Test an upstream error is raised to every waiter and retried next time."""
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("lidarr down")
+
+    with patch.object(LidarrClient, "_fetch_artists", side_effect=fail):
+        results = await asyncio.gather(
+            *(LidarrClient().get_artists() for _ in range(3)), return_exceptions=True
+        )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    with patch.object(LidarrClient, "_fetch_artists", new=AsyncMock(return_value=[])) as upstream:
+        assert await LidarrClient().get_artists() == []
+    upstream.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_read_leaves_waiters_to_retry():
+    """Test cancelling the caller that started a fetch does not cancel its waiters."""
+    started = asyncio.Event()
+
+    async def fetch():
+        started.set()
+        await asyncio.sleep(0.01)
+        return [{"id": 1}]
+
+    with patch.object(LidarrClient, "_fetch_queue", side_effect=fetch) as upstream:
+        first = asyncio.create_task(LidarrClient().get_queue())
+        await started.wait()
+        waiters = [asyncio.create_task(LidarrClient().get_queue()) for _ in range(3)]
+        await asyncio.sleep(0)
+        first.cancel()
+        results = await asyncio.gather(*waiters)
+
+    assert first.cancelled()
+    assert results == [[{"id": 1}]] * 3
+    assert upstream.call_count == 2
+    assert LidarrClient._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_history_cached_per_limit():
+    """Test history pages of different sizes are cached separately."""
+    with patch.object(LidarrClient, "_fetch_history", new=AsyncMock(side_effect=lambda limit: [limit])) as upstream:
+        client = LidarrClient()
+        assert await client.get_history(10) == [10]
+        assert await client.get_history(20) == [20]
+        assert await client.get_history(10) == [10]
+
+    assert upstream.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_reads_go_through_pooled_client():
+    """Test a client given the app's pool sends with it instead of opening its own."""
+    from unittest.mock import MagicMock
+
+    http = MagicMock()
+    http.get = AsyncMock(return_value=MagicMock(json=lambda: {"records": [{"id": 7}]}))
+
+    with patch("app.integrations.lidarr.httpx.AsyncClient", side_effect=AssertionError("new client")):
+        assert await LidarrClient(http=http).get_queue() == [{"id": 7}]
+
+    assert http.get.await_args.args[0].endswith("/api/v1/queue")
+
+
+
+@pytest.mark.asyncio
+async def test_reads_without_pool_open_own_client():
+    """Test a client with no pool opens and closes an httpx client for the call."""
+    from unittest.mock import MagicMock
+
+    http = MagicMock()
+    http.get = AsyncMock(return_value=MagicMock(json=lambda: {"records": []}))
+    opened = MagicMock()
+    opened.return_value.__aenter__ = AsyncMock(return_value=http)
+    opened.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    with patch("app.integrations.lidarr.httpx.AsyncClient", opened):
+        assert await LidarrClient().get_queue() == []
+
+    opened.return_value.__aexit__.assert_awaited_once()
+
+def test_lidarr_dependency_uses_app_pool():
+    """Test the dependency hands out the lifespan's pool, or none before startup."""
+    from types import SimpleNamespace
+    from app.dependencies import get_lidarr_client
+
+    pool = object()
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(lidarr_http=pool)))
+    assert get_lidarr_client(request).http is pool
+
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+    assert get_lidarr_client(request).http is None
@@ -0,0 +1,117 @@
+"""Metadata editing tests."""
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.integrations.exiftool import ExifToolClient
+from app.models.album import Album
+from app.models.artist import Artist
+from app.models.track import Track
+
+
+class _FakeProcess:
+    """Stands in for an exiftool process, recording the argfile it is fed."""
+
+    def __init__(self, argfiles):
+        self.argfiles = argfiles
+
+    async def communicate(self, data=None):
+        await asyncio.sleep(0.01)
+        self.argfiles.append(data.decode().split("\n"))
+        return b"", b""
+
+
+@pytest.mark.asyncio
+async def test_write_metadata_many_batches_files_per_process():
+    """Test tags go to every file through a few batched exiftool processes."""
+    client = ExifToolClient()
+    client.WRITE_CONCURRENCY = 3
+    argfiles = []
+    paths = [Path(f"/t/{i}.flac") for i in range(10)]
+
+    with patch("app.integrations.exiftool.asyncio.create_subprocess_exec",
+               new=AsyncMock(return_value=_FakeProcess(argfiles))) as spawn:
+        await client.write_metadata_many(paths, album="New", year=1999)
+
+    assert spawn.await_count == 3
+    assert spawn.await_args.args == ("exiftool", "-overwrite_original", "-Album=New", "-Year=1999", "-@", "-")
+    assert sorted(line for argfile in argfiles for line in argfile) == sorted(str(p) for p in paths)
+
+
+@pytest.mark.asyncio
+async def test_write_metadata_many_finishes_before_raising():
+    """Test one failed batch does not abandon the others."""
+    client = ExifToolClient()
+    argfiles = []
+    spawn = AsyncMock(side_effect=[OSError("exiftool missing"), _FakeProcess(argfiles), _FakeProcess(argfiles)])
+
+    with patch("app.integrations.exiftool.asyncio.create_subprocess_exec", new=spawn):
+        with pytest.raises(OSError):
+            await client.write_metadata_many([Path(f"/t/{i}.flac") for i in range(3)], year=1999)
+
+    assert len(argfiles) == 2
+
+
+def test_update_album_metadata_writes_existing_tracks(client, db, auth_headers, tmp_path):
+    """Test an album edit tags every track file on disk in one batch."""
+    artist = Artist(name="Artist", normalized_name="artist")
+    db.add(artist)
+    db.flush()
+    album = Album(artist_id=artist.id, title="Old", normalized_title="old", year=1990)
+    db.add(album)
+    db.flush()
+    present = tmp_path / "01.flac"
+    present.touch()
+    for number, path in enumerate([present, tmp_path / "02.flac"], start=1):
+        db.add(Track(
+            album_id=album.id, title=f"T{number}", normalized_title=f"t{number}",
+            track_number=number, path=str(path),
+        ))
+    db.commit()
+
+    with patch.object(ExifToolClient, "write_metadata_many", new_callable=AsyncMock) as write:
+        response = client.put(f"/api/metadata/albums/{album.id}", json={"title": "New"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    write.assert_awaited_once_with([present], album="New", year=1990)
+
+
+def test_rename_artist_rewrites_paths_under_old_folder(client, db, auth_headers, tmp_path):
+    """Test a rename moves the folder and rewrites only that artist's paths."""
+    old_dir = tmp_path / "A_B"
+    (old_dir / "Album").mkdir(parents=True)
+    (old_dir / "Album" / "01.flac").touch()
+    rows = {}
+    # "AxB" would match an unescaped LIKE 'A_B/%'
+    for name in ("A_B", "AxB"):
+        artist = Artist(name=name, normalized_name=name.lower(), path=str(tmp_path / name))
+        db.add(artist)
+        db.flush()
+        album = Album(
+            artist_id=artist.id, title="Album", normalized_title="album",
+            path=str(tmp_path / name / "Album"),
+        )
+        db.add(album)
+        db.flush()
+        track = Track(
+            album_id=album.id, title="T", normalized_title="t", track_number=1,
+            path=str(tmp_path / name / "Album" / "01.flac"),
+        )
+        db.add(track)
+        rows[name] = (artist, album, track)
+    db.commit()
+    artist_id = rows["A_B"][0].id
+
+    with patch.object(ExifToolClient, "write_metadata_many", new_callable=AsyncMock) as write:
+        response = client.put(f"/api/metadata/artists/{artist_id}", json={"name": "New"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    new_track = tmp_path / "New" / "Album" / "01.flac"
+    write.assert_awaited_once_with([new_track], artist="New")
+    db.expire_all()
+    _, album, track = rows["A_B"]
+    assert (album.path, track.path) == (str(tmp_path / "New" / "Album"), str(new_track))
+    _, album, track = rows["AxB"]
+    assert track.path == str(tmp_path / "AxB" / "Album" / "01.flac")
@@ -0,0 +1,29 @@
+"""Plex client tests."""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.integrations.plex import PlexClient
+
+
+@pytest.fixture(autouse=True)
+def clear_plex_status():
+    """Start each test without shared connection results."""
+    PlexClient._status.clear()
+    yield
+    PlexClient._status.clear()
+
+
+@pytest.mark.asyncio
+async def test_connection_result_reused_per_server():
+    """Test a connection test is reused until the server or token changes."""
+    with patch.object(PlexClient, "_fetch_status", new=AsyncMock(return_value=False)) as upstream:
+        client = PlexClient()
+        client.base_url, client.token = "http://plex:32400", "token"
+        assert await client.test_connection() is False
+        assert await client.test_connection() is False
+        assert upstream.await_count == 1
+
+        client.token = "other"
+        await client.test_connection()
+        assert upstream.await_count == 2
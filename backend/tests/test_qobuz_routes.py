@@ -420,3 +420,51 @@ class TestCheckAlbumsInLibrary:
 
         # Should still match due to normalization
         assert result[0]["in_library"] is True
+
+    def test_checks_whole_list_in_one_query(self, db_session, test_artist, test_album, count_statements):
+        """A page of results is matched with a single query."""
+        albums = [
+            {"id": str(i), "title": title, "artist_name": test_artist.name}
+            for i, title in enumerate([test_album.title, "Other Album", test_album.title])
+        ]
+        with count_statements() as statements:
+            result = check_albums_in_library(db_session, albums)
+
+        assert len(statements) == 1
+        assert [a["local_album_id"] for a in result] == [test_album.id, None, test_album.id]
+        assert [a["in_library"] for a in result] == [True, False, True]
+
+
+@pytest.mark.parametrize("payload", [
+    {},
+    {
+        "id": 42,
+        "title": "Album",
+        "artist": {"id": 7, "name": "Artist"},
+        "release_date_original": "2020-01-31",
+        "tracks_count": 9,
+        "label": {"name": "Label"},
+        "genre": {"name": "Rock"},
+        "maximum_sampling_rate": 96,
+        "image": {"small": "s", "thumbnail": "t", "large": "l", "medium": "m"},
+        "biography": {"content": "Bio"},
+        "albums_count": 3,
+        "album": {"id": 42, "title": "Album", "image": {"thumbnail": "t"}},
+        "performer": {"name": "Artist"},
+        "previewable": True,
+    },
+])
+def test_parsed_results_match_response_models(payload):
+    """QobuzAPI output stays valid for the models the routes construct unvalidated."""
+    from app.api.qobuz import AlbumResult, ArtistResult, TrackResult
+    from app.integrations.qobuz_api import QobuzAPI
+
+    api = QobuzAPI()
+    for model, parse in [
+        (AlbumResult, api._parse_album),
+        (ArtistResult, api._parse_artist),
+        (TrackResult, api._parse_track),
+    ]:
+        item = parse(payload)
+        # JSON, not model_dump(): 96 == 96.0 and True == 1 would hide a type drift
+        assert model.model_construct(**item).model_dump_json() == model.model_validate(item).model_dump_json()
@@ -248,6 +248,31 @@ class TestReviewRejectionFlow:
         db_session.refresh(pending_review)
         assert pending_review.status == PendingReviewStatus.REJECTED
         assert pending_review.notes == "Not wanted"
+        assert pending_review.path == str(tmp_path / "import" / "rejected" / "reject-album")
+        assert (tmp_path / "import" / "rejected" / "reject-album" / "track.flac").exists()
+
+    def test_reject_renames_on_collision(
+        self, client, admin_auth_headers, db_session, pending_review, tmp_path
+    ):
+        """A folder already rejected under the same name gets a unique suffix."""
+        rejected_dir = tmp_path / "import" / "rejected"
+        (rejected_dir / "reject-album").mkdir(parents=True)
+
+        with patch("app.api.review.settings") as mock_settings:
+            mock_settings.music_import = str(tmp_path / "import")
+            response = client.post(
+                f"/api/import/review/{pending_review.id}/reject",
+                json={"delete_files": False},
+                headers=admin_auth_headers
+            )
+
+        assert response.status_code == 200
+        db_session.refresh(pending_review)
+        moved = Path(pending_review.path)
+        assert moved.parent == rejected_dir
+        assert moved.name.startswith("reject-album_")
+        assert (moved / "track.flac").exists()
+        assert not (rejected_dir / "reject-album" / "track.flac").exists()
 
     def test_reject_requires_admin(self, client, auth_headers, pending_review):
         """Non-admin cannot reject."""
@@ -102,10 +102,18 @@ class TestUnifiedSearch:
     def test_search_no_external_when_local_found(
         self, client, auth_headers, test_album
     ):
-        """External search NOT triggered when local results exist."""
+        """External search is dropped, not waited for, when local results exist."""
+        import asyncio
+        import time
+
+        async def slow_search(*args):
+            await asyncio.sleep(30)
+            return [{"id": "123"}]
+
         with patch(
-            "app.services.download.DownloadService.search_qobuz"
-        ) as mock_qobuz:
+            "app.services.download.DownloadService.search_qobuz", side_effect=slow_search
+        ):
+            started = time.monotonic()
             response = client.get(
                 f"/api/search/unified?q={test_album.title}&type=album&include_external=true",
                 headers=auth_headers
@@ -114,7 +122,7 @@ class TestUnifiedSearch:
             data = response.json()
             assert data["local"]["count"] >= 1
             assert data["external"] is None
-            mock_qobuz.assert_not_called()
+            assert time.monotonic() - started < 10
 
     def test_search_external_error_handled(self, client, auth_headers):
         """External search error should be handled gracefully."""
@@ -156,3 +164,18 @@ class TestUnifiedSearch:
             headers=auth_headers
         )
         assert response.status_code == 422
+
+    def test_search_artists_with_album_counts(self, client, db, auth_headers, test_artist, test_album, count_statements):
+        """Artist results carry their album count from the search query itself."""
+        artist_id, name = test_artist.id, test_artist.name
+        db.expire_all()
+        with count_statements() as statements:
+            response = client.get(
+                f"/api/search/unified?q={name}&type=artist",
+                headers=auth_headers
+            )
+
+        assert response.status_code == 200
+        artists = response.json()["local"]["artists"]
+        assert [(a["id"], a["album_count"]) for a in artists] == [(artist_id, 1)]
+        assert sum("FROM albums" in statement for statement in statements) == 1
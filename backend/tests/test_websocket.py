@@ -1,4 +1,6 @@
 """WebSocket tests."""
+import json
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from fastapi.testclient import TestClient
@@ -40,6 +42,19 @@ class TestConnectionManager:
         # Should not raise
         await mgr.broadcast_all({"test": "message"})
 
+    @pytest.mark.asyncio
+    async def test_broadcast_all_encodes_once(self):
+        """Test every connection gets the same pre-encoded JSON text frame."""
+        first, second = AsyncMock(), AsyncMock()
+        mgr = ConnectionManager()
+        mgr.active_connections = {1: {first}, 2: {second}}
+
+        await mgr.broadcast_all({"type": "activity", "album_id": 1})
+
+        frame = first.send_text.call_args[0][0]
+        assert second.send_text.call_args[0][0] is frame
+        assert json.loads(frame) == {"type": "activity", "album_id": 1}
+
 
 
 class TestWebSocketEndpoint:
@@ -104,6 +119,24 @@ class TestWebSocketEndpoint:
                 assert data["channel"] == "activity"
 
 
+    @pytest.mark.asyncio
+    async def test_websocket_cancelled_handler_unregisters(self, test_user):
+        """Test a cancelled handler still removes its connection from the manager."""
+        import asyncio
+        from app.api.websocket import websocket_endpoint
+
+        mgr = ConnectionManager()
+        websocket = AsyncMock()
+        websocket.receive_json.side_effect = asyncio.CancelledError
+
+        with patch("app.api.websocket.manager", mgr), \
+                patch("app.api.websocket.get_user_from_token", return_value=test_user):
+            with pytest.raises(asyncio.CancelledError):
+                await websocket_endpoint(websocket, token="token")
+
+        assert mgr.active_connections == {}
+        assert mgr._heartbeat_tasks == {}
+
 class TestBroadcastFunctions:
     """Test broadcast helper functions."""
 
@@ -130,8 +163,8 @@ class TestBroadcastFunctions:
             )
 
         # Verify message was sent
-        mock_ws.send_json.assert_called()
-        call_args = mock_ws.send_json.call_args[0][0]
+        mock_ws.send_text.assert_called()
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "download:progress"
         assert call_args["download_id"] == 123
         assert call_args["progress"] == 50
@@ -154,8 +187,8 @@ class TestBroadcastFunctions:
                 artist_name="Test Artist"
             )
 
-        mock_ws.send_json.assert_called()
-        call_args = mock_ws.send_json.call_args[0][0]
+        mock_ws.send_text.assert_called()
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "download:complete"
         assert call_args["album_id"] == 456
 
@@ -176,8 +209,8 @@ class TestBroadcastFunctions:
                 source="qobuz"
             )
 
-        mock_ws.send_json.assert_called()
-        call_args = mock_ws.send_json.call_args[0][0]
+        mock_ws.send_text.assert_called()
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "import:complete"
         assert call_args["source"] == "qobuz"
 
@@ -197,8 +230,8 @@ class TestBroadcastFunctions:
                 "album_id": 100
             })
 
-        mock_ws.send_json.assert_called()
-        call_args = mock_ws.send_json.call_args[0][0]
+        mock_ws.send_text.assert_called()
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "activity"
         assert call_args["action"] == "heart"
 
@@ -217,8 +250,8 @@ class TestBroadcastFunctions:
                 "message": "Hello!"
             })
 
-        mock_ws.send_json.assert_called()
-        call_args = mock_ws.send_json.call_args[0][0]
+        mock_ws.send_text.assert_called()
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "notification"
         assert call_args["title"] == "Test Notification"
 
@@ -238,8 +271,8 @@ class TestBroadcastFunctions:
                 action="added"
             )
 
-        mock_ws.send_json.assert_called()
-        call_args = mock_ws.send_json.call_args[0][0]
+        mock_ws.send_text.assert_called()
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "library:updated"
         assert call_args["action"] == "added"
 